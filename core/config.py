@@ -104,7 +104,21 @@ DEBUG = True
 USE_IR = True
 IR_DUMP_JSON = True  # Write IR JSON to disk when True.
 IR_DUMP_DIR = "debug/ir"
+ASSET_PREFETCH_STEPS = 6  # ir_step_index の何ステップ先まで立ち絵・背景を先読みするか
+DECODE_WORKERS = 2  # 先読みデコードのワーカースレッド数
+DECODE_FINALIZE_BUDGET_MS = 2.0  # デコード済み画像のサーフェス化に1フレームで使うメインスレッドの時間
 CHARA_TRANSITION_DEFAULT_MS = 150
+ZOOM_BUCKETS_PER_OCTAVE = 48  # ズームアニメーション中はズーム率を 2 倍ごとにこの段数へ丸める（約1.5%刻み）
+
+# 画像キャッシュ設定（ImageManager）: カテゴリごとのバイト予算（幅×高さ×バイト数の合計）
+_MIB = 1024 * 1024
+IMAGE_CACHE_BUDGETS = {
+    'bg': 128 * _MIB,         # 背景・CG
+    'torso': 512 * _MIB,      # 立ち絵の胴体
+    'face_part': 512 * _MIB,  # 目・口・眉・頬・エフェクト・装飾
+    'ui': 64 * _MIB,          # UI・アイコン
+    'other': 64 * _MIB,       # 上記以外（パス指定の読み込みなど）
+}
 
 # タイトル画面設定
 SHOW_TITLE_SCREEN = True            # タイトル画面を表示するかどうか（デバッグ時はFalseに）
@@ -144,6 +158,10 @@ TEXT_CHAR_DELAY = 110         # 文字表示間隔（ミリ秒）
 TEXT_PUNCTUATION_DELAY = 500  # 句読点での追加遅延時間（ミリ秒）
 TEXT_PARAGRAPH_TRANSITION_DELAY = 1000  # 段落切り替え遅延時間（ミリ秒）
 
+# バックログ設定
+BACKLOG_MEMORY_ENTRIES = 300               # 本文をメモリに持つ直近エントリ数（それより古いものはファイルから読み戻す）
+BACKLOG_STATE_FILENAME = "backlog.jsonl"   # data/current_state/ 以下の追記専用ファイル（セーブ対象）
+
 # フォントサイズ設定（仮想解像度1440x1080基準のピクセル値）
 FONT_NAME_SIZE = 40    # 名前フォントサイズ（ピクセル）
 FONT_TEXT_SIZE = 40    # テキストフォントサイズ（ピクセル）
@@ -153,6 +171,29 @@ FONT_DEFAULT_SIZE = 26  # デフォルトフォントサイズ（ピクセル）
 TEXT_LINE_HEIGHT_MULTIPLIER = 1.1   # 行間の倍率（1.0 = デフォルト）
 TEXT_CHAR_SPACING = 5               # 文字間隔の追加ピクセル数
 
+# 事前に焼いた縁取りグリフアトラスの置き場所（tools/bake_glyph_atlas.py で生成）
+GLYPH_ATLAS_DIR = "data/glyph_atlas"
+
+# デコード済み画像（変換・縮小・余白切り詰め後の 32bit ピクセル）のキャッシュ。
+# プロジェクトの data/ ではなくユーザーごとのキャッシュディレクトリ（get_user_cache_dir()）の下に置く
+DECODED_IMAGE_CACHE_DIR = "decoded_cache"
+# 上のキャッシュの合計サイズ上限（超えたら使われていない順に消す。立ち絵の胴体は生ピクセルで1枚 50MB 前後）
+DECODED_IMAGE_CACHE_BYTES = 1024 * _MIB
+
+# images/ の一覧（種別・キー・パス・寸法）。tools/build_asset_manifest.py で作り、ディレクトリが変われば自動で更新する
+ASSET_MANIFEST_PATH = "data/asset_manifest.json"
+
+# アセットパック（種別ごとに1ファイル）。tools/build_asset_packs.py で作る。無いファイルはばらのファイルを読む
+ASSET_PACK_DIR = "data/packs"
+# パック名 → 詰めるディレクトリ（プロジェクトルートからの相対パス。glob 可）
+ASSET_PACKS = {
+    "bg": ("images/BG",),
+    "characters": ("images/[0-9][0-9][A-Z][A-Z][A-Z]",),
+    "ui": ("images/UI", "images/ICON", "images/maps"),
+    "se": ("sounds/ses",),
+    "bgm": ("sounds/bgms",),
+}
+
 # テキストレンダリング詳細設定
 TEXT_RENDERER_CONFIG = {
     # グリッドシステム設定
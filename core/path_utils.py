@@ -58,6 +58,25 @@ def get_resource_path(resource_type, filename):
     return os.path.abspath(resource_path)
 
 
+def get_user_cache_dir():
+    """
+    ユーザーごとのキャッシュディレクトリを取得（作成はしない）
+
+    Windows: %LOCALAPPDATA%/mo-kiss、macOS: ~/Library/Caches/mo-kiss、
+    それ以外: $XDG_CACHE_HOME/mo-kiss（未設定なら ~/.cache/mo-kiss）
+
+    Returns:
+        str: キャッシュディレクトリの絶対パス
+    """
+    if sys.platform.startswith('win'):
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+    elif sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~'), 'Library', 'Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.abspath(os.path.join(base, 'mo-kiss'))
+
+
 def ensure_directory_exists(directory_path):
     """
     ディレクトリが存在しない場合は作成
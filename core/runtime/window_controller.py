@@ -7,6 +7,7 @@ from pathlib import Path
 import pygame
 
 from core import config
+from core.services.asset_pack import get_asset_packs
 
 
 class WindowController:
@@ -36,7 +37,7 @@ class WindowController:
     def _load_pointer_image(self):
         """Load the pointer at full size, trimming only transparent padding."""
         try:
-            source = pygame.image.load(str(self.POINTER_PATH))
+            source = get_asset_packs().load_image(str(self.POINTER_PATH))
             content_rect = source.get_bounding_rect(min_alpha=16)
             if content_rect.width <= 0 or content_rect.height <= 0:
                 raise ValueError("pointer image has no visible pixels")
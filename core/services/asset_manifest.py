@@ -0,0 +1,213 @@
+"""
+core/services/asset_manifest.py
+images/ 以下の全画像の一覧（種別・キー・パス・寸法・更新時刻）をまとめたマニフェスト
+
+- build_asset_manifest: images/ を走査してマニフェストを作る（tools/build_asset_manifest.py から）
+- load_asset_manifest: マニフェストを読み、更新時刻の変わったディレクトリだけ走査し直して返す
+- read_image_size: PNG / JPEG / WebP のヘッダだけを読んで (幅, 高さ) を返す（デコードしない）
+
+ディレクトリの更新時刻はファイルの追加・削除・リネームでしか変わらないので、
+同じ名前のまま上書きされた画像の寸法は tools/build_asset_manifest.py で作り直すまで古いまま。
+"""
+
+import json
+import os
+import re
+import struct
+
+MANIFEST_VERSION = 1
+IMAGE_EXTENSIONS = ('.PNG', '.JPG', '.JPEG', '.WEBP')
+
+# キャラクターディレクトリのパターン: 01MMK, 02SNK 等
+_CHAR_DIR_RE = re.compile(r'^\d{2}[A-Z]{3}$')
+
+
+def _classify_stem(stem: str):
+    """ファイル名ステムからカテゴリを返す。
+    ネーミング規則: [CHAR]_[TYPE][N]...
+    戻り値: カテゴリ文字列 or None
+    """
+    # CGF/CGE/CGA を _CG より先に判定
+    if '_CGF' in stem:
+        if '_BRO' in stem: return 'cg_brow'
+        if '_EYE' in stem: return 'cg_eye'
+        if '_MOU' in stem: return 'cg_mouth'
+        if '_CHE' in stem: return 'cg_cheek'
+        return 'cg_brow'
+    if '_CGE' in stem: return 'cg_effect'
+    if '_CGA' in stem: return 'cg_accessory'
+    if '_CG'  in stem: return 'cg'
+    if '_T'   in stem: return 'torso'
+    if '_F'   in stem:
+        if '_BRO' in stem: return 'brow'
+        if '_EYE' in stem: return 'eye'
+        if '_MOU' in stem: return 'mouth'
+        if '_CHE' in stem: return 'cheek'
+    # _E数字 (エフェクト): _EYEと区別するため数字必須
+    if re.search(r'_E\d', stem): return 'effect'
+    # _A数字 (装飾): _ARMと区別
+    if re.search(r'_A\d', stem): return 'accessory'
+    return None
+
+
+def classify_asset(dir_name, stem):
+    """(ディレクトリ名, ステム) から image_paths の (種別, キー) を返す。対象外なら None"""
+    if dir_name == 'BG':
+        return 'bg', stem
+    if _CHAR_DIR_RE.match(dir_name):
+        category = _classify_stem(stem)
+        return (category, stem) if category else None
+    if dir_name == 'UI':
+        # ui.text-box.png → stem = 'ui.text-box' → key = 'text-box'
+        # title.png       → stem = 'title'        → key = 'title'
+        parts = stem.split('.')
+        return 'ui', parts[1] if len(parts) >= 2 else parts[0]
+    if dir_name == 'ICON':
+        return 'icon', stem
+    return None
+
+
+def _png_size(head):
+    if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+        return struct.unpack('>II', head[16:24])
+    return None
+
+
+def _webp_size(head):
+    if head[:4] != b'RIFF' or head[8:12] != b'WEBP':
+        return None
+    chunk = head[12:16]
+    if chunk == b'VP8 ':
+        width, height = struct.unpack('<HH', head[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b'VP8L':
+        bits = struct.unpack('<I', head[21:25])[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b'VP8X':
+        return (int.from_bytes(head[24:27], 'little') + 1, int.from_bytes(head[27:30], 'little') + 1)
+    return None
+
+
+def _jpeg_size(handle):
+    handle.seek(2)
+    while True:
+        marker = handle.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        if code == 0xFF:
+            handle.seek(-1, os.SEEK_CUR)  # 埋め草
+            continue
+        if code in (0x01, 0xD8) or 0xD0 <= code <= 0xD7:
+            continue  # 長さのないマーカー
+        length = struct.unpack('>H', handle.read(2))[0]
+        # SOF0～SOF15（DHT / JPG / DAC を除く）に寸法が入っている
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack('>xHH', handle.read(5))
+            return width, height
+        handle.seek(length - 2, os.SEEK_CUR)
+
+
+def read_image_size(path):
+    """ヘッダだけを読んで (幅, 高さ) を返す。読めない形式なら None"""
+    try:
+        with open(path, 'rb') as handle:
+            head = handle.read(32)
+            if head[:2] == b'\xff\xd8':
+                return _jpeg_size(handle)
+            return _png_size(head) or _webp_size(head)
+    except (OSError, struct.error):
+        return None
+
+
+def _scan_dir(images_dir, rel_dir, previous):
+    """1ディレクトリの画像エントリ。更新時刻が同じファイルは previous の寸法を使い回す"""
+    entries = []
+    dir_name = os.path.basename(os.path.join(images_dir, rel_dir))
+    with os.scandir(os.path.join(images_dir, rel_dir)) as it:
+        for item in it:
+            if not item.name.upper().endswith(IMAGE_EXTENSIONS) or not item.is_file():
+                continue
+            classified = classify_asset(dir_name, os.path.splitext(item.name)[0])
+            if not classified:
+                continue
+            rel_path = f"{rel_dir}/{item.name}" if rel_dir else item.name
+            mtime_ns = item.stat().st_mtime_ns
+            old = previous.get(rel_path)
+            if old and old[5] == mtime_ns:
+                width, height = old[3], old[4]
+            else:
+                width, height = read_image_size(item.path) or (0, 0)
+            entries.append([classified[0], classified[1], rel_path, width, height, mtime_ns])
+    return entries
+
+
+def _walk_dirs(images_dir):
+    """os.walk と同じ順の相対ディレクトリ（ルートは ''、区切りは OS によらず '/'）"""
+    return [
+        os.path.relpath(root, images_dir).replace(os.sep, '/') if root != images_dir else ''
+        for root, _, _ in os.walk(images_dir)
+    ]
+
+
+def build_asset_manifest(images_dir, previous=None):
+    """images_dir を走査してマニフェストを作る。previous があれば変わっていないディレクトリは再利用する"""
+    previous = previous or {}
+    old_dirs = previous.get('dirs', {})
+    old_assets = {}
+    for entry in previous.get('assets', []):
+        old_assets.setdefault(os.path.dirname(entry[2]), []).append(entry)
+
+    dirs = {}
+    assets = []
+    for rel_dir in _walk_dirs(images_dir):
+        mtime_ns = os.stat(os.path.join(images_dir, rel_dir)).st_mtime_ns
+        dirs[rel_dir] = mtime_ns
+        if rel_dir in old_dirs and old_dirs[rel_dir] == mtime_ns:
+            assets.extend(old_assets.get(rel_dir, []))
+        else:
+            known = {entry[2]: entry for entry in old_assets.get(rel_dir, [])}
+            assets.extend(_scan_dir(images_dir, rel_dir, known))
+    return {'version': MANIFEST_VERSION, 'dirs': dirs, 'assets': assets}
+
+
+def _manifest_is_current(manifest, images_dir):
+    for rel_dir, mtime_ns in manifest.get('dirs', {}).items():
+        try:
+            if os.stat(os.path.join(images_dir, rel_dir)).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def save_asset_manifest(manifest, manifest_path):
+    os.makedirs(os.path.dirname(manifest_path) or '.', exist_ok=True)
+    temp_path = f"{manifest_path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(temp_path, manifest_path)
+
+
+def load_asset_manifest(images_dir, manifest_path):
+    """マニフェストを返す。無い・古い場合は変わったディレクトリだけ走査し直して保存する
+
+    ディレクトリが増えればその親の更新時刻が変わるので、記録済みディレクトリの stat だけで判定できる。
+    """
+    manifest = None
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = None
+    if manifest and manifest.get('version') != MANIFEST_VERSION:
+        manifest = None
+    if manifest and _manifest_is_current(manifest, images_dir):
+        return manifest
+
+    manifest = build_asset_manifest(images_dir, manifest)
+    try:
+        save_asset_manifest(manifest, manifest_path)
+    except OSError:
+        pass  # 書き込めない場所でも、今回の一覧はそのまま使う
+    return manifest
@@ -0,0 +1,297 @@
+"""
+core/services/asset_pack.py
+画像・音声を種別ごとに1ファイルへまとめたアセットパック（data/packs/*.mkpak）
+
+- 形式: ヘッダ（マジック・版・索引の長さ・データの開始位置）＋ 索引 JSON ＋ 各ファイルの中身（16バイト境界）
+  索引はプロジェクトルートからの相対パス → [オフセット, 長さ, 形式, 幅, 高さ, 更新時刻]
+- build_asset_pack: ディレクトリ群から1つのパックを書く（tools/build_asset_packs.py から）
+- AssetPack: パックを mmap し、中身をコピーせずに memoryview のスライスで返す
+- PackReader: スライスを pygame に渡すファイルオブジェクト（要求された分だけをその都度取り出す）
+- AssetPacks: data/packs の全パックをまとめて引く。パックに無いファイルはばらのファイルを読む
+  画像・音声の読み込みはすべて AssetPacks.source / load_image（get_asset_packs()）を通す
+
+元ディレクトリの更新時刻がパックを作った時から変わっていれば（ファイルの追加・削除・リネーム）、
+そのパックは使わずにばらのファイルを読む。元ディレクトリが無い（配布版）ならパックだけを使う。
+同じ名前のまま上書きした画像・音声はパックを作り直すまで反映されない（マニフェストと同じ）。
+"""
+
+import glob
+import io
+import json
+import mmap
+import os
+import struct
+import threading
+
+import pygame
+
+from core.config import ASSET_PACK_DIR
+from core.path_utils import get_project_root
+from core.services.asset_manifest import IMAGE_EXTENSIONS, read_image_size
+
+PACK_EXTENSION = ".mkpak"
+PACK_VERSION = 1
+SOUND_EXTENSIONS = ('.MP3', '.WAV', '.OGG', '.M4A')
+
+_PACK_MAGIC = b"MKPK"
+_PACK_HEADER = struct.Struct("<4sHHQQ")  # マジック・版・予備・索引の長さ・データの開始位置
+_PACK_ALIGN = 16
+
+
+def _align(value):
+    return (value + _PACK_ALIGN - 1) // _PACK_ALIGN * _PACK_ALIGN
+
+
+def _collect_files(project_root, source_dirs):
+    """source_dirs（glob 可）以下の画像・音声。(相対パス一覧, 相対ディレクトリ → 更新時刻)"""
+    names = []
+    sources = {}
+    for pattern in source_dirs:
+        for top in sorted(glob.glob(os.path.join(project_root, pattern))):
+            if not os.path.isdir(top):
+                continue
+            for root, dirs, files in os.walk(top):
+                dirs.sort()
+                rel_dir = os.path.relpath(root, project_root).replace(os.sep, '/')
+                sources[rel_dir] = os.stat(root).st_mtime_ns
+                for name in sorted(files):
+                    if name.upper().endswith(IMAGE_EXTENSIONS + SOUND_EXTENSIONS):
+                        names.append(f"{rel_dir}/{name}")
+    return names, sources
+
+
+def build_asset_pack(pack_path, project_root, source_dirs):
+    """source_dirs 以下の画像・音声を pack_path に詰める。詰めたファイル数を返す"""
+    names, sources = _collect_files(project_root, source_dirs)
+    entries = {}
+    offset = 0
+    for name in names:
+        path = os.path.join(project_root, name)
+        stat = os.stat(path)
+        extension = os.path.splitext(name)[1].upper()
+        width, height = (read_image_size(path) or (0, 0)) if extension in IMAGE_EXTENSIONS else (0, 0)
+        entries[name] = [offset, stat.st_size, extension[1:].lower(), width, height, stat.st_mtime_ns]
+        offset = _align(offset + stat.st_size)
+
+    index = json.dumps(
+        {'version': PACK_VERSION, 'sources': sources, 'entries': entries},
+        ensure_ascii=False, separators=(',', ':'),
+    ).encode('utf-8')
+    data_offset = _align(_PACK_HEADER.size + len(index))
+
+    os.makedirs(os.path.dirname(pack_path) or '.', exist_ok=True)
+    temp_path = f"{pack_path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(_PACK_HEADER.pack(_PACK_MAGIC, PACK_VERSION, 0, len(index), data_offset))
+        f.write(index)
+        for name in names:
+            f.seek(data_offset + entries[name][0])
+            with open(os.path.join(project_root, name), 'rb') as source:
+                f.write(source.read())
+        f.truncate(data_offset + offset)
+    os.replace(temp_path, pack_path)
+    return len(names)
+
+
+class AssetPack:
+    """1つのパックファイル。read はパックの mmap のスライスを返す（コピーしない）"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _PACK_HEADER.size:
+            raise ValueError(f"アセットパックが短すぎます: {path}")
+        magic, version, _, index_length, data_offset = _PACK_HEADER.unpack_from(self._map)
+        if magic != _PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"アセットパックの形式が違います: {path}")
+        index = json.loads(self._map[_PACK_HEADER.size:_PACK_HEADER.size + index_length].decode('utf-8'))
+        self.sources = index['sources']
+        self.entries = {name: tuple(entry) for name, entry in index['entries'].items()}
+        self._data = memoryview(self._map)[data_offset:]
+
+    def is_stale(self, project_root):
+        """元ディレクトリのどれかがパックを作った後に変わっていれば True（無いディレクトリは変わっていない扱い）"""
+        for rel_dir, mtime_ns in self.sources.items():
+            try:
+                if os.stat(os.path.join(project_root, rel_dir)).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                continue
+        return False
+
+    def read(self, name):
+        offset, length = self.entries[name][:2]
+        return self._data[offset:offset + length]
+
+    def close(self):
+        try:
+            self._data.release()
+            self._map.close()
+        except BufferError:
+            pass  # read で返したスライスがまだ使われている。解放されれば閉じる
+
+
+class PackReader(io.RawIOBase):
+    """パック内のファイル1つを読むファイルオブジェクト。
+
+    io.BytesIO と違ってファイル全体を複製せず、pygame（SDL）が読む数 KB ずつをスライスから取り出す。
+    """
+
+    def __init__(self, data):
+        super().__init__()
+        self._data = data
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: len(self._data)}[whence]
+        self._position = max(0, base + offset)
+        return self._position
+
+    def read(self, size=-1):
+        start = min(self._position, len(self._data))
+        end = len(self._data) if size is None or size < 0 else min(start + size, len(self._data))
+        self._position = end
+        return bytes(self._data[start:end])
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class AssetPacks:
+    """pack_dir の全パックをまとめて引く。パックに無い・古いパックのファイルはばらのファイルを使う
+
+    パスは絶対パスでもカレントディレクトリからの相対パスでもよく、プロジェクトルートからの相対パスに直して引く。
+    """
+
+    def __init__(self, pack_dir, project_root=None, debug=False):
+        self.pack_dir = pack_dir
+        self.project_root = os.path.abspath(project_root or get_project_root())
+        self.debug = debug
+        self.packs = []
+        self._entries = {}  # 相対パス → AssetPack
+        self._dirs = {}     # 相対ディレクトリ → その直下のファイル名
+        if pack_dir and os.path.isdir(pack_dir):
+            for name in sorted(os.listdir(pack_dir)):
+                if name.endswith(PACK_EXTENSION):
+                    self._mount(os.path.join(pack_dir, name))
+
+    def _mount(self, path):
+        try:
+            pack = AssetPack(path)
+        except (OSError, ValueError, KeyError) as e:
+            if self.debug:
+                print(f"アセットパックを読めません: {path}: {e}")
+            return
+        if pack.is_stale(self.project_root):
+            if self.debug:
+                print(f"アセットパックが元のディレクトリより古いので使いません: {path}")
+            pack.close()
+            return
+        self.packs.append(pack)
+        for name in pack.entries:
+            self._entries[name] = pack
+            rel_dir, file_name = name.rsplit('/', 1)
+            self._dirs.setdefault(rel_dir, set()).add(file_name)
+            while '/' in rel_dir:
+                rel_dir, child = rel_dir.rsplit('/', 1)
+                self._dirs.setdefault(rel_dir, set()).add(child)
+        if self.debug:
+            print(f"アセットパック: {path} ({len(pack.entries)}ファイル)")
+
+    def _relative(self, path):
+        try:
+            relative = os.path.relpath(os.path.abspath(path), self.project_root)
+        except ValueError:
+            return None  # Windows で別ドライブ
+        if relative.startswith('..') or os.path.isabs(relative):
+            return None
+        return relative.replace(os.sep, '/')
+
+    def find(self, path):
+        """path を収めたパックと相対パス。パックに無ければ None"""
+        if not self._entries:
+            return None
+        name = self._relative(path)
+        pack = self._entries.get(name)
+        return (pack, name) if pack else None
+
+    def exists(self, path):
+        """パックにあるか、ばらのファイル・ディレクトリがあれば True"""
+        if self.find(path) or os.path.exists(path):
+            return True
+        return bool(self._dirs) and self._relative(path) in self._dirs
+
+    def read(self, path):
+        """パックにあれば中身のスライス（memoryview）、無ければ None"""
+        found = self.find(path)
+        return found[0].read(found[1]) if found else None
+
+    def source(self, path):
+        """pygame.image.load / mixer.Sound / mixer.music.load に渡すもの。パックにあれば PackReader、無ければ path"""
+        data = self.read(path)
+        return PackReader(data) if data is not None else path
+
+    def load_image(self, path):
+        """パックかばらのファイルから pygame.image.load する（拡張子は path から判断させる）"""
+        return pygame.image.load(self.source(path), os.path.basename(path))
+
+    def stat(self, path):
+        """(更新時刻, バイト数)。パックにあればパックを作った時点の値。どちらにも無ければ None"""
+        found = self.find(path)
+        if found:
+            entry = found[0].entries[found[1]]
+            return entry[5], entry[1]
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def listdir(self, directory):
+        """パックとばらのファイルを合わせたディレクトリ直下の名前"""
+        names = set(self._dirs.get(self._relative(directory), ())) if self._dirs else set()
+        try:
+            names.update(os.listdir(directory))
+        except OSError:
+            pass
+        return sorted(names)
+
+    def entries_under(self, rel_dir):
+        """rel_dir 以下のパック内ファイル (相対パス, 幅, 高さ)"""
+        prefix = rel_dir.rstrip('/') + '/'
+        for name, pack in self._entries.items():
+            if name.startswith(prefix):
+                entry = pack.entries[name]
+                yield name, entry[3], entry[4]
+
+    def close(self):
+        for pack in self.packs:
+            pack.close()
+        self.packs = []
+        self._entries = {}
+        self._dirs = {}
+
+
+_asset_packs = None
+_asset_packs_lock = threading.Lock()
+
+
+def get_asset_packs():
+    """プロセスで共有する AssetPacks（最初の呼び出しで ASSET_PACK_DIR を読む）"""
+    global _asset_packs
+    with _asset_packs_lock:
+        if _asset_packs is None:
+            _asset_packs = AssetPacks(os.path.join(get_project_root(), ASSET_PACK_DIR))
+        return _asset_packs
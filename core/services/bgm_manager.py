@@ -5,12 +5,15 @@ import time
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
+from core.services.asset_pack import get_asset_packs
 from core.services.settings_manager import get_settings_manager
 
 class BGMManager:
-    def __init__(self, debug=False):
+    def __init__(self, debug=False, asset_packs=None):
         self.debug = debug
         self.BGM_PATH = os.path.join("sounds", "bgms")
+        # BGMはアセットパックにあればそこから、無ければばらのファイルから読む
+        self.asset_packs = asset_packs if asset_packs is not None else get_asset_packs()
         self.current_bgm = None
         self.current_loop = True
         self.current_volume = 0.5
@@ -92,7 +95,7 @@ class BGMManager:
             bgm_path = os.path.join(self.BGM_PATH, filename)
             
             # ファイルの存在チェック
-            if not os.path.exists(bgm_path):
+            if not self.asset_packs.exists(bgm_path):
                 actual_filename = self.get_bgm_for_scene(filename)
                 if actual_filename:
                     filename = actual_filename
@@ -101,7 +104,8 @@ class BGMManager:
                     print(f"[BGM_DEBUG] BGMファイルが存在しません: '{bgm_path}'")
                     return False
             
-            pygame.mixer.music.load(bgm_path)
+            # パックの BGM はファイルオブジェクトから流す（mixer.music が参照を持つ）
+            pygame.mixer.music.load(self.asset_packs.source(bgm_path), os.path.basename(bgm_path))
             start_volume = 0.0 if fade_time > 0 else volume
             get_settings_manager().apply_bgm_volume(start_volume)
             # ループ設定に応じて再生
@@ -355,7 +359,7 @@ class BGMManager:
             return None
 
         bgm_dir = self.BGM_PATH
-        if not os.path.exists(bgm_dir):
+        if not self.asset_packs.exists(bgm_dir):
             return None
 
         # シナリオ論理名 -> 実ディスクファイル名のマッピングテーブル
@@ -373,22 +377,22 @@ class BGMManager:
 
         if scene_name in BGM_ALIAS_MAP:
             alias_file = BGM_ALIAS_MAP[scene_name]
-            if os.path.exists(os.path.join(bgm_dir, alias_file)):
+            if self.asset_packs.exists(os.path.join(bgm_dir, alias_file)):
                 return alias_file
 
         # 1. 直接存在するファイルの場合
-        if os.path.exists(os.path.join(bgm_dir, scene_name)):
+        if self.asset_packs.exists(os.path.join(bgm_dir, scene_name)):
             return scene_name
 
         # 2. 拡張子がない場合、主要拡張子（.mp3, .ogg, .wav, .m4a）で実在チェック
         for ext in ['.mp3', '.ogg', '.wav', '.m4a']:
             candidate = f"{scene_name}{ext}"
-            if os.path.exists(os.path.join(bgm_dir, candidate)):
+            if self.asset_packs.exists(os.path.join(bgm_dir, candidate)):
                 return candidate
 
         # 3. ディレクトリ内の全ファイルから大文字小文字無視・部分一致で探索
         try:
-            all_files = os.listdir(bgm_dir)
+            all_files = self.asset_packs.listdir(bgm_dir)
             scene_lower = scene_name.lower()
 
             for f in all_files:
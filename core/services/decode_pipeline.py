@@ -0,0 +1,169 @@
+"""
+core/services/decode_pipeline.py
+優先度付きの画像デコードキュー
+
+- ワーカースレッドはファイルを読んで表示形式の生ピクセル（bytearray）にするところまで
+- サーフェス化とキャッシュ登録はメインスレッドの finalize で、1フレームあたりの予算（ミリ秒）内だけ行う
+- 優先度は 次のステップ > 先読み。キューに残っている要求は高い方へ引き上げられる
+- 今すぐ必要になった要求は優先度を付けずに take で受け取る。まだキューにあれば取り下げ、要求側がその場でデコードする（後ろに並んで待たない）
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+# 小さいほど先に処理する
+PRIORITY_NEXT_STEP = 0  # 次のステップで表示する
+PRIORITY_PREFETCH = 1   # 数ステップ先の先読み
+
+
+class DecodePipeline:
+    """decode(job) をワーカーで実行し、結果を finalize でメインスレッドに渡す"""
+
+    def __init__(self, decode, workers=2):
+        self._decode = decode
+        self._workers = max(1, int(workers))
+        self._threads = []
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._queue = []     # (優先度, 順番, キー)。引き上げ前の古い項目は取り出し時に読み飛ばす
+        self._queued = {}    # キー → [優先度, job]
+        self._running = {}   # キー → 優先度
+        self._ready = []     # (優先度, 順番, キー)
+        self._results = {}   # キー → decode の戻り値
+        self._closed = False
+
+    def _start_workers(self):
+        while len(self._threads) < self._workers:
+            thread = threading.Thread(target=self._work, name=f"decode-{len(self._threads)}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def submit(self, key, job, priority=PRIORITY_PREFETCH):
+        """job を投入する。新しく投入したら True。処理待ち・処理中・受け取り待ちなら優先度だけ引き上げて False"""
+        with self._cond:
+            if self._closed:
+                return False
+            if key in self._queued or key in self._running or key in self._results:
+                self._promote(key, priority)
+                return False
+            self._queued[key] = [priority, job]
+            heapq.heappush(self._queue, (priority, next(self._seq), key))
+            self._start_workers()
+            self._cond.notify()
+            return True
+
+    def _promote(self, key, priority):
+        """（_cond を持った状態で）キューの項目の優先度を引き上げる"""
+        queued = self._queued.get(key)
+        if queued is not None and priority < queued[0]:
+            queued[0] = priority
+            heapq.heappush(self._queue, (priority, next(self._seq), key))
+        elif key in self._running:
+            self._running[key] = min(self._running[key], priority)
+
+    def is_pending(self, key):
+        with self._cond:
+            return key in self._queued or key in self._running or key in self._results
+
+    def is_ready(self, key):
+        """デコードが終わって finalize（か take）を待っているだけなら True"""
+        with self._cond:
+            return key in self._results
+
+    def pending_count(self):
+        with self._cond:
+            return len(self._queued) + len(self._running) + len(self._results)
+
+    def take(self, key, timeout=None):
+        """今すぐ必要な key の結果を返す。(見つかったか, 結果)
+
+        処理中なら終わるまで待つ。キューに並んでいるだけなら取り下げて (False, None) を返すので、
+        要求側がその場でデコードする。
+        """
+        with self._cond:
+            if self._queued.pop(key, None) is not None:
+                return False, None
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while key in self._running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False, None
+                self._cond.wait(remaining)
+            if key in self._results:
+                return True, self._results.pop(key)
+            return False, None
+
+    def finalize(self, finish, budget_ms=2.0):
+        """デコード済みの結果を優先度順に finish(key, result) へ渡す。budget_ms を使い切ったら次のフレームへ回す
+
+        予算に関わらず最低1件は処理する。処理した件数を返す。
+        """
+        started = time.perf_counter()
+        finished = 0
+        while True:
+            with self._cond:
+                key = None
+                while self._ready:
+                    _, _, candidate = heapq.heappop(self._ready)
+                    if candidate in self._results:
+                        key = candidate
+                        break
+                if key is None:
+                    return finished
+                result = self._results.pop(key)
+            finish(key, result)
+            finished += 1
+            if (time.perf_counter() - started) * 1000.0 >= budget_ms:
+                return finished
+
+    def wait_idle(self, timeout=None):
+        """キューと処理中が空になるまで待つ（テスト・ベンチマーク用）。空になれば True"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queued or self._running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def shutdown(self):
+        """キューを捨ててワーカーを止める（処理中の1件は終わってから止まる）"""
+        with self._cond:
+            self._closed = True
+            self._queued.clear()
+            self._queue.clear()
+            self._cond.notify_all()
+
+    def _next_job(self):
+        """（_cond を持った状態で）一番優先度の高い job を取り出す。閉じていれば None"""
+        while not self._closed:
+            while self._queue:
+                priority, _, key = heapq.heappop(self._queue)
+                queued = self._queued.get(key)
+                if queued is None or queued[0] != priority:
+                    continue  # 取り下げ・引き上げ済み
+                del self._queued[key]
+                self._running[key] = priority
+                return key, queued[1]
+            self._cond.wait()
+        return None
+
+    def _work(self):
+        while True:
+            with self._cond:
+                item = self._next_job()
+            if item is None:
+                return
+            key, job = item
+            try:
+                result = self._decode(job)
+            except Exception:
+                result = None
+            with self._cond:
+                priority = self._running.pop(key)
+                self._results[key] = result
+                heapq.heappush(self._ready, (priority, next(self._seq), key))
+                self._cond.notify_all()
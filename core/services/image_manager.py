@@ -1,52 +1,177 @@
 import pygame
+import hashlib
 import os
 import re
+import struct
 import warnings
+import weakref
 import asyncio
 import threading
+import time
 from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
-from core.config import get_textbox_position, get_ui_button_positions
+from core.config import (
+    ASSET_MANIFEST_PATH,
+    DECODED_IMAGE_CACHE_BYTES,
+    DECODE_FINALIZE_BUDGET_MS,
+    DECODE_WORKERS,
+    IMAGE_CACHE_BUDGETS,
+    VIRTUAL_HEIGHT,
+    VIRTUAL_WIDTH,
+    get_textbox_position,
+    get_ui_button_positions,
+    scale_size,
+)
 from core.path_utils import get_project_root
+from core.services.asset_manifest import classify_asset, load_asset_manifest
+from core.services.asset_pack import get_asset_packs
+from core.services.decode_pipeline import PRIORITY_PREFETCH, DecodePipeline
 
-# キャラクターディレクトリのパターン: 01MMK, 02SNK 等
-_CHAR_DIR_RE = re.compile(r'^\d{2}[A-Z]{3}$')
+# image_paths の種別 → キャッシュ予算のカテゴリ
+_CACHE_CATEGORIES = {
+    'bg': 'bg', 'cg': 'bg',
+    'torso': 'torso',
+    'brow': 'face_part', 'eye': 'face_part', 'mouth': 'face_part', 'cheek': 'face_part',
+    'effect': 'face_part', 'accessory': 'face_part',
+    'cg_brow': 'face_part', 'cg_eye': 'face_part', 'cg_mouth': 'face_part', 'cg_cheek': 'face_part',
+    'cg_effect': 'face_part', 'cg_accessory': 'face_part',
+    'ui': 'ui', 'icon': 'ui',
+}
 
 
-def _classify_stem(stem: str):
-    """ファイル名ステムからカテゴリを返す。
-    ネーミング規則: [CHAR]_[TYPE][N]...
-    戻り値: カテゴリ文字列 or None
+def _cache_category(filepath):
+    """画像ファイルのパスからキャッシュ予算のカテゴリを返す（scan_image_paths と同じ分類）"""
+    dir_name = os.path.basename(os.path.dirname(filepath))
+    stem = os.path.splitext(os.path.basename(filepath))[0]
+    classified = classify_asset(dir_name, stem)
+    return _CACHE_CATEGORIES.get(classified[0], 'other') if classified else 'other'
+
+
+def _trim_transparent_margins(image):
+    """透明な余白を切り落とした画像と、元キャンバス上の配置 ((x, y), (幅, 高さ)) を返す。
+
+    顔パーツは胴体と同じ大きさのキャンバスに描かれているので、不透明部分だけを持てば足りる。
+    切り詰める余白が無い・全面透明なら (image, None)。
+    """
+    bounds = image.get_bounding_rect(min_alpha=1)
+    if bounds.width <= 0 or bounds.height <= 0 or bounds.size == image.get_size():
+        return image, None
+    return image.subsurface(bounds).copy(), (bounds.topleft, image.get_size())
+
+
+# デコード済みキャッシュファイル: ヘッダ（形式・サイズ・顔パーツの配置）＋ 32bit ピクセル
+_DECODED_MAGIC = b"MKIC"
+_DECODED_VERSION = 1
+_DECODED_HEADER = struct.Struct("<4sHHIIiiII")
+# convert_alpha 後のマスク → tobytes / frombuffer の形式名
+_PIXEL_FORMATS = {
+    (0xff0000, 0xff00, 0xff, 0xff000000): "BGRA",
+    (0xff, 0xff00, 0xff0000, 0xff000000): "RGBA",
+}
+_PIXEL_MASKS = {name: masks for masks, name in _PIXEL_FORMATS.items()}
+_PIXEL_FORMAT_CODES = {"BGRA": 0, "RGBA": 1}
+
+
+def _write_decoded_file(path, pixels, size, pixel_format, layout):
+    """表示形式の生ピクセルをそのまま書き出す。書けない形式なら False"""
+    width, height = size
+    if pixel_format not in _PIXEL_FORMAT_CODES or not width or not height:
+        return False
+    (offset_x, offset_y), (canvas_w, canvas_h) = layout or ((0, 0), (0, 0))
+    header = _DECODED_HEADER.pack(
+        _DECODED_MAGIC, _DECODED_VERSION, _PIXEL_FORMAT_CODES[pixel_format],
+        width, height, offset_x, offset_y, canvas_w, canvas_h,
+    )
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(header)
+        f.write(pixels)
+    os.replace(temp_path, path)
+    return True
+
+
+def _trim_decoded_dir(directory, budget, keep):
+    """directory の合計が budget を超えたら、更新時刻（最後に使った時刻）の古いファイルから消す"""
+    entries = []
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= budget:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue  # 別プロセスが使用中など
+        total -= size
+
+
+def _read_decoded_pixels(path):
+    """キャッシュファイルをデコードなしで bytearray に読み込む。(pixels, size, 形式, layout)、使えなければ None
+
+    mmap はサーフェスが生きている間ファイル記述子を握り続けるので、読み込んだらすぐ閉じる。
     """
-    # CGF/CGE/CGA を _CG より先に判定
-    if '_CGF' in stem:
-        if '_BRO' in stem: return 'cg_brow'
-        if '_EYE' in stem: return 'cg_eye'
-        if '_MOU' in stem: return 'cg_mouth'
-        if '_CHE' in stem: return 'cg_cheek'
-        return 'cg_brow'
-    if '_CGE' in stem: return 'cg_effect'
-    if '_CGA' in stem: return 'cg_accessory'
-    if '_CG'  in stem: return 'cg'
-    if '_T'   in stem: return 'torso'
-    if '_F'   in stem:
-        if '_BRO' in stem: return 'brow'
-        if '_EYE' in stem: return 'eye'
-        if '_MOU' in stem: return 'mouth'
-        if '_CHE' in stem: return 'cheek'
-    # _E数字 (エフェクト): _EYEと区別するため数字必須
-    if re.search(r'_E\d', stem): return 'effect'
-    # _A数字 (装飾): _ARMと区別
-    if re.search(r'_A\d', stem): return 'accessory'
-    return None
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_DECODED_HEADER.size)
+            if len(header) < _DECODED_HEADER.size:
+                return None
+            magic, version, code, width, height, offset_x, offset_y, canvas_w, canvas_h = _DECODED_HEADER.unpack(header)
+            formats = {value: name for name, value in _PIXEL_FORMAT_CODES.items()}
+            if magic != _DECODED_MAGIC or version != _DECODED_VERSION or code not in formats:
+                return None
+            pixels = bytearray(width * height * 4)
+            if f.readinto(pixels) != len(pixels) or f.read(1):
+                return None
+    except (OSError, ValueError, MemoryError):
+        return None
+    layout = ((offset_x, offset_y), (canvas_w, canvas_h)) if canvas_w else None
+    return pixels, (width, height), formats[code], layout
+
+
+def _image_bytes(image):
+    """キャッシュ予算で数える画像のバイト数（幅×高さ×バイト数）"""
+    try:
+        return image.get_width() * image.get_height() * image.get_bytesize()
+    except AttributeError:
+        return 0
+
 
 class ImageManager:
-    def __init__(self, debug=False, cache_size=50):
+    def __init__(self, debug=False, cache_budgets=None, decode_cache_dir=None,
+                 decode_cache_bytes=DECODED_IMAGE_CACHE_BYTES, asset_packs=None):
         self.debug = debug
+        # 画像はアセットパックにあればそこから、無ければばらのファイルから読む
+        self.asset_packs = asset_packs if asset_packs is not None else get_asset_packs()
         self.images = {}
-        self.image_cache = OrderedDict()  # LRUキャッシュ
-        self.cache_size = cache_size
+        self.image_cache = OrderedDict()  # LRUキャッシュ（予算はカテゴリごとのバイト数）
+        self.cache_budgets = dict(IMAGE_CACHE_BUDGETS)
+        if cache_budgets:
+            self.cache_budgets.update(cache_budgets)
+        self._cache_entries = {}  # キャッシュキー → (カテゴリ, バイト数)
+        self._category_bytes = {category: 0 for category in self.cache_budgets}
+        self._pinned_keys = set()  # 追い出さないキー（必須UIなど）
+        # 余白を切り詰めた画像 → ((x, y), 元キャンバスのサイズ)。画像が解放されれば消える
+        self._image_layouts = weakref.WeakKeyDictionary()
+        self._evictions = 0
+        # 背景の読み込み時縮小: ファイルパス → 表示される最大ズーム。None なら縮小しない
+        self._bg_decode_zooms = None
+        # デコード済み画像のディスクキャッシュ（None なら使わない）
+        self.decode_cache_dir = decode_cache_dir
+        self.decode_cache_bytes = decode_cache_bytes
+        self._decoded_cache_hits = 0
+        self._decoded_cache_writes = 0
+        self._pixel_format = None  # 表示形式（_display_pixel_format で決める）
         self.image_paths = {}  # パス情報を保存
+        self.image_sizes = {}  # ファイルパス → マニフェストに記録された (幅, 高さ)
         self.default_sizes = {
             'character': None,  # キャラクター画像は元サイズを維持
             'background': None,  # 背景は画面サイズに合わせる
@@ -58,27 +183,84 @@ class ImageManager:
         self.executor = ThreadPoolExecutor(max_workers=2)
         self.loading_tasks = {}  # 読み込み中タスクの管理
         self.lock = threading.Lock()  # キャッシュ操作の同期
+        # 先読みのデコード（生ピクセルまで）。サーフェス化は finalize_decoded でメインスレッドが行う
+        self.decode_pipeline = DecodePipeline(self._decode_job, DECODE_WORKERS)
+
+        # 先読み（prefetch_image）の統計。要求側で初めて使われた時点で集計する
+        self._cache_requests = 0
+        self._cache_hits = 0
+        self._prefetched_keys = set()  # 先読みで入れて、まだ要求されていないキー
+        self._prefetch_submitted = 0
+        self._prefetch_hits = 0        # 要求時に読み込み済みだった
+        self._prefetch_late = 0        # 要求時にまだ読み込み中で待った
+        self._demand_loads = 0         # 要求時に同期読み込みした
+        self._finalized = 0            # finalize_decoded でキャッシュに入れた
+        self._worst_finalize_ms = 0.0  # finalize_decoded 1回にかかった最長時間
+        self._worst_stall_ms = 0.0
+        self._total_stall_ms = 0.0
         
         # libpng警告を抑制
         warnings.filterwarnings("ignore", message=".*iCCP.*")
         warnings.filterwarnings("ignore", message=".*cHRM.*")
 
-    def _manage_cache(self, cache_key, image):
-        """LRUキャッシュの管理（スレッドセーフ）"""
+    def _manage_cache(self, cache_key, image, category='other'):
+        """LRUキャッシュの管理（スレッドセーフ）。カテゴリのバイト予算を超えたら古い順に削除。
+
+        キャッシュに入った画像を返す（同じキーが先に入っていればそちら）。
+        """
         with self.lock:
             if cache_key in self.image_cache:
                 # 既存のキーを最新に移動
                 self.image_cache.move_to_end(cache_key)
-            else:
-                # 新しいアイテムを追加
-                self.image_cache[cache_key] = image
-                
-                # キャッシュサイズを超えた場合、最も古いアイテムを削除
-                if len(self.image_cache) > self.cache_size:
-                    oldest_key = next(iter(self.image_cache))
-                    del self.image_cache[oldest_key]
-                    if self.debug:
-                        print(f"キャッシュから削除: {oldest_key}")
+                return self.image_cache[cache_key]
+
+            # 新しいアイテムを追加
+            if category not in self.cache_budgets:
+                category = 'other'
+            nbytes = _image_bytes(image)
+            self.image_cache[cache_key] = image
+            self._cache_entries[cache_key] = (category, nbytes)
+            self._category_bytes[category] = self._category_bytes.get(category, 0) + nbytes
+
+            # 予算を超えた場合、同じカテゴリの最も古いアイテムから削除（固定キーと今入れたものは残す）
+            budget = self.cache_budgets.get(category, 0)
+            if self._category_bytes[category] <= budget:
+                return image
+            for old_key in list(self.image_cache):
+                if self._category_bytes[category] <= budget:
+                    break
+                if old_key == cache_key or old_key in self._pinned_keys:
+                    continue
+                old_category, old_bytes = self._cache_entries.get(old_key, ('other', 0))
+                if old_category != category:
+                    continue
+                del self.image_cache[old_key]
+                del self._cache_entries[old_key]
+                self._category_bytes[category] -= old_bytes
+                self._evictions += 1
+                if self.debug:
+                    print(f"キャッシュから削除: {old_key}")
+            return image
+
+    def pin_image(self, cache_key):
+        """キャッシュキーを追い出し対象から外す（必須UIなど）"""
+        with self.lock:
+            self._pinned_keys.add(cache_key)
+
+    def unpin_image(self, cache_key):
+        with self.lock:
+            self._pinned_keys.discard(cache_key)
+
+    def get_cache_category(self, image_type):
+        """image_paths の種別をキャッシュ予算のカテゴリに変換する"""
+        return _CACHE_CATEGORIES.get(image_type, 'other')
+
+    def estimate_image_bytes(self, image_type):
+        """そのカテゴリでキャッシュ済みの画像の平均バイト数（未読み込みなら 0）"""
+        category = self.get_cache_category(image_type)
+        with self.lock:
+            sizes = [nbytes for cat, nbytes in self._cache_entries.values() if cat == category]
+        return sum(sizes) // len(sizes) if sizes else 0
     
     def _get_from_cache(self, cache_key):
         """キャッシュから画像を取得（スレッドセーフ）"""
@@ -122,6 +304,7 @@ class ImageManager:
     
     async def load_image_async(self, filepath, size=None):
         """画像を非同期で読み込む"""
+        pixel_format = self._display_pixel_format()  # 表示を触るのでメインスレッドで決めておく
         optimal_size = self._get_optimal_size(filepath, size)
         cache_key = f"{filepath}_{optimal_size if optimal_size else 'original'}"
         
@@ -140,7 +323,7 @@ class ImageManager:
         if self.debug:
             print(f"画像を非同期読み込み開始: {filepath}")
         
-        task = asyncio.create_task(self._load_image_async_worker(filepath, optimal_size, cache_key))
+        task = asyncio.create_task(self._load_image_async_worker(filepath, optimal_size, cache_key, pixel_format))
         self.loading_tasks[cache_key] = task
         
         try:
@@ -151,13 +334,13 @@ class ImageManager:
             if cache_key in self.loading_tasks:
                 del self.loading_tasks[cache_key]
     
-    async def _load_image_async_worker(self, filepath, size, cache_key):
+    async def _load_image_async_worker(self, filepath, size, cache_key, pixel_format=None):
         """画像読み込みワーカー"""
         loop = asyncio.get_event_loop()
         
         try:
             # ファイル存在チェックを非同期で実行
-            exists = await loop.run_in_executor(self.executor, os.path.exists, filepath)
+            exists = await loop.run_in_executor(self.executor, self.asset_packs.exists, filepath)
             if not exists:
                 if self.debug:
                     print(f"警告: 画像ファイルが見つかりません: {filepath}")
@@ -168,12 +351,13 @@ class ImageManager:
                 self.executor, 
                 self._load_image_sync, 
                 filepath, 
-                size
+                size,
+                pixel_format
             )
             
             if image:
                 # キャッシュに保存
-                self._manage_cache(cache_key, image)
+                image = self._manage_cache(cache_key, image, _cache_category(filepath))
                 if self.debug:
                     print(f"画像読み込み完了: {filepath}")
             
@@ -184,20 +368,179 @@ class ImageManager:
                 print(f"非同期画像読み込みエラー: {filepath}: {e}")
             return None
     
-    def _load_image_sync(self, filepath, size):
+    def set_background_zooms(self, zooms):
+        """背景ごとの最大ズーム {キー: ズーム} を設定し、読み込み時縮小を有効にする
+
+        None を渡すと縮小しない（元サイズのまま読み込む）。上限が変わった背景はキャッシュから外す。
+        """
+        if zooms is None:
+            decode_zooms = None
+        else:
+            decode_zooms = {}
+            for image_key, zoom in zooms.items():
+                filepath = self._resolve_image_path("bg", image_key)
+                if filepath:
+                    decode_zooms[filepath] = max(decode_zooms.get(filepath, 1.0), float(zoom))
+        previous = self._bg_decode_zooms
+        self._bg_decode_zooms = decode_zooms
+        changed = {
+            filepath
+            for filepath in set(previous or {}) | set(decode_zooms or {}) | set(self.image_paths.get("bg", {}).values())
+            if self._decode_limit_for(previous, filepath) != self._decode_limit_for(decode_zooms, filepath)
+        }
+        if changed:
+            self._drop_cached_files(changed)
+
+    @staticmethod
+    def _decode_limit_for(decode_zooms, filepath):
+        if decode_zooms is None or _cache_category(filepath) != 'bg':
+            return None
+        zoom = max(1.0, decode_zooms.get(filepath, 1.0))
+        return scale_size(int(VIRTUAL_WIDTH * zoom), int(VIRTUAL_HEIGHT * zoom))
+
+    def _decode_limit(self, filepath):
+        """読み込み時に縮小する上限サイズ（縮小しないなら None）"""
+        return self._decode_limit_for(self._bg_decode_zooms, filepath)
+
+    def _drop_cached_files(self, filepaths):
+        """filepaths から読み込んだキャッシュを削除する（固定キーも対象）"""
+        with self.lock:
+            for cache_key in list(self.image_cache):
+                filepath = cache_key.rsplit("_", 1)[0]
+                if filepath not in filepaths:
+                    continue
+                del self.image_cache[cache_key]
+                category, nbytes = self._cache_entries.pop(cache_key, ('other', 0))
+                self._category_bytes[category] = self._category_bytes.get(category, 0) - nbytes
+
+    def _decoded_cache_path(self, filepath, size=None):
+        """デコード済みキャッシュのファイル。元画像のパス・更新時刻・サイズと読み込みサイズで決まる"""
+        if not self.decode_cache_dir:
+            return None
+        stat = self.asset_packs.stat(filepath)
+        if stat is None:
+            return None
+        if size:
+            target = f"{size[0]}x{size[1]}"
+        else:
+            limit = self._decode_limit(filepath)
+            target = f"max{limit[0]}x{limit[1]}" if limit else "original"
+        version = f"{os.path.abspath(filepath)}|{stat[0]}|{stat[1]}|{target}"
+        digest = hashlib.sha1(version.encode("utf-8")).hexdigest()[:16]
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        return os.path.join(self.decode_cache_dir, f"{stem}_{digest}.rgba")
+
+    def _display_pixel_format(self):
+        """convert_alpha と同じ表示形式（tobytes / frombuffer の形式名）
+
+        表示を使うのでメインスレッドで呼ぶ。表示の初期化前は "BGRA" を返し、決めずにおく。
+        """
+        if self._pixel_format is None:
+            try:
+                probe = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+            except pygame.error:
+                return "BGRA"
+            self._pixel_format = _PIXEL_FORMATS.get(tuple(probe.get_masks()), "BGRA")
+        return self._pixel_format
+
+    def _decode_image(self, filepath, size=None, pixel_format="BGRA"):
+        """画像をデコードして pixel_format の32bitサーフェスにする（表示を使わないのでワーカースレッドで呼べる）
+
+        サイズ指定がなく、表示できる最大サイズ（仮想解像度×最大ズーム）より大きい背景は smoothscale で縮小する。
+        """
+        limit = None if size else self._decode_limit(filepath)
+
+        # libpng警告を一時的に抑制
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            image = pygame.image.load(self.asset_packs.source(filepath), os.path.basename(filepath))
+        if image.get_colorkey() is not None:
+            # カラーキーは透明ピクセルにする（convert_alpha と同じ結果）
+            image = image.convert(pygame.Surface((1, 1), pygame.SRCALPHA, 32, _PIXEL_MASKS[pixel_format]))
+        image = pygame.image.frombuffer(
+            bytearray(pygame.image.tobytes(image, pixel_format)), image.get_size(), pixel_format
+        )
+        if not limit:
+            return image
+
+        width, height = image.get_size()
+        target = (min(width, limit[0]), min(height, limit[1]))
+        if target == (width, height):
+            return image
+        # 背景は表示時に縦横別々に引き伸ばされるので、軸ごとに上限へ揃えてよい。
+        # smoothscale は丸めでアルファも 1～3 下がるので、不透明な背景は縮小後にアルファを 255 に戻す
+        opaque = pygame.mask.from_surface(image, 254).count() == width * height
+        image = pygame.transform.smoothscale(image, target)
+        if opaque:
+            image.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MAX)
+        if self.debug:
+            print(f"背景を読み込み時に縮小: {filepath} {(width, height)} -> {target}")
+        return image
+
+    def _decode_pixels(self, filepath, size=None, pixel_format="BGRA"):
+        """表示に使う形の生ピクセルを返す（デコード・縮小・リサイズ・顔パーツの余白切り詰めまで済ませたもの）
+
+        戻り値は (pixels, (幅, 高さ), 形式, layout)。サーフェスは作らないのでワーカースレッドで呼べる。
+        ディスクキャッシュがあればそのまま読み込んで返し、なければデコードして書き出す。
+        """
+        cache_path = self._decoded_cache_path(filepath, size)
+        cached = _read_decoded_pixels(cache_path) if cache_path and os.path.exists(cache_path) else None
+        if cached:
+            with self.lock:
+                self._decoded_cache_hits += 1
+            try:
+                os.utime(cache_path)  # 使った順に残す
+            except OSError:
+                pass
+            return cached
+
+        image = self._decode_image(filepath, size, pixel_format)
+
+        # 画面サイズに合わせて画像をリサイズ（必要に応じて）
+        if size and isinstance(size, tuple) and len(size) == 2:
+            original_size = image.get_size()
+            if original_size != size:
+                image = pygame.transform.scale(image, size)
+                if self.debug:
+                    print(f"画像リサイズ: {filepath} {original_size} -> {size}")
+
+        layout = None
+        if _cache_category(filepath) == 'face_part':
+            image, layout = _trim_transparent_margins(image)
+
+        pixels = bytearray(pygame.image.tobytes(image, pixel_format))
+        if cache_path:
+            try:
+                if _write_decoded_file(cache_path, pixels, image.get_size(), pixel_format, layout):
+                    with self.lock:
+                        self._decoded_cache_writes += 1
+                    _trim_decoded_dir(self.decode_cache_dir, self.decode_cache_bytes, cache_path)
+            except OSError as e:
+                if self.debug:
+                    print(f"デコード済みキャッシュを保存できません: {cache_path}: {e}")
+        return pixels, image.get_size(), pixel_format, layout
+
+    def _surface_from_pixels(self, decoded):
+        """_decode_pixels の結果をサーフェスにする（ピクセルはコピーしない）
+
+        顔パーツの元キャンバス上の配置は get_image_layout 用に記録する。
+        """
+        pixels, size, pixel_format, layout = decoded
+        image = pygame.image.frombuffer(pixels, size, pixel_format)
+        if layout:
+            with self.lock:
+                self._image_layouts[image] = layout
+        return image
+
+    def _load_decoded(self, filepath, size=None, pixel_format=None):
+        """表示に使う形の画像を返す（_decode_pixels ＋ _surface_from_pixels）"""
+        pixel_format = pixel_format or self._display_pixel_format()
+        return self._surface_from_pixels(self._decode_pixels(filepath, size, pixel_format))
+
+    def _load_image_sync(self, filepath, size, pixel_format=None):
         """同期的な画像読み込み（スレッド内で実行）"""
         try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                image = pygame.image.load(filepath)
-                image = image.convert_alpha()
-            
-            if size and isinstance(size, tuple) and len(size) == 2:
-                original_size = image.get_size()
-                if original_size != size:
-                    image = pygame.transform.scale(image, size)
-            
-            return image
+            return self._load_decoded(filepath, size, pixel_format)
             
         except pygame.error as e:
             if self.debug:
@@ -211,30 +554,16 @@ class ImageManager:
     def _load_image_immediately(self, filepath, size, cache_key):
         """画像を即座に読み込む"""
         try:
-            if not os.path.exists(filepath):
+            if not self.asset_packs.exists(filepath):
                 if self.debug:
                     print(f"警告: 画像ファイルが見つかりません: {filepath}")
                 return None
                 
-            # libpng警告を一時的に抑制
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                # 画像を読み込む
-                image = pygame.image.load(filepath)
-                image = image.convert_alpha()
-
-            # 画面サイズに合わせて画像をリサイズ（必要に応じて）
-            if size and isinstance(size, tuple) and len(size) == 2:
-                original_size = image.get_size()
-                if original_size != size:
-                    image = pygame.transform.scale(image, size)
-                    if self.debug:
-                        print(f"画像リサイズ: {filepath} {original_size} -> {size}")
-                
-            # キャッシュに保存
-            self._manage_cache(cache_key, image)
+            # 画像を読み込む（大きすぎる背景の縮小・リサイズ・顔パーツの余白切り詰め済み）
+            image = self._load_decoded(filepath, size)
 
-            return image
+            # キャッシュに保存
+            return self._manage_cache(cache_key, image, _cache_category(filepath))
         
         except pygame.error as e:
             if self.debug:
@@ -245,11 +574,8 @@ class ImageManager:
                 print(f"画像読み込みエラー: {filepath}: {e}")
             return None
     
-    def get_image(self, image_type, image_key, size=None):
-        """画像を取得（必要に応じて遅延ロード）スレッドセーフ"""
-        if self.debug:
-            print(f"[IMG_REQUEST] 要求: {image_type}/{image_key}")
-
+    def _resolve_image_path(self, image_type, image_key):
+        """種別とキー（部分一致・胴体番号も可）からファイルパスを返す"""
         if not image_key or image_type not in self.image_paths:
             return None
 
@@ -262,7 +588,6 @@ class ImageManager:
                     found = True
                     break
             if not found and image_type == "torso":
-                import re
                 t_match = re.search(r'_T(\d+)', str(image_key), re.IGNORECASE) or re.search(r'T(\d+)', str(image_key), re.IGNORECASE)
                 if t_match:
                     t_token = f"_t{t_match.group(1)}_"
@@ -274,19 +599,43 @@ class ImageManager:
             if not found:
                 return None
 
-        filepath = self.image_paths[image_type][image_key]
+        return self.image_paths[image_type][image_key]
+
+    def _cache_key_for(self, image_type, image_key, size=None):
+        """(ファイルパス, 読み込みサイズ, キャッシュキー)。見つからなければ None"""
+        filepath = self._resolve_image_path(image_type, image_key)
+        if not filepath:
+            return None
         optimal_size = self._get_optimal_size(filepath, size)
-        cache_key = f"{filepath}_{optimal_size if optimal_size else 'original'}"
+        return filepath, optimal_size, f"{filepath}_{optimal_size if optimal_size else 'original'}"
+
+    def get_image(self, image_type, image_key, size=None):
+        """画像を取得（必要に応じて遅延ロード）スレッドセーフ
+
+        顔パーツは透明な余白を切り詰めた画像を返す。元キャンバス上の位置は get_image_layout で得る。
+        """
+        if self.debug:
+            print(f"[IMG_REQUEST] 要求: {image_type}/{image_key}")
+
+        resolved = self._cache_key_for(image_type, image_key, size)
+        if not resolved:
+            return None
+        filepath, optimal_size, cache_key = resolved
 
         # キャッシュチェックとロード中チェック（スレッドセーフ）
         load_event = None
         should_load = False
 
         with self.lock:
+            self._cache_requests += 1
                 # まずキャッシュを確認
             if cache_key in self.image_cache:
                 self.image_cache.move_to_end(cache_key)
                 cached_image = self.image_cache[cache_key]
+                self._cache_hits += 1
+                if cache_key in self._prefetched_keys:
+                    self._prefetched_keys.discard(cache_key)
+                    self._prefetch_hits += 1
                 if self.debug:
                     print(f"[IMG_CACHE_HIT] ヒット: {image_type}/{image_key}")
                 return cached_image
@@ -304,9 +653,17 @@ class ImageManager:
                 should_load = True
 
         # ロックの外で処理
+        started = time.perf_counter()
         if should_load:
             # 自分がロードを担当する場合
+            # 先読み中ならデコード中の分だけ待つ。まだキューにあるだけなら取り下げてここでデコードする
+            pending = self.decode_pipeline.is_pending(cache_key)
+            ready = pending and self.decode_pipeline.is_ready(cache_key)
+            found, decoded = False, None
             try:
+                found, decoded = self.decode_pipeline.take(cache_key, timeout=2.0) if pending else (False, None)
+                if decoded is not None:
+                    return self._manage_cache(cache_key, self._surface_from_pixels(decoded), _cache_category(filepath))
                 # 新規ロード時のみログ出力
                 if self.debug:
                     print(f"[IMG_LOAD] ロード: {image_type}/{image_key}")
@@ -320,6 +677,13 @@ class ImageManager:
                     if cache_key in self.loading_tasks:
                         load_event.set()  # 待機中のスレッドに通知
                         del self.loading_tasks[cache_key]
+                    if ready and decoded is not None:
+                        self._prefetch_hits += 1  # デコード済みで finalize を待っていただけ
+                    elif found:
+                        self._prefetch_late += 1
+                    else:
+                        self._demand_loads += 1
+                    self._record_stall(started)
         else:
             # 他スレッドがロード中の場合は待機
             if self.debug:
@@ -327,6 +691,7 @@ class ImageManager:
             load_event.wait(timeout=2.0)
             # 待機後、キャッシュから再取得
             with self.lock:
+                self._record_stall(started)
                 if cache_key in self.image_cache:
                     self.image_cache.move_to_end(cache_key)
                     if self.debug:
@@ -335,6 +700,105 @@ class ImageManager:
             # タイムアウトまたはロード失敗
             return None
     
+    def get_image_layout(self, image_type, image_key, size=None):
+        """get_image の画像と、元キャンバス上の配置を返す。
+
+        戻り値は (Surface, (x, y), (キャンバス幅, 高さ))。余白を切り詰めていない画像は
+        (0, 0) と自身のサイズ。見つからなければ None。
+        """
+        image = self.get_image(image_type, image_key, size)
+        if image is None:
+            return None
+        with self.lock:
+            layout = self._image_layouts.get(image)
+        if layout is None:
+            return image, (0, 0), image.get_size()
+        return image, layout[0], layout[1]
+
+    def _record_stall(self, started):
+        """要求側が読み込みで止まった時間を記録する（lock 内で呼ぶ）"""
+        stall_ms = (time.perf_counter() - started) * 1000.0
+        self._total_stall_ms += stall_ms
+        self._worst_stall_ms = max(self._worst_stall_ms, stall_ms)
+
+    def prefetch_image(self, image_type, image_key, size=None, priority=PRIORITY_PREFETCH):
+        """画像をワーカースレッドで生ピクセルまでデコードしておく（先読み用）。
+
+        サーフェス化とキャッシュへの登録は finalize_decoded でメインスレッドが行う。
+        キャッシュ済み・見つからない場合は何もしない。デコード待ちなら priority まで引き上げるだけ。
+        新しく投入したら True。
+        """
+        resolved = self._cache_key_for(image_type, image_key, size)
+        if not resolved:
+            return False
+        filepath, optimal_size, cache_key = resolved
+        with self.lock:
+            if cache_key in self.image_cache or cache_key in self.loading_tasks:
+                return False
+        job = (filepath, optimal_size, self._display_pixel_format())
+        if not self.decode_pipeline.submit(cache_key, job, priority):
+            return False
+        with self.lock:
+            self._prefetch_submitted += 1
+        if self.debug:
+            print(f"[IMG_PREFETCH] 先読み: {image_type}/{image_key} (優先度 {priority})")
+        return True
+
+    def _decode_job(self, job):
+        """デコードパイプラインのワーカーで実行する。失敗したら None"""
+        filepath, size, pixel_format = job
+        try:
+            return self._decode_pixels(filepath, size, pixel_format)
+        except pygame.error as e:
+            if self.debug:
+                print(f"pygame読み込みエラー: {filepath}: {e}")
+            return None
+        except Exception as e:
+            if self.debug:
+                print(f"画像読み込みエラー: {filepath}: {e}")
+            return None
+
+    def finalize_decoded(self, budget_ms=DECODE_FINALIZE_BUDGET_MS):
+        """先読みでデコードした画像をサーフェスにしてキャッシュに入れる（メインスレッドで毎フレーム呼ぶ）
+
+        優先度の高い順に budget_ms まで処理し、残りは次のフレームに回す。処理した件数を返す。
+        """
+        started = time.perf_counter()
+        finished = self.decode_pipeline.finalize(self._finish_decoded, budget_ms)
+        if finished:
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            with self.lock:
+                self._finalized += finished
+                self._worst_finalize_ms = max(self._worst_finalize_ms, elapsed_ms)
+        return finished
+
+    def _finish_decoded(self, cache_key, decoded):
+        if decoded is None:
+            return
+        with self.lock:
+            if cache_key in self.image_cache:
+                return
+        filepath = cache_key.rsplit("_", 1)[0]
+        self._manage_cache(cache_key, self._surface_from_pixels(decoded), _cache_category(filepath))
+        with self.lock:
+            self._prefetched_keys.add(cache_key)
+
+    def get_prefetch_stats(self):
+        """先読みの統計。hit_rate は要求時に初めて触れた画像のうち読み込み済みだった割合"""
+        with self.lock:
+            first_touches = self._prefetch_hits + self._prefetch_late + self._demand_loads
+            return {
+                'prefetched': self._prefetch_submitted,
+                'hits': self._prefetch_hits,
+                'late': self._prefetch_late,
+                'demand_loads': self._demand_loads,
+                'hit_rate': self._prefetch_hits / max(first_touches, 1),
+                'worst_stall_ms': self._worst_stall_ms,
+                'total_stall_ms': self._total_stall_ms,
+                'finalized': self._finalized,
+                'worst_finalize_ms': self._worst_finalize_ms,
+            }
+
     async def get_image_async(self, image_type, image_key, size=None):
         """画像を非同期で取得"""
         if image_type in self.image_paths and image_key in self.image_paths[image_type]:
@@ -386,40 +850,40 @@ class ImageManager:
         if self.debug:
             print(f"画像パススキャン開始: {images_dir}")
 
-        for root, dirs, files in os.walk(images_dir):
-            dir_name = os.path.basename(root)
-            for file in files:
-                if not file.upper().endswith(('.PNG', '.JPG', '.JPEG', '.WEBP')):
-                    continue
-                file_path = os.path.join(root, file)
-                stem = os.path.splitext(file)[0]
-
-                if dir_name == 'BG':
-                    self.image_paths['bg'][stem] = file_path
-                    if self.debug:
-                        print(f"背景登録: {stem}")
-
-                elif _CHAR_DIR_RE.match(dir_name):
-                    category = _classify_stem(stem)
-                    if category and category in self.image_paths:
-                        self.image_paths[category][stem] = file_path
-                        if self.debug:
-                            print(f"{category}登録: {stem}")
-
-                elif dir_name == 'UI':
-                    # ui.text-box.png → stem = 'ui.text-box' → key = 'text-box'
-                    # title.png       → stem = 'title'        → key = 'title'
-                    parts = stem.split('.')
-                    ui_key = parts[1] if len(parts) >= 2 else parts[0]
-                    self.image_paths['ui'][ui_key] = file_path
-
-                elif dir_name == 'ICON':
-                    self.image_paths['icon'][stem] = file_path
+        # 分類済みの一覧はマニフェストから読む（ディレクトリが変わったときだけ走査し直す）
+        manifest = load_asset_manifest(images_dir, os.path.join(project_root, ASSET_MANIFEST_PATH))
+        self.image_sizes = {}
+        for category, key, rel_path, width, height, _ in manifest['assets']:
+            if category not in self.image_paths:
+                continue
+            # マニフェストは '/' 区切りなので、OS の区切りで組み直す（他所の os.path.join と同じ文字列にする）
+            file_path = os.path.join(images_dir, *rel_path.split('/'))
+            self.image_paths[category][key] = file_path
+            if width and height:
+                self.image_sizes[file_path] = (width, height)
+        # ばらのファイルを置かずにパックだけで配布した画像
+        for rel_path, width, height in self.asset_packs.entries_under("images"):
+            parts = rel_path.split('/')
+            classified = classify_asset(parts[-2], os.path.splitext(parts[-1])[0])
+            if not classified or classified[0] not in self.image_paths:
+                continue
+            category, key = classified
+            if key in self.image_paths[category]:
+                continue
+            file_path = os.path.join(project_root, *parts)
+            self.image_paths[category][key] = file_path
+            if width and height:
+                self.image_sizes[file_path] = (width, height)
 
         if self.debug:
             total_images = sum(len(v) for v in self.image_paths.values())
             print(f"画像パススキャン完了: {total_images}個")
     
+    def get_image_size(self, image_type, image_key):
+        """デコードせずに元画像の (幅, 高さ) を返す（マニフェストに無ければ None）"""
+        filepath = self._resolve_image_path(image_type, image_key)
+        return self.image_sizes.get(filepath) if filepath else None
+
     def load_essential_images(self, screen_width, screen_height):
         """必要最小限の画像のみを事前ロード"""
         images = {
@@ -448,6 +912,8 @@ class ImageManager:
         for ui_name in essential_ui:
             if ui_name in self.image_paths["ui"]:
                 file_path = self.image_paths["ui"][ui_name]
+                # 画面に出しっぱなしの必須UIは予算超過でも追い出さない
+                self.pin_image(f"ui_{ui_name}")
                 
                 if ui_name == "text-box":
                     from core.config import scale_size
@@ -644,24 +1110,41 @@ class ImageManager:
             # エラーがあっても処理を続行
     
     def get_cache_stats(self):
-        """キャッシュ統計を取得"""
-        return {
-            'cache_size': len(self.image_cache),
-            'max_cache_size': self.cache_size,
-            'cache_hit_ratio': getattr(self, '_cache_hits', 0) / max(getattr(self, '_cache_requests', 1), 1),
-            'loading_tasks': len(self.loading_tasks)
-        }
+        """キャッシュ統計を取得（常駐バイト数はカテゴリ別にも返す）"""
+        with self.lock:
+            categories = {
+                category: {
+                    'resident_bytes': self._category_bytes.get(category, 0),
+                    'budget_bytes': budget,
+                    'entries': sum(1 for cat, _ in self._cache_entries.values() if cat == category),
+                }
+                for category, budget in self.cache_budgets.items()
+            }
+            return {
+                'cache_size': len(self.image_cache),
+                'resident_bytes': sum(self._category_bytes.values()),
+                'categories': categories,
+                'pinned': len(self._pinned_keys),
+                'evictions': self._evictions,
+                'decoded_cache_hits': self._decoded_cache_hits,
+                'decoded_cache_writes': self._decoded_cache_writes,
+                'cache_hit_ratio': self._cache_hits / max(self._cache_requests, 1),
+                'loading_tasks': len(self.loading_tasks),
+                'decode_pending': self.decode_pipeline.pending_count(),
+            }
     
     def cleanup(self):
         """リソースのクリーンアップ"""
         # 実行中のタスクをキャンセル
         for task in self.loading_tasks.values():
-            if not task.done():
+            # get_image / prefetch_image の読み込み中は threading.Event
+            if hasattr(task, 'cancel') and not task.done():
                 task.cancel()
         self.loading_tasks.clear()
         
-        # ExecutorPoolをシャットダウン
+        # ExecutorPoolとデコードのワーカーをシャットダウン
         self.executor.shutdown(wait=False)
+        self.decode_pipeline.shutdown()
         
         if self.debug:
             print("ImageManager: リソースクリーンアップ完了")
@@ -22,6 +22,7 @@ class SaveManager:
             "player_name.json",
             "dialogue_state.json",
             "seed_state.json",
+            "backlog.jsonl",
         ]
         
         # ディレクトリが存在しない場合は作成
@@ -170,6 +171,10 @@ class SaveManager:
                         if os.path.exists(template_path):
                             shutil.copy2(template_path, dst_path)
                             print("[LOAD] 旧セーブ用にseed_state.jsonを初期化")
+                    elif filename == "backlog.jsonl":
+                        # 旧セーブにはバックログがないので空にする
+                        open(dst_path, "wb").close()
+                        print("[LOAD] 旧セーブ用にbacklog.jsonlを初期化")
 
             self._merge_completed_event_defaults()
             
@@ -212,6 +217,7 @@ class SaveManager:
                 "player_name.json": "player_name_template.json",
                 "dialogue_state.json": "dialogue_state_template.json",
                 "seed_state.json": "seed_state_template.json",
+                "backlog.jsonl": "backlog_template.jsonl",
             }
             
             for current_name, template_name in template_mapping.items():
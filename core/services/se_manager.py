@@ -5,12 +5,15 @@ import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 
+from core.services.asset_pack import get_asset_packs
 from core.services.settings_manager import get_settings_manager
 
 class SEManager:
-    def __init__(self, debug=False):
+    def __init__(self, debug=False, asset_packs=None):
         self.debug = debug
         self.SE_PATH = os.path.join("sounds", "ses")
+        # SEはアセットパックにあればそこから、無ければばらのファイルから読む
+        self.asset_packs = asset_packs if asset_packs is not None else get_asset_packs()
         pygame.mixer.pre_init(buffer=512)
         
         # 非同期処理用
@@ -49,7 +52,7 @@ class SEManager:
             if filename and not any(filename.lower().endswith(ext) for ext in ['.mp3', '.wav', '.ogg', '.m4a']):
                 for ext in ['.wav', '.mp3', '.ogg', '.m4a']:
                     candidate = f"{filename}{ext}"
-                    if os.path.exists(os.path.join(self.SE_PATH, candidate)):
+                    if self.asset_packs.exists(os.path.join(self.SE_PATH, candidate)):
                         filename = candidate
                         break
                 else:
@@ -65,13 +68,13 @@ class SEManager:
             se_path = os.path.join(self.SE_PATH, filename)
             
             # ファイルの存在チェック
-            if not os.path.exists(se_path):
+            if not self.asset_packs.exists(se_path):
                 if self.debug:
                     print(f"SEファイルが見つかりません: {se_path}")
                 return False
             
             # 効果音を読み込み
-            sound = pygame.mixer.Sound(se_path)
+            sound = pygame.mixer.Sound(self.asset_packs.source(se_path))
             sound.set_volume(volume)
             self.current_sound = sound
             
@@ -144,8 +147,8 @@ class SEManager:
                 return self.sound_cache[se_path]
             
             # キャッシュにない場合はロード
-            if os.path.exists(se_path):
-                sound = pygame.mixer.Sound(se_path)
+            if self.asset_packs.exists(se_path):
+                sound = pygame.mixer.Sound(self.asset_packs.source(se_path))
                 
                 # キャッシュサイズ管理
                 if len(self.sound_cache) >= self.max_cache_size:
@@ -174,7 +177,7 @@ class SEManager:
             se_path = os.path.join(self.SE_PATH, filename)
             
             # ファイルの存在チェックを非同期で実行
-            exists = await asyncio.to_thread(os.path.exists, se_path)
+            exists = await asyncio.to_thread(self.asset_packs.exists, se_path)
             if not exists:
                 if self.debug:
                     print(f"SEファイルが見つかりません: {se_path}")
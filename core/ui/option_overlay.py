@@ -21,6 +21,7 @@ import os
 
 import pygame
 from core.path_utils import get_project_root
+from core.services.asset_pack import get_asset_packs
 from core.services.settings_manager import get_settings_manager
 
 
@@ -196,7 +197,7 @@ class MockOptionOverlay:
         for frame_name in self.frame_names:
             frame_path = os.path.join(ui_dir, frame_name)
             try:
-                frames.append(pygame.image.load(frame_path).convert_alpha())
+                frames.append(get_asset_packs().load_image(frame_path).convert_alpha())
             except Exception:
                 fallback = pygame.Surface(self.screen.get_size())
                 fallback.fill((24, 24, 24))
@@ -288,7 +289,7 @@ class SettingsFaderOverlay:
         for index in range(3):
             path = os.path.join(setting_dir, f"fader{index}.png")
             try:
-                frames.append(pygame.image.load(path).convert_alpha())
+                frames.append(get_asset_packs().load_image(path).convert_alpha())
             except Exception:
                 fallback = pygame.Surface(_SETTINGS_SOURCE_SIZE)
                 fallback.fill((28, 28, 28))
@@ -300,7 +301,7 @@ class SettingsFaderOverlay:
             get_project_root(), "images", "UI", "setting", "button.png"
         )
         try:
-            image = pygame.image.load(path).convert_alpha()
+            image = get_asset_packs().load_image(path).convert_alpha()
         except Exception:
             image = pygame.Surface(_SETTINGS_KNOB_SIZE, pygame.SRCALPHA)
             image.fill((24, 24, 24))
@@ -501,7 +502,7 @@ class OptionImageOverlay:
         for number in range(_OPTION_MIN_NUMBER, _OPTION_MAX_NUMBER + 1):
             image_path = os.path.join(option_dir, f"{number}.png")
             try:
-                images[number] = pygame.image.load(image_path).convert_alpha()
+                images[number] = get_asset_packs().load_image(image_path).convert_alpha()
             except Exception:
                 images[number] = pygame.Surface((640, 602), pygame.SRCALPHA)
         return images
@@ -2,6 +2,7 @@
 import os
 from core.config import *
 from core.path_utils import get_font_path
+from core.services.asset_pack import get_asset_packs
 
 class TitleScreen:
     """タイトル画面クラス"""
@@ -55,9 +56,9 @@ class TitleScreen:
     def load_title_image(self):
         """タイトル背景画像を読み込む"""
         try:
-            if os.path.exists(TITLE_IMAGE_PATH):
+            if get_asset_packs().exists(TITLE_IMAGE_PATH):
                 # 画像を読み込んで4:3コンテンツサイズにスケーリング
-                original_image = pygame.image.load(TITLE_IMAGE_PATH)
+                original_image = get_asset_packs().load_image(TITLE_IMAGE_PATH)
                 # CONTENT_WIDTH/HEIGHTは4:3のコンテンツサイズ（正確な値）
                 from core.config import CONTENT_WIDTH, CONTENT_HEIGHT
                 content_size = (CONTENT_WIDTH, CONTENT_HEIGHT)
@@ -79,10 +80,10 @@ class TitleScreen:
             pygame.mixer.init()
             bgm_path = os.path.join(os.path.dirname(__file__), "sounds", "bgms", "koi_no_dancesite.mp3")
             
-            if os.path.exists(bgm_path):
+            if get_asset_packs().exists(bgm_path):
                 # m4aファイルの読み込みを試行
                 try:
-                    pygame.mixer.music.load(bgm_path)
+                    pygame.mixer.music.load(get_asset_packs().source(bgm_path), os.path.basename(bgm_path))
                     self.bgm_loaded = True
                     if self.debug:
                         print(f"タイトルBGMを読み込みました: {bgm_path}")
@@ -100,9 +101,9 @@ class TitleScreen:
                     
                     for alt_bgm in alternative_bgms:
                         alt_path = os.path.join(os.path.dirname(__file__), "sounds", "bgms", alt_bgm)
-                        if os.path.exists(alt_path):
+                        if get_asset_packs().exists(alt_path):
                             try:
-                                pygame.mixer.music.load(alt_path)
+                                pygame.mixer.music.load(get_asset_packs().source(alt_path), os.path.basename(alt_path))
                                 self.bgm_loaded = True
                                 if self.debug:
                                     print(f"代替タイトルBGMを読み込みました: {alt_path}")
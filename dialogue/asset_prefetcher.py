@@ -0,0 +1,89 @@
+"""
+dialogue/asset_prefetcher.py
+IR の数ステップ先で使う立ち絵・顔パーツ・背景を前もってデコードする
+
+- ir_step_index の先 lookahead ステップの chara_show / chara_shift / bg_show から
+  画像キーを集め、ImageManager.prefetch_image でワーカースレッドに読ませる
+- 次のステップの画像はそれより先の分より優先してデコードする
+- デコードが済んだ画像は毎フレーム ImageManager.finalize_decoded で予算内だけサーフェスにする
+- 要求された時点で読み込み済みだった割合（ヒット率）と、それでも残った
+  最悪のストールは ImageManager.get_prefetch_stats で集計する
+"""
+
+from core.config import ASSET_PREFETCH_STEPS
+from core.services.decode_pipeline import PRIORITY_NEXT_STEP, PRIORITY_PREFETCH
+
+# chara_show / chara_shift の params に入る顔パーツ
+PART_TYPES = ("brow", "eye", "mouth", "cheek", "effect", "accessory")
+
+
+def collect_step_assets(step):
+    """1ステップの action から (画像種別, キー) を出現順に返す"""
+    assets = []
+    actions = step.get("actions") if isinstance(step, dict) else None
+    for action in actions or ():
+        action_type = action.get("action")
+        params = action.get("params") or {}
+        if action_type in ("chara_show", "chara_shift"):
+            torso = params.get("torso")
+            if action_type == "chara_show":
+                torso = torso or action.get("target")
+            if torso:
+                assets.append(("torso", torso))
+            for part_type in PART_TYPES:
+                part_id = params.get(part_type)
+                if part_id:
+                    assets.append((part_type, part_id))
+        elif action_type == "bg_show":
+            storage = params.get("storage")
+            if storage:
+                assets.append(("bg", storage))
+    return assets
+
+
+class AssetPrefetcher:
+    """update(game_state) を毎フレーム呼ぶと、デコード済みの画像を仕上げ、ステップが進んだときだけ先読みを投入する"""
+
+    def __init__(self, image_manager, lookahead=ASSET_PREFETCH_STEPS):
+        self.image_manager = image_manager
+        self.lookahead = max(0, int(lookahead))
+        self._steps = None
+        self._step_index = None
+
+    def update(self, game_state):
+        finalize = getattr(self.image_manager, "finalize_decoded", None)
+        if finalize is not None:
+            finalize()
+
+        steps = (game_state.get("ir_data") or {}).get("steps") or []
+        step_index = game_state.get("ir_step_index", -1)
+        if steps is self._steps and step_index == self._step_index:
+            return
+        self._steps = steps
+        self._step_index = step_index
+        prefetch = getattr(self.image_manager, "prefetch_image", None)
+        if prefetch is None:
+            return
+
+        window = []
+        priorities = {}
+        for offset, step in enumerate(steps[step_index + 1:step_index + 1 + self.lookahead]):
+            for asset in collect_step_assets(step):
+                if asset not in priorities:
+                    window.append(asset)
+                    priorities[asset] = PRIORITY_NEXT_STEP if offset == 0 else PRIORITY_PREFETCH
+
+        # 追い出しで先読みが無駄にならないよう、カテゴリごとの予算の半分までに抑える
+        budgets = getattr(self.image_manager, "cache_budgets", {})
+        planned = {}
+        for image_type, image_key in window:
+            category = self.image_manager.get_cache_category(image_type)
+            planned[category] = planned.get(category, 0) + self.image_manager.estimate_image_bytes(image_type)
+            if planned[category] > budgets.get(category, 0) // 2:
+                continue
+            prefetch(image_type, image_key, priority=priorities[(image_type, image_key)])
+
+    def get_stats(self):
+        """ImageManager の先読み統計（hit_rate / worst_stall_ms など）"""
+        get_stats = getattr(self.image_manager, "get_prefetch_stats", None)
+        return get_stats() if get_stats else {}
@@ -1,30 +1,108 @@
-﻿import pygame
+﻿from collections import OrderedDict
+
+import pygame
 from core.config import *
 
-# 背景画像スケーリングキャッシュ
-_bg_scaled_cache = {}
+# 背景ごとのマスター（イベント中の最大ズームで1回だけ拡縮したもの）: 元画像 -> (ズーム, サーフェス)
+_BG_MASTER_LIMIT = 4
+_bg_masters = OrderedDict()
+# 直前に描いた画面サイズの切り出し（静止中は毎フレーム拡縮しない）
+_bg_frame_cache = {}
+# IR のステップ列 -> {背景名: 最大ズーム}
+_bg_zoom_plan = {'steps': None, 'zooms': {}}
 
-def get_scaled_background(image, new_width, new_height):
-    """背景をキャッシュ付きでスケーリング"""
-    # キャッシュキーを作成
-    image_id = id(image)
-    cache_key = (image_id, new_width, new_height)
-    
-    # キャッシュから取得を試行
-    if cache_key in _bg_scaled_cache:
-        return _bg_scaled_cache[cache_key]
-    
-    # スケーリングして新しい画像を作成
-    scaled_image = pygame.transform.scale(image, (new_width, new_height))
-    
-    # キャッシュに保存（最大20個まで - 背景は大きいため少なめ）
-    if len(_bg_scaled_cache) > 20:
-        # 古いエントリを削除
-        oldest_key = next(iter(_bg_scaled_cache))
-        del _bg_scaled_cache[oldest_key]
-    
-    _bg_scaled_cache[cache_key] = scaled_image
-    return scaled_image
+def _clamp_zoom(value):
+    try:
+        zoom = float(value)
+    except (TypeError, ValueError):
+        zoom = 1.0
+    return max(0.5, min(3.0, zoom))
+
+def plan_background_zooms(steps):
+    """IR の bg_show / bg_move を走査して、背景ごとに使われる最大ズームを返す"""
+    zooms = {}
+    current_bg = None
+    for step in steps or ():
+        actions = step.get('actions') if isinstance(step, dict) else None
+        for action in actions or ():
+            action_type = action.get('action')
+            params = action.get('params') or {}
+            if action_type == 'bg_show':
+                current_bg = params.get('storage') or current_bg
+                zoom = _clamp_zoom(params.get('zoom', 1.0))
+            elif action_type == 'background':
+                current_bg = params.get('value') or params.get('storage') or current_bg
+                zoom = 1.0
+            elif action_type == 'bg_move':
+                # bg_move はその時点の背景に掛かる
+                zoom = _clamp_zoom(params.get('zoom', 1.0))
+            else:
+                continue
+            if current_bg:
+                zooms[current_bg] = max(zooms.get(current_bg, 0.0), zoom)
+    return zooms
+
+def _planned_zoom(game_state, bg_name):
+    """現在のイベントで bg_name に使われる最大ズーム（IR がなければ None）"""
+    steps = (game_state.get('ir_data') or {}).get('steps')
+    if not steps:
+        return None
+    if _bg_zoom_plan['steps'] is not steps:
+        _bg_zoom_plan['steps'] = steps
+        _bg_zoom_plan['zooms'] = plan_background_zooms(steps)
+    return _bg_zoom_plan['zooms'].get(bg_name)
+
+def _background_size(zoom):
+    """ズーム zoom での背景全体の画面上のサイズ"""
+    return scale_size(int(VIRTUAL_WIDTH * zoom), int(VIRTUAL_HEIGHT * zoom))
+
+def get_background_master(image, zoom):
+    """元画像をズーム zoom の大きさへ拡縮したマスター。同じズームなら作り直さない"""
+    entry = _bg_masters.get(image)
+    if entry is not None and entry[0] == zoom:
+        _bg_masters.move_to_end(image)
+        return entry[1]
+    size = _background_size(zoom)
+    master = image if image.get_size() == size else pygame.transform.scale(image, size)
+    _bg_masters[image] = (zoom, master)
+    _bg_masters.move_to_end(image)
+    while len(_bg_masters) > _BG_MASTER_LIMIT:
+        _bg_masters.popitem(last=False)
+    return master
+
+def _master_zoom(game_state, bg_name, image, zooms):
+    """マスターのズーム。イベントの最大ズームを優先し、足りなければ今必要な分まで広げる"""
+    needed = max(zooms)
+    planned = _planned_zoom(game_state, bg_name)
+    if planned is not None:
+        return max(planned, needed)
+    entry = _bg_masters.get(image)
+    if entry is not None and entry[0] >= needed:
+        return entry[0]
+    return needed
+
+def _blit_background_view(screen, master, dest, visible):
+    """背景全体を dest に置いたときの visible 部分を、マスターの切り出し＋最大1回の拡縮で描く"""
+    master_width, master_height = master.get_size()
+    offset_x = visible.x - dest.x
+    offset_y = visible.y - dest.y
+    if master.get_size() == dest.size:
+        # マスターと同じズーム：切り出すだけ
+        screen.blit(master, visible.topleft, pygame.Rect((offset_x, offset_y), visible.size))
+        return
+    ratio_x = master_width / dest.width
+    ratio_y = master_height / dest.height
+    left = max(0, min(master_width - 1, int(offset_x * ratio_x)))
+    top = max(0, min(master_height - 1, int(offset_y * ratio_y)))
+    right = max(left + 1, min(master_width, int(round((offset_x + visible.width) * ratio_x))))
+    bottom = max(top + 1, min(master_height, int(round((offset_y + visible.height) * ratio_y))))
+    area = pygame.Rect(left, top, right - left, bottom - top)
+
+    key = (master, tuple(area), visible.size)
+    if _bg_frame_cache.get('key') != key:
+        _bg_frame_cache['key'] = key
+        _bg_frame_cache['surface'] = pygame.transform.scale(master.subsurface(area), visible.size)
+    screen.blit(_bg_frame_cache['surface'], visible.topleft)
 
 def show_background(game_state, bg_name, bg_x, bg_y, bg_zoom):
     """背景を指定位置とズームで表示する"""
@@ -167,9 +245,6 @@ def draw_background(game_state):
     bg_state = game_state['background_state']
     image_manager = game_state['image_manager']
 
-    # 全画面を黒で塗りつぶし（ピラーボックス用）
-    screen.fill((0, 0, 0))
-
     # 現在の背景を取得
     bg_name = bg_state['current_bg']
 
@@ -192,30 +267,20 @@ def draw_background(game_state):
     
     try:
         zoom = bg_state['zoom']
+        anim = bg_state.get('anim')
 
-        # ズームを適用してサイズを計算
-        if zoom >= 1.0:
-            # 拡大時：画面サイズ以上になるように
-            # 仮想解像度基準でサイズを計算してスケーリング
-            virtual_new_width = int(VIRTUAL_WIDTH * zoom)
-            virtual_new_height = int(VIRTUAL_HEIGHT * zoom)
-            
-            # スケーリングした実際のサイズを計算
-            new_width, new_height = scale_size(virtual_new_width, virtual_new_height)
-        else:
-            # 縮小時：画面サイズより小さくなる（余白が生まれる）
-            # 仮想解像度基準でサイズを計算してスケーリング（縮小時）
-            virtual_new_width = int(VIRTUAL_WIDTH * zoom)
-            virtual_new_height = int(VIRTUAL_HEIGHT * zoom)
-            
-            # スケーリングした実際のサイズを計算
-            new_width, new_height = scale_size(virtual_new_width, virtual_new_height)
+        # ズームを適用した背景全体のサイズ（拡大時は画面以上、縮小時は余白が生まれる）
+        new_width, new_height = _background_size(zoom)
         
-        # 背景画像をスケール（キャッシュ使用）
-        if bg_image.get_size() != (new_width, new_height):
-            scaled_bg = get_scaled_background(bg_image, new_width, new_height)
+        # マスターはイベント中の最大ズームで1回だけ作り、パン・ズームは切り出しで描く
+        zooms = [zoom]
+        if anim:
+            zooms += [anim.get('start_zoom', zoom), anim.get('target_zoom', zoom)]
+        master_zoom = _master_zoom(game_state, bg_name, bg_image, zooms)
+        if bg_image.get_size() == (new_width, new_height):
+            master = bg_image
         else:
-            scaled_bg = bg_image
+            master = get_background_master(bg_image, master_zoom)
         
         # 描画位置を計算
         # 背景の中心が画面の中心に来るように、オフセットを適用
@@ -229,12 +294,19 @@ def draw_background(game_state):
         pos_x = int(center_x - new_width // 2 + bg_state['pos'][0])
         pos_y = int(center_y - new_height // 2 + bg_state['pos'][1])
         
-        # 縮小時は背景色で塗りつぶし（余白部分）
-        if zoom < 1.0:
-            screen.fill((20, 20, 40))  # 暗い青で余白を塗りつぶし
+        dest = pygame.Rect(pos_x, pos_y, new_width, new_height)
+        visible = dest.clip(screen.get_rect())
+        
+        # 背景で覆われない部分があるときだけ塗りつぶす
+        if visible != screen.get_rect():
+            if zoom < 1.0:
+                screen.fill((20, 20, 40))  # 縮小時の余白は暗い青
+            else:
+                screen.fill((0, 0, 0))  # ピラーボックス用
         
         # 背景を描画
-        screen.blit(scaled_bg, (pos_x, pos_y))
+        if visible.width and visible.height:
+            _blit_background_view(screen, master, dest, visible)
             
     except Exception as e:
         if DEBUG:
@@ -1,6 +1,11 @@
 ﻿import pygame
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
 from core.config import *
 from .name_manager import get_name_manager
+from .backlog_store import BacklogStore
+from .font_effects import font_effects_signature, get_cached_glyph
 from .inline_markup import (
     parse_inline_markup, wrap_markup_text, has_inline_markup,
     PlainChar, RubySpan, BotenSpan, SeedSpan,
@@ -10,6 +15,11 @@ from .inline_markup import (
 RUBY_FONT_RATIO = float(TEXT_RENDERER_CONFIG.get('ruby_font_ratio', 0.45))
 RUBY_MARGIN_PX  = int(TEXT_RENDERER_CONFIG.get('ruby_margin_px', 2))
 
+# 表示済み行サーフェスのキャッシュ上限（表示は11行なので数画面分）
+_LINE_SURFACE_CACHE_LIMIT = 64
+# 折り返し済みエントリのキャッシュ上限
+_WRAPPED_ENTRY_CACHE_LIMIT = 64
+
 def _blit_ruby_justified(surface, ruby_text: str, render_fn, grid_x: int, span_width: int):
     """ルビ文字列を span_width 内に両端揃えで blit する。
     1文字のときは中央揃え。ルビ幅がスパン幅を超える場合は左詰め。"""
@@ -36,62 +46,118 @@ def _blit_ruby_justified(surface, ruby_text: str, render_fn, grid_x: int, span_w
         surface.blit(s, (int(rx), 0))
         rx += s.get_width() + gap
 
+import sys
+from PyQt5 import sip
 from PyQt5.QtGui import QFont, QImage, QPainter, QColor, QFontMetrics
-from PyQt5.QtCore import QSize
 
-# テキスト描画キャッシュ
-_text_render_cache = {}
+# QImage.Format_ARGB32 は 0xAARRGGBB の32bit値なので、メモリ上のバイト順は
+# リトルエンディアンで B,G,R,A、ビッグエンディアンで A,R,G,B になる
+_QIMAGE_PYGAME_FORMAT = 'BGRA' if sys.byteorder == 'little' else 'ARGB'
+
+# テキスト描画キャッシュ（サーフェスのバイト数で上限管理）
+_TEXT_RENDER_CACHE_BYTES_LIMIT = 8 * 1024 * 1024
+_text_render_cache = OrderedDict()
+_text_render_cache_bytes = 0
+
+
+def _text_cache_key(text, qfont, color):
+    return (text, qfont.family(), qfont.pointSize(), qfont.weight(), tuple(color))
+
+
+def _surface_bytes(surface):
+    # subsurface の pitch は親（ストリップ全体）の幅なので、親の占有分で数える
+    return surface.get_pitch() * surface.get_height()
+
+
+def _store_text_surface(cache_key, surface):
+    global _text_render_cache_bytes
+    previous = _text_render_cache.pop(cache_key, None)
+    if previous is not None:
+        _text_render_cache_bytes -= _surface_bytes(previous)
+    _text_render_cache[cache_key] = surface
+    _text_render_cache_bytes += _surface_bytes(surface)
+    while _text_render_cache_bytes > _TEXT_RENDER_CACHE_BYTES_LIMIT and len(_text_render_cache) > 1:
+        _, evicted = _text_render_cache.popitem(last=False)
+        _text_render_cache_bytes -= _surface_bytes(evicted)
+
+
+def _shared_argb32_image(width, height):
+    """Python 側の bytearray をそのまま描画先にする QImage を作る。
+
+    bytes 系オブジェクトを直接渡すと QImage は読み取り専用として扱い、
+    描画時に内部コピーを作ってしまうので、アドレスで渡す。
+    bytearray は 0 初期化なので透明で塗りつぶす必要もない。
+    """
+    buffer = bytearray(width * height * 4)
+    address = sip.voidptr(int(sip.voidptr(buffer)))
+    qimage = QImage(address, width, height, width * 4, QImage.Format_ARGB32)
+    return buffer, qimage
+
 
 def render_text_with_qfont_cached(text, qfont, color):
     """PyQt5のQFontでテキストを描画し、PygameのSurfaceとして返す（キャッシュ付き）"""
-    # キャッシュキーを作成
-    cache_key = (text, qfont.family(), qfont.pointSize(), qfont.weight(), tuple(color))
-    
-    # キャッシュから取得を試行
-    if cache_key in _text_render_cache:
-        return _text_render_cache[cache_key]
-    
-    # 新しく描画
+    cache_key = _text_cache_key(text, qfont, color)
+    surface = _text_render_cache.get(cache_key)
+    if surface is not None:
+        _text_render_cache.move_to_end(cache_key)
+        return surface
+
     surface = render_text_with_qfont(text, qfont, color)
-    
-    # キャッシュに保存（最大200個まで）
-    if len(_text_render_cache) > 200:
-        # 古いエントリを削除
-        oldest_key = next(iter(_text_render_cache))
-        del _text_render_cache[oldest_key]
-    
-    _text_render_cache[cache_key] = surface
+    _store_text_surface(cache_key, surface)
     return surface
 
+
+def prerender_texts_with_qfont(texts, qfont, color):
+    """キャッシュにない文字列をまとめて1枚のストリップに描画し、キャッシュへ入れる"""
+    missing = []
+    for text in texts:
+        if text not in missing and _text_cache_key(text, qfont, color) not in _text_render_cache:
+            missing.append(text)
+    if not missing:
+        return
+    for text, surface in zip(missing, render_text_strip_with_qfont(missing, qfont, color)):
+        _store_text_surface(_text_cache_key(text, qfont, color), surface)
+
+
 def render_text_with_qfont(text, qfont, color):
     """PyQt5のQFontでテキストを描画し、PygameのSurfaceとして返す"""
+    return render_text_strip_with_qfont([text], qfont, color)[0]
+
+
+def render_text_strip_with_qfont(texts, qfont, color):
+    """複数の文字列を縦に並べた1枚の QImage に描画し、行ごとの Surface を返す。
+
+    QImage の描画先は pygame.image.frombuffer と共有するのでピクセルのコピーはない。
+    返す Surface は共有ストリップの subsurface（1つだけなら本体）。
+    """
     metrics = QFontMetrics(qfont)
-    width = metrics.horizontalAdvance(text)
     height = metrics.height()
-    
-    if width == 0 or height == 0:
-        # 空のSurfaceを返す
-        return pygame.Surface((1, 1), pygame.SRCALPHA)
+    widths = [metrics.horizontalAdvance(text) for text in texts]
+    strip_width = max(widths, default=0)
+    if strip_width == 0 or height == 0:
+        return [pygame.Surface((1, 1), pygame.SRCALPHA) for _ in texts]
 
-    # QImageを作成 (ARGB32はアルファチャンネル付き32ビット)
-    qimage = QImage(QSize(width, height), QImage.Format_ARGB32)
-    qimage.fill(QColor(0, 0, 0, 0))  # 透明で塗りつぶし
-
-    # QPainterでテキストを描画
+    buffer, qimage = _shared_argb32_image(strip_width, height * len(texts))
     painter = QPainter(qimage)
     painter.setFont(qfont)
     painter.setPen(QColor(*color))  # Pygameの色(r,g,b)をQColorに設定
-    painter.drawText(0, metrics.ascent(), text)
+    for row, text in enumerate(texts):
+        if widths[row]:
+            painter.drawText(0, row * height + metrics.ascent(), text)
     painter.end()
+    del qimage
 
-    # QImageのデータをPygameのSurfaceに変換
-    image_data = qimage.bits().asstring(qimage.sizeInBytes())
-    pygame_surface = pygame.image.fromstring(image_data, (width, height), 'RGBA')
-    
-    return pygame_surface
+    strip = pygame.image.frombuffer(buffer, (strip_width, height * len(texts)), _QIMAGE_PYGAME_FORMAT)
+    if len(texts) == 1:
+        return [strip]
+    return [
+        strip.subsurface((0, row * height, width, height)) if width
+        else pygame.Surface((1, 1), pygame.SRCALPHA)
+        for row, width in enumerate(widths)
+    ]
 
 class BacklogManager:
-    def __init__(self, screen, fonts, debug=False):
+    def __init__(self, screen, fonts, debug=False, store=None):
         self.screen = screen
         self.fonts = fonts
         self.debug = debug
@@ -104,10 +170,17 @@ class BacklogManager:
         
         # レイアウト設定を先に計算する必要があるため、後でフォントサイズを計算する
         
-        # バックログデータ
-        self.entries = []  # [{"speaker": "話者名", "text": "テキスト"}]
+        # バックログデータ（BacklogStore。添字で {"speaker", "text", "force_female"} を返す）
+        # store を渡さなければメモリ上だけのバックログになる
+        self.entries = store if store is not None else BacklogStore()
         self.is_showing = False
         self.scroll_position = 0
+        # 行索引（エントリごとの先頭行番号だけを持つ）と行サーフェスのキャッシュ
+        self._entry_line_starts = array('q')
+        self._line_total = 0
+        self._wrapped_entries = OrderedDict()  # エントリ番号 → 折り返し済み行
+        self._line_surface_cache = OrderedDict()
+        self._bg_surface = None
         
         # 表示設定（text_rendererと同じ）
         self.bg_color = (0, 0, 0, 180)
@@ -210,6 +283,14 @@ class BacklogManager:
 
     def _render_with_fx(self, text, qfont, color):
         """QFont 描画 + FONT_EFFECTS（影・ピクセル化・横引き）を適用して Surface を返す"""
+        cache_key = (
+            "qfont", text, qfont.family(), qfont.pointSize(), qfont.weight(), tuple(color)
+        )
+        return get_cached_glyph(
+            cache_key, lambda: self._render_with_fx_uncached(text, qfont, color)
+        )
+
+    def _render_with_fx_uncached(self, text, qfont, color):
         text_surf = render_text_with_qfont_cached(text, qfont, color)
         text_surf = self._apply_surface_fx(text_surf)
         if FONT_EFFECTS and FONT_EFFECTS.get("enable_shadow", False):
@@ -299,18 +380,75 @@ class BacklogManager:
             bool(self.entries[-1].get("force_female")) == bool(force_female)):
             return
             
-        self.entries.append({
-            "speaker": substituted_speaker or "名無し",
-            "text": substituted_text,
-            "force_female": bool(force_female),
-        })
+        self.entries.add(substituted_speaker or "名無し", substituted_text, bool(force_female))
+        self._sync_line_index()
         
         # デバッグ出力を削除（パフォーマンス向上）
+
+    def pop_entry(self):
+        """最後のエントリを取り除いて返す（行索引も合わせて縮める）"""
+        entry = self.entries.pop()
+        self._sync_line_index()
+        return entry
+
+    def _sync_line_index(self):
+        """entries の増減に合わせて行索引を追記・切り詰めする"""
+        starts = self._entry_line_starts
+        entry_count = len(self.entries)
+        # pop されたエントリ以降は索引を捨てて作り直す
+        keep = min(len(starts), entry_count, self.entries.stable_length)
+        if len(starts) > keep:
+            self._line_total = starts[keep]
+            del starts[keep:]
+            for entry_index in [i for i in self._wrapped_entries if i >= keep]:
+                del self._wrapped_entries[entry_index]
+
+        for entry_index in range(len(starts), entry_count):
+            starts.append(self._line_total)
+            self._line_total += len(self._get_entry_lines(entry_index))
+        self.entries.mark_synced()
+
+    def _get_entry_lines(self, entry_index):
+        """エントリの折り返し済み行（直近のものだけ保持する）"""
+        lines = self._wrapped_entries.get(entry_index)
+        if lines is not None:
+            self._wrapped_entries.move_to_end(entry_index)
+            return lines
+        lines = self._wrap_text(self.entries[entry_index]["text"], 26)
+        self._wrapped_entries[entry_index] = lines
+        while len(self._wrapped_entries) > _WRAPPED_ENTRY_CACHE_LIMIT:
+            self._wrapped_entries.popitem(last=False)
+        return lines
+
+    def _line_at(self, line_number):
+        """行番号 → (entry, 表示する話者名, 行テキスト)"""
+        starts = self._entry_line_starts
+        entry_index = bisect_right(starts, line_number) - 1
+        entry = self.entries[entry_index]
+        line_offset = line_number - starts[entry_index]
+        speaker = ""
+        if line_offset == 0:
+            # 話者が変更された場合のみ話者名を表示
+            if (entry_index == 0 or
+                    self.entries.speaker_key(entry_index) != self.entries.speaker_key(entry_index - 1)):
+                speaker = entry["speaker"]
+        return entry, speaker, self._get_entry_lines(entry_index)[line_offset]
     
     def _wrap_text(self, text, max_chars=26):
         """マークアップ対応折り返し"""
         return wrap_markup_text(text, max_chars)
     
+    def reset_for_event(self, store=None):
+        """別のイベントで使い回す前に、表示状態と行索引を作り直す（行サーフェスのキャッシュは残す）"""
+        self.is_showing = False
+        self.scroll_position = 0
+        if store is not None and store is self.entries:
+            return  # 同じストアを使い続けるなら行索引もそのまま使える
+        self.entries = store if store is not None else BacklogStore()
+        self._entry_line_starts = array('q')
+        self._line_total = 0
+        self._wrapped_entries = OrderedDict()
+
     def toggle_backlog(self):
         """バックログの表示/非表示を切り替え"""
         self.is_showing = not self.is_showing
@@ -343,12 +481,9 @@ class BacklogManager:
             self.scroll_position += 1
     
     def _count_total_lines(self):
-        """全エントリの総行数を計算"""
-        total_lines = 0
-        for entry in self.entries:
-            text_lines = self._wrap_text(entry["text"], 26)
-            total_lines += len(text_lines)
-        return total_lines
+        """全エントリの総行数"""
+        self._sync_line_index()
+        return self._line_total
     
     def _get_visible_lines(self):
         """表示可能な最大行数（11行固定）"""
@@ -384,90 +519,113 @@ class BacklogManager:
             return
         
         # 背景
-        bg_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        bg_surface.fill(self.bg_color)
-        self.screen.blit(bg_surface, (self.x, self.y))
+        if self._bg_surface is None:
+            self._bg_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            self._bg_surface.fill(self.bg_color)
+        self.screen.blit(self._bg_surface, (self.x, self.y))
         
         # 枠線
         pygame.draw.rect(self.screen, self.border_color, 
                         (self.x, self.y, self.width, self.height), 2)
         
-        # 全ての行を作成（話者名とテキスト行を統合）
-        all_lines = []
-        previous_speaker = None
-        previous_force_female = None
-        
-        for entry in self.entries:
-            speaker = entry["speaker"]
-            text = entry["text"]
-            text_lines = self._wrap_text(text, 26)
-            
-            # 話者が変更された場合のみ話者名を表示
-            force_female = bool(entry.get("force_female", False))
-            show_speaker = (
-                speaker != previous_speaker or force_female != previous_force_female
-            )
-            
-            # 各エントリの行情報を作成
-            for i, line in enumerate(text_lines):
-                all_lines.append({
-                    "type": "text",
-                    "speaker": speaker if (i == 0 and show_speaker) else "",  # 話者変更時の最初の行のみ話者名
-                    "text": line,
-                    "entry": entry
-                })
-            
-            previous_speaker = speaker
-            previous_force_female = force_female
-        
-        # スクロール位置に基づいて表示する行を決定（最大11行）
+        # 行索引から表示範囲 [scroll_position, scroll_position + 11) だけを描画する
+        self._sync_line_index()
         max_lines = self._get_visible_lines()
         start_line = self.scroll_position
-        end_line = min(start_line + max_lines, len(all_lines))
+        end_line = min(start_line + max_lines, self._line_total)
         
         # 描画開始位置
         current_y = self.y + self.padding + 10
+        text_x = self.x + self.padding + self.speaker_width + 60
         
-        for i in range(start_line, end_line):
-            if i >= len(all_lines):
-                break
-                
-            line_info = all_lines[i]
-            speaker = line_info["speaker"]
-            text_line = line_info["text"]
-            entry = line_info["entry"]
-            
-            # キャラクター名から色を決定
-            name_color, text_color = self.get_character_colors(
-                entry["speaker"], entry.get("force_female", False)
+        visible = [self._line_at(i) for i in range(start_line, end_line)]
+        self._prerender_visible_lines(visible)
+
+        for entry, speaker, text_line in visible:
+            name_surface, text_surface, text_offset_y = self._get_line_surfaces(
+                entry, speaker, text_line
             )
             
             # 話者名を描画（最初の行のみ）
-            if speaker and speaker.strip():
-                try:
-                    name_surface = render_text_with_qfont_cached(speaker, self.backlog_name_font, name_color)
-                    self.screen.blit(name_surface, (self.x + self.padding, current_y))
-                except Exception as e:
-                    if self.debug:
-                        print(f"話者名描画エラー: {e}, 名前: '{speaker}'")
+            if name_surface is not None:
+                self.screen.blit(name_surface, (self.x + self.padding, current_y))
             
             # テキストを描画（話者名と同じ高さ）
-            text_x = self.x + self.padding + self.speaker_width + 60
-            if text_line.strip():
-                try:
-                    if has_inline_markup(text_line):
-                        # ルビ・傍点あり: 1文字ずつトークン描画
-                        # base text はサーフェス内 ruby_h 下にあるので上シフトして Y を固定
-                        text_surface = self._render_markup_line(text_line, text_color)
-                        self.screen.blit(text_surface, (text_x, current_y - self.ruby_h))
-                    else:
-                        # 平文: QFont 一括描画 + FONT_EFFECTS 適用
-                        text_surface = self._render_with_fx(
-                            text_line, self.backlog_text_font, text_color
-                        )
-                        self.screen.blit(text_surface, (text_x, current_y))
-                except Exception as e:
-                    if self.debug:
-                        print(f"テキスト描画エラー: {e}, テキスト: '{text_line}'")
+            if text_surface is not None:
+                self.screen.blit(text_surface, (text_x, current_y + text_offset_y))
             
             current_y += self.text_line_height
+
+    def _line_cache_key(self, entry, speaker, text_line):
+        # キャラクター名から色を決定
+        name_color, text_color = self.get_character_colors(
+            entry["speaker"], entry.get("force_female", False)
+        )
+        return (speaker, text_line, name_color, text_color, font_effects_signature())
+
+    def _prerender_visible_lines(self, visible):
+        """未描画の行の話者名・平文を色ごとに1枚のストリップへまとめて描画しておく"""
+        cache = self._line_surface_cache
+        names = OrderedDict()
+        texts = OrderedDict()
+        for entry, speaker, text_line in visible:
+            key = self._line_cache_key(entry, speaker, text_line)
+            if key in cache:
+                continue
+            _, _, name_color, text_color, _ = key
+            if speaker and speaker.strip():
+                names.setdefault(name_color, []).append(speaker)
+            if text_line.strip() and not has_inline_markup(text_line):
+                texts.setdefault(text_color, []).append(text_line)
+
+        for color, batch in names.items():
+            prerender_texts_with_qfont(batch, self.backlog_name_font, color)
+        shadow = bool(FONT_EFFECTS and FONT_EFFECTS.get("enable_shadow", False))
+        shadow_batch = []
+        for color, batch in texts.items():
+            prerender_texts_with_qfont(batch, self.backlog_text_font, color)
+            if shadow:
+                shadow_batch.extend(batch)
+        if shadow_batch:
+            prerender_texts_with_qfont(shadow_batch, self.backlog_text_font, (0, 0, 0))
+
+    def _get_line_surfaces(self, entry, speaker, text_line):
+        """1行分の (話者名, 本文, 本文のYずれ) を返す。初めて表示されたときだけ描画する。"""
+        cache_key = self._line_cache_key(entry, speaker, text_line)
+        _, _, name_color, text_color, _ = cache_key
+        cached = self._line_surface_cache.get(cache_key)
+        if cached is not None:
+            self._line_surface_cache.move_to_end(cache_key)
+            return cached
+
+        name_surface = None
+        if speaker and speaker.strip():
+            try:
+                name_surface = render_text_with_qfont_cached(speaker, self.backlog_name_font, name_color)
+            except Exception as e:
+                if self.debug:
+                    print(f"話者名描画エラー: {e}, 名前: '{speaker}'")
+
+        text_surface = None
+        text_offset_y = 0
+        if text_line.strip():
+            try:
+                if has_inline_markup(text_line):
+                    # ルビ・傍点あり: 1文字ずつトークン描画
+                    # base text はサーフェス内 ruby_h 下にあるので上シフトして Y を固定
+                    text_surface = self._render_markup_line(text_line, text_color)
+                    text_offset_y = -self.ruby_h
+                else:
+                    # 平文: QFont 一括描画 + FONT_EFFECTS 適用
+                    text_surface = self._render_with_fx(
+                        text_line, self.backlog_text_font, text_color
+                    )
+            except Exception as e:
+                if self.debug:
+                    print(f"テキスト描画エラー: {e}, テキスト: '{text_line}'")
+
+        surfaces = (name_surface, text_surface, text_offset_y)
+        self._line_surface_cache[cache_key] = surfaces
+        while len(self._line_surface_cache) > _LINE_SURFACE_CACHE_LIMIT:
+            self._line_surface_cache.popitem(last=False)
+        return surfaces
@@ -0,0 +1,274 @@
+"""
+dialogue/backlog_store.py
+バックログのコンパクトな保存領域
+
+- 直近 memory_entries 件だけを __slots__ レコードのリングバッファに持つ
+- 話者名は話者テーブルに intern し、エントリ側は番号だけを持つ
+- spill_path を指定すると全エントリを追記専用ファイル（1行1JSON）に書き出し、
+  リングから外れた古いエントリは参照されたときにページ単位で読み戻す
+
+spill_path は data/current_state/ 以下に置くので、セーブ／ロードでも引き継がれる。
+最後に読み書きした時のファイルの大きさと更新時刻を覚えておき、is_current() で
+ロードによる差し替えを見分ける（変わっていなければ読み直さずにそのまま使える）。
+"""
+
+import json
+import os
+from array import array
+from collections import OrderedDict
+
+from core.config import BACKLOG_MEMORY_ENTRIES, BACKLOG_STATE_FILENAME
+from core.path_utils import get_project_root
+
+# 読み戻しの単位（エントリ数）と、保持するページ数
+_READBACK_PAGE_SIZE = 64
+_READBACK_PAGE_LIMIT = 8
+
+
+def get_backlog_state_path():
+    """セーブ対象のバックログファイル（data/current_state/ 以下）のパス"""
+    return os.path.join(get_project_root(), "data", "current_state", BACKLOG_STATE_FILENAME)
+
+
+class BacklogRecord:
+    """リングに置く1エントリ"""
+    __slots__ = ("index", "speaker_id", "text", "force_female")
+
+    def __init__(self, index, speaker_id, text, force_female):
+        self.index = index
+        self.speaker_id = speaker_id
+        self.text = text
+        self.force_female = force_female
+
+
+class BacklogStore:
+    """バックログエントリ列。list と同じく len・添字・スライス・pop で扱える。
+
+    添字で返すのは {"speaker", "text", "force_female"} の新しい dict。
+    """
+
+    def __init__(self, spill_path=None, memory_entries=BACKLOG_MEMORY_ENTRIES):
+        self.spill_path = spill_path
+        # ファイルに逃がせないときはリングを使わず全件をメモリに持つ
+        self.memory_entries = max(1, int(memory_entries)) if spill_path else None
+        self.speakers = []
+        self._speaker_ids = {}
+        # 全エントリ分の小さな列（話者番号・女性フラグ・ファイル上の位置）
+        self._speaker_column = array('I')
+        self._female_column = bytearray()
+        self._offsets = array('q')
+        self._ring = [None] * self.memory_entries if self.memory_entries else []
+        self._pages = OrderedDict()
+        # mark_synced() 以降も中身が変わっていない先頭エントリ数（索引側の切り詰め判定用）
+        self.stable_length = 0
+        self._file_state = None  # 最後に読み書きした時の (大きさ, 更新時刻)
+        if spill_path:
+            self._load_spill_file()
+            self._remember_file_state()
+
+    # ─── 追加・削除 ─────────────────────────────────────────────
+
+    def add(self, speaker, text, force_female=False):
+        """エントリを末尾に追加し、ファイルにも追記する"""
+        index = len(self._speaker_column)
+        speaker_id = self._intern(speaker)
+        force_female = bool(force_female)
+        offset = -1
+        if self.spill_path:
+            line = json.dumps(
+                {"speaker": speaker, "text": text, "force_female": force_female},
+                ensure_ascii=False,
+            )
+            offset = self._append_line(line)
+        self._speaker_column.append(speaker_id)
+        self._female_column.append(force_female)
+        self._offsets.append(offset)
+        self._store_record(BacklogRecord(index, speaker_id, text, force_female))
+
+    def pop(self):
+        """最後のエントリを取り除いて返す（ファイルもその手前まで切り詰める）"""
+        if not self._speaker_column:
+            raise IndexError("pop from empty backlog")
+        index = len(self._speaker_column) - 1
+        entry = self[index]
+        offset = self._offsets.pop()
+        self._speaker_column.pop()
+        self._female_column.pop()
+        if self.memory_entries:
+            slot = index % self.memory_entries
+            if self._ring[slot] is not None and self._ring[slot].index == index:
+                self._ring[slot] = None
+        else:
+            self._ring.pop()
+        self._pages.pop(index // _READBACK_PAGE_SIZE, None)
+        self.stable_length = min(self.stable_length, index)
+        if self.spill_path and offset >= 0 and os.path.exists(self.spill_path):
+            with open(self.spill_path, "r+b") as handle:
+                handle.truncate(offset)
+            self._remember_file_state()
+        return entry
+
+    def clear(self):
+        """全エントリを消す（ファイルも空にする）"""
+        self.speakers = []
+        self._speaker_ids = {}
+        self._speaker_column = array('I')
+        self._female_column = bytearray()
+        self._offsets = array('q')
+        self._ring = [None] * self.memory_entries if self.memory_entries else []
+        self._pages.clear()
+        self.stable_length = 0
+        if self.spill_path and os.path.exists(self.spill_path):
+            open(self.spill_path, "wb").close()
+            self._remember_file_state()
+
+    def mark_synced(self):
+        """現在の全エントリを索引済みとして記録する"""
+        self.stable_length = len(self)
+
+    def is_current(self):
+        """ファイルが最後に読み書きした時のままなら True（メモリだけのストアは常に True）
+
+        セーブのロードで差し替わっていれば False になるので、そのときだけ開き直せばよい。
+        """
+        if not self.spill_path:
+            return True
+        return self._file_state == self._stat_file()
+
+    # ─── 参照 ───────────────────────────────────────────────────
+
+    def __len__(self):
+        return len(self._speaker_column)
+
+    def __bool__(self):
+        return bool(self._speaker_column)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("backlog index out of range")
+        record = self._record(index)
+        return {
+            "speaker": self.speakers[record.speaker_id],
+            "text": record.text,
+            "force_female": record.force_female,
+        }
+
+    def speaker_key(self, index):
+        """話者名表示の切り替え判定用 (話者番号, 女性フラグ)。本文は読まない。"""
+        return self._speaker_column[index], bool(self._female_column[index])
+
+    def resident_count(self):
+        """本文をメモリに持っているエントリ数（リング＋読み戻しページ）"""
+        resident = sum(record is not None for record in self._ring)
+        return resident + sum(len(page) for page in self._pages.values())
+
+    # ─── 内部処理 ───────────────────────────────────────────────
+
+    def _intern(self, speaker):
+        speaker_id = self._speaker_ids.get(speaker)
+        if speaker_id is None:
+            speaker_id = len(self.speakers)
+            self.speakers.append(speaker)
+            self._speaker_ids[speaker] = speaker_id
+        return speaker_id
+
+    def _store_record(self, record):
+        if self.memory_entries:
+            self._ring[record.index % self.memory_entries] = record
+        else:
+            self._ring.append(record)
+
+    def _record(self, index):
+        if not self.memory_entries:
+            return self._ring[index]
+        record = self._ring[index % self.memory_entries]
+        if record is not None and record.index == index:
+            return record
+        return self._read_back(index)
+
+    def _read_back(self, index):
+        """リング外のエントリをファイルからページ単位で読み戻す"""
+        page_no = index // _READBACK_PAGE_SIZE
+        page = self._pages.get(page_no)
+        if page is None:
+            page = self._read_page(page_no)
+            self._pages[page_no] = page
+            while len(self._pages) > _READBACK_PAGE_LIMIT:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_no)
+        return page[index - page_no * _READBACK_PAGE_SIZE]
+
+    def _read_page(self, page_no):
+        start = page_no * _READBACK_PAGE_SIZE
+        end = min(start + _READBACK_PAGE_SIZE, len(self))
+        records = []
+        with open(self.spill_path, "rb") as handle:
+            handle.seek(self._offsets[start])
+            for index in range(start, end):
+                data = json.loads(handle.readline().decode("utf-8"))
+                records.append(BacklogRecord(
+                    index,
+                    self._speaker_column[index],
+                    data["text"],
+                    bool(self._female_column[index]),
+                ))
+        return records
+
+    def _append_line(self, line):
+        directory = os.path.dirname(self.spill_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.spill_path, "ab") as handle:
+            offset = handle.tell()
+            handle.write(line.encode("utf-8") + b"\n")
+        self._remember_file_state()
+        return offset
+
+    def _stat_file(self):
+        try:
+            stat = os.stat(self.spill_path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _remember_file_state(self):
+        self._file_state = self._stat_file()
+
+    def _load_spill_file(self):
+        """既存のファイル（前回のプレイやロードしたセーブ）から索引とリングを作る"""
+        if not os.path.exists(self.spill_path):
+            return
+        offset = 0
+        valid_end = 0
+        with open(self.spill_path, "rb") as handle:
+            for raw in handle:
+                line_offset = offset
+                offset += len(raw)
+                if not raw.endswith(b"\n"):
+                    break  # 書き込み途中で終わった行は捨てる
+                try:
+                    data = json.loads(raw.decode("utf-8"))
+                except ValueError:
+                    break
+                index = len(self._speaker_column)
+                speaker_id = self._intern(data.get("speaker"))
+                force_female = bool(data.get("force_female", False))
+                self._speaker_column.append(speaker_id)
+                self._female_column.append(force_female)
+                self._offsets.append(line_offset)
+                self._store_record(
+                    BacklogRecord(index, speaker_id, data.get("text", ""), force_female)
+                )
+                valid_end = offset
+        if valid_end < offset:
+            with open(self.spill_path, "r+b") as handle:
+                handle.truncate(valid_end)
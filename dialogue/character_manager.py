@@ -2,6 +2,16 @@ import pygame
 import random
 from collections import OrderedDict
 from core.config import *
+from .stage_compositor import mark_stage_dirty
+from .zoom_mipmap import quantize_zoom, scale_from_mipmap
+
+# numpyの条件付きインポート（無い環境ではクロスフェードの重み付けをblitで行う）
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 # 画像スケーリングキャッシュ
 _SCALED_IMAGE_CACHE_LIMIT = 100
@@ -9,11 +19,28 @@ _scaled_image_cache = OrderedDict()
 _opaque_bounds_cache = OrderedDict()
 _PREMULTIPLIED_CROP_CACHE_LIMIT = 12
 _premultiplied_crop_cache = OrderedDict()
+# クロスフェード中の画像の組ごとの作業バッファ
+_CROSSFADE_BUFFER_LIMIT = 4
+_crossfade_buffers = OrderedDict()
+# 胴体＋顔パーツを1枚に平坦化した立ち絵のキャッシュ（サーフェスのバイト数で上限管理）
+_CHARACTER_COMPOSITE_CACHE_BYTES = 64 * 1024 * 1024
+_character_composite_cache = OrderedDict()
+_character_composite_cache_bytes = 0
+
+# 顔パーツの描画順（render_face_parts と同じ）
+FACE_PART_ORDER = ('brow', 'eye', 'mouth', 'cheek', 'effect', 'accessory')
 
-def get_scaled_image(image, zoom_scale):
-    """画像をキャッシュ付きでスケーリング"""
+def get_scaled_image(image, zoom_scale, animated=False):
+    """画像をキャッシュ付きでスケーリング
+
+    animated=True（ズームのトゥイーン中）はミップマップから拡縮し、このキャッシュには入れない。
+    """
     if zoom_scale == 1.0:
         return image
+    if animated:
+        return scale_from_mipmap(
+            image, (int(image.get_width() * zoom_scale), int(image.get_height() * zoom_scale))
+        )
 
     # Surface自体をキーとして保持する。id(image)だけを使うと、元Surfaceが
     # 解放された後に同じidが別画像へ再利用され、誤った拡大画像を返し得る。
@@ -41,9 +68,131 @@ def _blit_with_alpha(screen, image, pos, alpha):
     if alpha >= 255:
         screen.blit(image, pos)
         return
-    temp = image.copy()
-    temp.set_alpha(alpha)
-    screen.blit(temp, pos)
+    # コピーに set_alpha するのと同じ結果を、元 Surface の全体アルファを
+    # blit の間だけ書き換えて得る（フェード中も毎フレームの確保なし）
+    previous_alpha = image.get_alpha()
+    image.set_alpha(alpha)
+    try:
+        screen.blit(image, pos)
+    finally:
+        image.set_alpha(previous_alpha)
+
+def _get_opaque_bounds(image):
+    bounds = _opaque_bounds_cache.get(image)
+    if bounds is not None:
+        _opaque_bounds_cache.move_to_end(image)
+        return bounds
+    bounds = image.get_bounding_rect(min_alpha=1)
+    _opaque_bounds_cache[image] = bounds
+    while len(_opaque_bounds_cache) > _SCALED_IMAGE_CACHE_LIMIT:
+        _opaque_bounds_cache.popitem(last=False)
+    return bounds
+
+def _get_premultiplied_crop(image, bounds):
+    premultiplied = _premultiplied_crop_cache.get(image)
+    if premultiplied is not None:
+        _premultiplied_crop_cache.move_to_end(image)
+        return premultiplied
+    # premul_alpha() requires a contiguous surface here. Calling it
+    # directly on a pitched subsurface can produce horizontal corruption.
+    premultiplied = image.subsurface(bounds).copy().premul_alpha()
+    _premultiplied_crop_cache[image] = premultiplied
+    while len(_premultiplied_crop_cache) > _PREMULTIPLIED_CROP_CACHE_LIMIT:
+        _premultiplied_crop_cache.popitem(last=False)
+    return premultiplied
+
+def _pixel_bytes(pixels2d):
+    """pixels2d の (w, h) uint32 ビューを (h, w, 4) のバイト列ビューにする"""
+    width, height = pixels2d.shape
+    return pixels2d.T.view(np.uint8).reshape(height, width, 4)
+
+class _CrossfadeBuffers:
+    """1組のクロスフェードで毎フレーム使い回す合成先と作業領域。
+
+    sources は [(乗算済みクロップ, 合成範囲内の位置, 重みの番号)]。重み付き和は
+    BLEND_RGBA_MULT → BLEND_RGBA_ADD と同じ丸め（(c * w + 255) >> 8 の飽和加算）で計算する。
+    """
+
+    def __init__(self, sources, size):
+        self.blended = pygame.Surface(size, pygame.SRCALPHA, sources[0][0])
+        self.sources = [
+            (crop if crop.get_masks() == self.blended.get_masks() else crop.convert(self.blended), offset)
+            for crop, offset, _ in sources
+        ]
+        self.weight_slots = [slot for _, _, slot in sources]
+        self.layers = None
+        if NUMPY_AVAILABLE:
+            width, height = size
+            self.layers = np.zeros((len(sources), height, width, 4), np.uint16)
+            for layer, (crop, (x, y)) in zip(self.layers, self.sources):
+                crop_pixels = pygame.surfarray.pixels2d(crop)
+                layer[y:y + crop.get_height(), x:x + crop.get_width()] = _pixel_bytes(crop_pixels)
+                del crop_pixels
+            self.accumulator = np.empty((height, width, 4), np.uint16)
+            self.scratch = np.empty_like(self.accumulator)
+        else:
+            self.weighted = [pygame.Surface(crop.get_size(), pygame.SRCALPHA, crop) for crop, _ in self.sources]
+
+    def render(self, weights):
+        """weights（0〜255、番号順）で重み付けした乗算済みの合成結果を blended に書く"""
+        weights = [weights[slot] for slot in self.weight_slots]
+        if self.layers is not None:
+            accumulator = self.accumulator
+            for index, (layer, weight) in enumerate(zip(self.layers, weights)):
+                target = accumulator if index == 0 else self.scratch
+                np.multiply(layer, weight, out=target)
+                target += 255
+                target >>= 8
+                if index:
+                    accumulator += target
+            np.minimum(accumulator, 255, out=accumulator)
+            pixels = pygame.surfarray.pixels2d(self.blended)
+            np.copyto(_pixel_bytes(pixels), accumulator, casting='unsafe')
+            del pixels
+            return self.blended
+
+        self.blended.fill((0, 0, 0, 0))
+        for (crop, offset), weighted, weight in zip(self.sources, self.weighted, weights):
+            weighted.fill((weight, weight, weight, weight))
+            weighted.blit(crop, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            self.blended.blit(weighted, offset, special_flags=pygame.BLEND_RGBA_ADD)
+        return self.blended
+
+def _get_crossfade_buffers(from_image, to_image, offset):
+    """フェード中の画像の組（と相対位置）ごとの作業バッファを返す。
+
+    戻り値は (バッファ, from_pos から見た合成範囲) で、透明な組なら (None, None)。
+    """
+    key = (from_image, to_image, offset)
+    cached = _crossfade_buffers.get(key)
+    if cached is not None:
+        _crossfade_buffers.move_to_end(key)
+        return cached
+
+    placed = []
+    for slot, (image, position) in enumerate(((from_image, (0, 0)), (to_image, offset))):
+        bounds = _get_opaque_bounds(image)
+        if bounds.width > 0 and bounds.height > 0:
+            placed.append((_get_premultiplied_crop(image, bounds), bounds.move(position), slot))
+    if not placed:
+        cached = (None, None)
+    else:
+        union = placed[0][1].unionall([rect for _, rect, _ in placed[1:]])
+        sources = [(crop, (rect.x - union.x, rect.y - union.y), slot) for crop, rect, slot in placed]
+        cached = (_CrossfadeBuffers(sources, union.size), union)
+    _crossfade_buffers[key] = cached
+    while len(_crossfade_buffers) > _CROSSFADE_BUFFER_LIMIT:
+        _crossfade_buffers.popitem(last=False)
+    return cached
+
+def release_finished_crossfades(game_state):
+    """胴体のクロスフェードが1つも残っていなければ作業バッファ（uint16 の層・合成先・クロップ）を捨てる"""
+    if not _crossfade_buffers:
+        return
+    for part_map in game_state.get('character_part_fades', {}).values():
+        if 'torso' in part_map:
+            return
+    _crossfade_buffers.clear()
 
 def _blit_crossfade(screen, from_image, from_pos, to_image, to_pos, progress):
     """Blend two alpha surfaces linearly without dimming the overlap."""
@@ -62,83 +211,124 @@ def _blit_crossfade(screen, from_image, from_pos, to_image, to_pos, progress):
         screen.blit(to_image, to_pos)
         return
 
-    def get_opaque_bounds(image):
-        bounds = _opaque_bounds_cache.get(image)
-        if bounds is not None:
-            _opaque_bounds_cache.move_to_end(image)
-            return bounds
-        bounds = image.get_bounding_rect(min_alpha=1)
-        _opaque_bounds_cache[image] = bounds
-        while len(_opaque_bounds_cache) > _SCALED_IMAGE_CACHE_LIMIT:
-            _opaque_bounds_cache.popitem(last=False)
-        return bounds
+    # Normal source-over blending makes the background contribute up to 25%
+    # halfway through a crossfade. Build the weighted, premultiplied result on
+    # a transparent surface first so old/new weights remain (1-p)/p.
+    # The buffers live for the whole fade, so a frame only re-weights them.
+    offset = (to_pos[0] - from_pos[0], to_pos[1] - from_pos[1])
+    buffers, union = _get_crossfade_buffers(from_image, to_image, offset)
+    if buffers is None:
+        return
+    blended = buffers.render((round(255 * (1.0 - progress)), round(255 * progress)))
+    screen.blit(
+        blended,
+        (from_pos[0] + union.x, from_pos[1] + union.y),
+        special_flags=pygame.BLEND_PREMULTIPLIED,
+    )
 
-    def get_premultiplied_crop(image, bounds):
-        premultiplied = _premultiplied_crop_cache.get(image)
-        if premultiplied is not None:
-            _premultiplied_crop_cache.move_to_end(image)
-            return premultiplied
-        # premul_alpha() requires a contiguous surface here. Calling it
-        # directly on a pitched subsurface can produce horizontal corruption.
-        premultiplied = image.subsurface(bounds).copy().premul_alpha()
-        _premultiplied_crop_cache[image] = premultiplied
-        while len(_premultiplied_crop_cache) > _PREMULTIPLIED_CROP_CACHE_LIMIT:
-            _premultiplied_crop_cache.popitem(last=False)
-        return premultiplied
+def _premultiplied_copy(image):
+    # subsurface のままだと premul_alpha() が行ピッチを取り違えるので連続領域にコピーする
+    if image.get_parent() is not None:
+        image = image.copy()
+    return image.premul_alpha()
 
-    from_bounds = get_opaque_bounds(from_image)
-    to_bounds = get_opaque_bounds(to_image)
-    weighted_sources = []
-    if from_bounds.width > 0 and from_bounds.height > 0:
-        weighted_sources.append(
-            (from_image, from_bounds, from_bounds.move(from_pos), 1.0 - progress)
-        )
-    if to_bounds.width > 0 and to_bounds.height > 0:
-        weighted_sources.append(
-            (to_image, to_bounds, to_bounds.move(to_pos), progress)
+def _build_character_composite(layers):
+    """(Surface, (x, y)) の列を描画順に重ね、乗算済みアルファの1枚にする。
+
+    戻り値は (合成 Surface, 左上オフセット)。透明な余白は切り落とす。
+    """
+    bounds = None
+    for image, (x, y) in layers:
+        rect = pygame.Rect(int(x), int(y), image.get_width(), image.get_height())
+        bounds = rect if bounds is None else bounds.union(rect)
+    composite = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    for image, (x, y) in layers:
+        composite.blit(
+            _premultiplied_copy(image),
+            (int(x) - bounds.x, int(y) - bounds.y),
+            special_flags=pygame.BLEND_PREMULTIPLIED,
         )
-    if not weighted_sources:
-        return
+    opaque = composite.get_bounding_rect(min_alpha=1)
+    if opaque.size != composite.get_size() and opaque.width > 0 and opaque.height > 0:
+        composite = composite.subsurface(opaque).copy()
+    else:
+        opaque = pygame.Rect(0, 0, *composite.get_size())
+    return composite, (bounds.x + opaque.x, bounds.y + opaque.y)
 
-    blend_rect = weighted_sources[0][2].copy()
-    for _, _, destination_rect, _ in weighted_sources[1:]:
-        blend_rect.union_ip(destination_rect)
-    blend_rect = blend_rect.clip(screen.get_clip())
-    if blend_rect.width <= 0 or blend_rect.height <= 0:
-        return
+def _surface_bytes(surface):
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
 
-    # Normal source-over blending makes the background contribute up to 25%
-    # halfway through a crossfade. Build the weighted, premultiplied result on
-    # a transparent surface first so old/new weights remain (1-p)/p.
-    blended = pygame.Surface(blend_rect.size, pygame.SRCALPHA)
+def _store_character_composite(key, entry):
+    global _character_composite_cache_bytes
+    previous = _character_composite_cache.pop(key, None)
+    if previous is not None:
+        _character_composite_cache_bytes -= _surface_bytes(previous[0])
+    _character_composite_cache[key] = entry
+    _character_composite_cache_bytes += _surface_bytes(entry[0])
+    while _character_composite_cache_bytes > _CHARACTER_COMPOSITE_CACHE_BYTES and len(_character_composite_cache) > 1:
+        _, (evicted, _, _) = _character_composite_cache.popitem(last=False)
+        _character_composite_cache_bytes -= _surface_bytes(evicted)
 
-    def add_weighted(image, source_bounds, destination_rect, weight):
-        visible_rect = destination_rect.clip(blend_rect)
-        if visible_rect.width <= 0 or visible_rect.height <= 0:
-            return
-        source_rect = pygame.Rect(
-            source_bounds.x + visible_rect.x - destination_rect.x,
-            source_bounds.y + visible_rect.y - destination_rect.y,
-            visible_rect.width,
-            visible_rect.height,
-        )
-        premultiplied = get_premultiplied_crop(image, source_bounds)
-        crop_rect = source_rect.move(-source_bounds.x, -source_bounds.y)
-        weighted = premultiplied.subsurface(crop_rect).copy()
-        channel_weight = round(255 * weight)
-        weighted.fill(
-            (channel_weight, channel_weight, channel_weight, channel_weight),
-            special_flags=pygame.BLEND_RGBA_MULT,
-        )
-        blended.blit(
-            weighted,
-            (visible_rect.x - blend_rect.x, visible_rect.y - blend_rect.y),
-            special_flags=pygame.BLEND_RGBA_ADD,
-        )
+def clear_character_composite_cache():
+    """平坦化済み立ち絵のキャッシュを破棄する"""
+    global _character_composite_cache_bytes
+    _character_composite_cache.clear()
+    _character_composite_cache_bytes = 0
+
+def _get_part_layout(image_manager, part_type, part_id):
+    """顔パーツの (Surface, 元キャンバス上の位置, キャンバスサイズ)。無ければ None。
+
+    ImageManager は顔パーツの透明な余白を切り詰めて持つので、位置はそのオフセットを使う。
+    get_image_layout を持たない画像管理では画像全体をキャンバスとみなす。
+    """
+    get_layout = getattr(image_manager, 'get_image_layout', None)
+    if get_layout is not None:
+        return get_layout(part_type, part_id)
+    part_img = image_manager.get_image(part_type, part_id)
+    return (part_img, (0, 0), part_img.get_size()) if part_img else None
+
+def _part_position(center_x, center_y, layout, zoom):
+    """胴体の中心に揃えた元キャンバス上で、切り詰めたパーツを置く左上座標"""
+    _, (offset_x, offset_y), (canvas_width, canvas_height) = layout
+    return (
+        center_x - int(canvas_width * zoom) // 2 + round(offset_x * zoom),
+        center_y - int(canvas_height * zoom) // 2 + round(offset_y * zoom),
+    )
 
-    for weighted_source in weighted_sources:
-        add_weighted(*weighted_source)
-    screen.blit(blended, blend_rect.topleft, special_flags=pygame.BLEND_PREMULTIPLIED)
+def get_character_composite(image_manager, torso_id, part_ids, final_zoom):
+    """胴体と顔パーツ（FACE_PART_ORDER 順の ID）を平坦化した (Surface, オフセット) を返す。
+
+    キーは表情の組（まばたき中は閉じ目の ID）と最終ズーム。元画像が差し替わって
+    いたら作り直す。胴体が無ければ None。
+    """
+    torso_img = image_manager.get_image("torso", torso_id)
+    if not torso_img:
+        return None
+    part_layouts = [
+        _get_part_layout(image_manager, part_type, part_id) if part_id else None
+        for part_type, part_id in zip(FACE_PART_ORDER, part_ids)
+    ]
+    sources = (torso_img,) + tuple(layout[0] if layout else None for layout in part_layouts)
+    key = (torso_id, tuple(part_ids), final_zoom)
+    cached = _character_composite_cache.get(key)
+    if cached is not None and all(a is b for a, b in zip(cached[2], sources)):
+        _character_composite_cache.move_to_end(key)
+        return cached[0], cached[1]
+
+    scaled_torso = get_scaled_image(torso_img, final_zoom)
+    # render_face_parts と同じく、パーツは胴体の中心に揃える
+    center_x = (torso_img.get_width() * final_zoom) // 2
+    center_y = (torso_img.get_height() * final_zoom) // 2
+    layers = [(scaled_torso, (0, 0))]
+    for layout in part_layouts:
+        if layout:
+            layers.append((
+                get_scaled_image(layout[0], final_zoom),
+                _part_position(center_x, center_y, layout, final_zoom),
+            ))
+    composite, offset = _build_character_composite(layers)
+    _store_character_composite(key, (composite, offset, sources))
+    return composite, offset
 
 def start_character_part_fade(game_state, character_name, part_type, from_id, to_id, duration_ms):
     if duration_ms <= 0:
@@ -427,6 +617,7 @@ def update_blink_animation(game_state, character_name, current_time):
         # まばたき用の一時的な目の情報を削除
         if 'eye_blink' in game_state['character_expressions'][character_name]:
             del game_state['character_expressions'][character_name]['eye_blink']
+            mark_stage_dirty(game_state)
         # 次のまばたき時間を設定（3-6秒後）
         game_state['character_blink_timers'][character_name] = current_time + random.randint(3000, 6000)
         print(f"[BLINK] {character_name}: まばたき完了 - 次回予定: {(game_state['character_blink_timers'][character_name] - current_time) / 1000:.1f}秒後")
@@ -440,8 +631,10 @@ def update_blink_animation(game_state, character_name, current_time):
     if character_name not in game_state['character_expressions']:
         game_state['character_expressions'][character_name] = {}
     
-    # まばたき中の目の表情を設定
-    game_state['character_expressions'][character_name]['eye_blink'] = current_eye_type
+    # まばたき中の目の表情を設定（コマが変わったときだけステージを描き直す）
+    if game_state['character_expressions'][character_name].get('eye_blink') != current_eye_type:
+        game_state['character_expressions'][character_name]['eye_blink'] = current_eye_type
+        mark_stage_dirty(game_state)
 
 def update_character_animations(game_state):
     """キャラクターアニメーションを更新する"""
@@ -497,8 +690,9 @@ def update_character_fades(game_state):
             hide_pending.pop(char_name, None)
             hide_character(game_state, char_name)
             fades.pop(char_name, None)
+    release_finished_crossfades(game_state)
 
-def render_face_parts(game_state, char_name, brow_type, eye_type, mouth_type, cheek_type, zoom_scale, fade_map=None, current_time=None, effect_type="", accessory_type=""):
+def render_face_parts(game_state, char_name, brow_type, eye_type, mouth_type, cheek_type, zoom_scale, fade_map=None, current_time=None, effect_type="", accessory_type="", animated=False):
     """Face parts rendering with strictly unified single-layer drawing."""
     screen = game_state['screen']
     if char_name not in game_state['character_pos']:
@@ -517,20 +711,15 @@ def render_face_parts(game_state, char_name, brow_type, eye_type, mouth_type, ch
     char_center_x = character_pos[0] + actual_char_width // 2
     char_center_y = character_pos[1] + actual_char_height // 2
 
-    def draw_part_image(part_img, alpha=255):
-        part_pos = (
-            char_center_x - part_img.get_width() // 2,
-            char_center_y - part_img.get_height() // 2
-        )
-        _blit_with_alpha(screen, part_img, part_pos, alpha)
-
     def draw_part(part_type, part_id, alpha=255):
         if not part_id:
             return
-        part_img = image_manager.get_image(part_type, part_id)
-        if part_img:
-            scaled_img = get_scaled_image(part_img, zoom_scale)
-            draw_part_image(scaled_img, alpha)
+        layout = _get_part_layout(image_manager, part_type, part_id)
+        if layout:
+            # 余白を切り詰めたパーツだけを拡縮・blit する
+            scaled_img = get_scaled_image(layout[0], zoom_scale, animated)
+            part_pos = _part_position(char_center_x, char_center_y, layout, zoom_scale)
+            _blit_with_alpha(screen, scaled_img, part_pos, alpha)
 
     def draw_part_with_fade(part_type, current_id):
         fade = (fade_map or {}).get(part_type)
@@ -545,12 +734,7 @@ def render_face_parts(game_state, char_name, brow_type, eye_type, mouth_type, ch
         draw_part(part_type, fade.get('from'), round(255 * (1.0 - progress)))
         draw_part(part_type, fade.get('to'), round(255 * progress))
 
-    final_eye_type = eye_type
-    if char_name in game_state.get('character_blink_state', {}) and \
-       game_state['character_blink_state'][char_name].get('current_state') == 'blinking':
-        blink_eye = game_state['character_expressions'].get(char_name, {}).get('eye_blink', '')
-        if blink_eye:
-            final_eye_type = blink_eye
+    final_eye_type = _resolve_eye_type(game_state, char_name, eye_type)
 
     # 統一レイヤー順描画 (各スロット1枚のみ)
     draw_part_with_fade('brow', brow_type)
@@ -561,6 +745,22 @@ def render_face_parts(game_state, char_name, brow_type, eye_type, mouth_type, ch
     draw_part_with_fade('effect', effect_type)
     draw_part_with_fade('accessory', accessory_type)
 
+def _resolve_eye_type(game_state, char_name, eye_type):
+    """まばたき中なら閉じ目の ID を返す"""
+    if char_name in game_state.get('character_blink_state', {}) and \
+       game_state['character_blink_state'][char_name].get('current_state') == 'blinking':
+        blink_eye = game_state['character_expressions'].get(char_name, {}).get('eye_blink', '')
+        if blink_eye:
+            return blink_eye
+    return eye_type
+
+def _current_part_ids(game_state, char_name):
+    """FACE_PART_ORDER 順の現在のパーツ ID（目はまばたきを反映）"""
+    expressions = game_state['character_expressions'].get(char_name, {})
+    part_ids = [expressions.get(part_type, '') for part_type in FACE_PART_ORDER]
+    part_ids[1] = _resolve_eye_type(game_state, char_name, part_ids[1])
+    return tuple(part_ids)
+
 def draw_characters(game_state):
     """Draw characters with optional part fades."""
     current_dialogue = game_state['dialogue_data'][game_state['current_paragraph']] if game_state['dialogue_data'] else None
@@ -573,6 +773,8 @@ def draw_characters(game_state):
         current_speaker = current_dialogue[1] if current_dialogue and len(current_dialogue) > 1 else None
     image_manager = game_state['image_manager']
     screen = game_state['screen']
+    # フェードは表示コマンドやスキップでも打ち切られるので、描画のたびに確かめる
+    release_finished_crossfades(game_state)
 
     for char_name in game_state['active_characters']:
         if char_name not in game_state['character_pos']:
@@ -590,6 +792,22 @@ def draw_characters(game_state):
 
         x, y = game_state['character_pos'][char_name]
         zoom_scale = game_state['character_zoom'].get(char_name, 1.0)
+        anim = game_state.get('character_anim', {}).get(char_name)
+        animated = bool(anim) and anim.get('start_zoom') != anim.get('target_zoom')
+        if animated:
+            # ズームのトゥイーン中は段に丸め、胴体も顔パーツも同じ段で描く
+            zoom_scale = quantize_zoom(zoom_scale)
+
+        # パーツのフェードや移動・ズーム中でなければ、平坦化済みの1枚を blit するだけ
+        if game_state['show_face_parts'] and not fade_map and not anim:
+            final_zoom = zoom_scale * (VIRTUAL_HEIGHT / char_img.get_height()) * SCALE
+            composite = get_character_composite(
+                image_manager, torso_id, _current_part_ids(game_state, char_name), final_zoom
+            )
+            if composite:
+                surface, (offset_x, offset_y) = composite
+                screen.blit(surface, (x + offset_x, y + offset_y), special_flags=pygame.BLEND_PREMULTIPLIED)
+                continue
 
         def get_torso_image(torso_key):
             torso_img = image_manager.get_image("torso", torso_key)
@@ -597,7 +815,7 @@ def draw_characters(game_state):
                 return None
             base_scale = VIRTUAL_HEIGHT / torso_img.get_height()
             final_zoom = zoom_scale * base_scale * SCALE
-            return get_scaled_image(torso_img, final_zoom)
+            return get_scaled_image(torso_img, final_zoom, animated)
 
         torso_fade = fade_map.get('torso')
         if torso_fade:
@@ -641,5 +859,6 @@ def draw_characters(game_state):
                 current_time=current_time,
                 effect_type=effect_type,
                 accessory_type=accessory_type,
+                animated=animated,
             )
 
@@ -1,7 +1,7 @@
 ﻿import pygame
 import os
 from core.config import *
-from .font_effects import get_grid_char_width, render_text_with_effects
+from .font_effects import get_grid_char_width, load_baked_glyph_atlas, render_text_with_effects
 from .name_manager import get_name_manager
 from PyQt5.QtGui import QFont, QFontDatabase
 from PyQt5.QtWidgets import QApplication
@@ -16,6 +16,8 @@ class ChoiceRenderer:
             init_qt_application()
         
         # フォント設定 (text_rendererと同じフォント使用)
+        # _init_fonts が MPLUS1p-Medium を読めたときだけ True にする
+        self._medium_font_file_loaded = False
         self.fonts = self._init_fonts()
         self.text_color = TEXT_COLOR
         self.text_color_female = TEXT_COLOR_FEMALE
@@ -36,6 +38,11 @@ class ChoiceRenderer:
         self.pygame_fonts = {
             "text": self.fonts["text_pygame"]
         }
+        # 事前に焼いた縁取りグリフを登録（本文と同じフォント・サイズ）
+        if self._medium_font_file_loaded:
+            load_baked_glyph_atlas(
+                self.pygame_fonts["text"], "MPLUS1p-Medium.ttf", FONT_TEXT_SIZE, kinds=("effects",)
+            )
         
         # 選択肢の状態
         self.choices = []
@@ -44,6 +51,9 @@ class ChoiceRenderer:
         self.is_showing_choices = False
         self.selected_choice = -1
         self.last_selected_text = None  # 最後に選択されたテキスト
+        # show_choices で描画済みの (通常, ハイライト) サーフェスと描画位置（hide_choices まで保持）
+        self._choice_surfaces = []
+        self._choice_positions = []
         
         # 多列表示設定
         self.column_width = int(CHOICE_COLUMN_WIDTH * SCALE)
@@ -226,6 +236,7 @@ class ChoiceRenderer:
                         fonts["text_pygame"] = pygame.font.Font(
                             medium_font_path, text_font_size
                         )
+                        self._medium_font_file_loaded = True
                         fonts["default"] = pygame.font.SysFont(
                             None, default_font_size
                         )
@@ -242,6 +253,7 @@ class ChoiceRenderer:
                         
                         # Pygameフォント（ChoiceRenderer用）
                         fonts["text_pygame"] = pygame.font.Font(medium_font_path, text_font_size)
+                        self._medium_font_file_loaded = True
                         
                         if self.debug:
                             print("ChoiceRenderer: カスタムフォント読み込み成功")
@@ -309,13 +321,13 @@ class ChoiceRenderer:
         self.current_columns, self.choices_per_column = self._calculate_column_layout(len(self.choices))
         print(f"[DEBUG] レイアウト計算結果: {self.current_columns}列, 各列の選択肢数={self.choices_per_column}")
         
+        # 通常・ハイライト両方のサーフェスと座標をここで一度だけ作る
+        self._prepare_choice_surfaces()
+
         # 各選択肢の矩形を計算（多列レイアウト対応）
         for i, choice in enumerate(self.choices):
-            # グリッドシステムで選択肢をレンダリングしてサイズを取得
-            choice_surface = self._render_choice_with_grid_system(choice, self.normal_color)
-            
-            # 多列レイアウトでの座標を計算
-            x, y = self._calculate_choice_coordinates(i, choice_surface, (self.current_columns, self.choices_per_column))
+            choice_surface = self._choice_surfaces[i][0]
+            x, y = self._choice_positions[i]
             print(f"[DEBUG] 選択肢{i} '{choice}' 座標=({x}, {y})")
             
             # 当たり判定の幅を列幅に制限（複数列の場合は列幅、単列の場合は全幅）
@@ -326,11 +338,26 @@ class ChoiceRenderer:
         
         print(f"[DEBUG] 選択肢表示開始: {len(self.choices)}個の選択肢（{self.current_columns}列表示）")
     
+    def _prepare_choice_surfaces(self):
+        """各選択肢の通常・ハイライトサーフェスと描画座標を作る"""
+        column_layout = (self.current_columns, self.choices_per_column)
+        self._choice_surfaces = []
+        self._choice_positions = []
+        for i, choice in enumerate(self.choices):
+            normal_surface = self._render_choice_with_grid_system(choice, self.normal_color)
+            highlight_surface = self._render_choice_with_grid_system(choice, self.highlight_color)
+            pos_x, pos_y = self._calculate_choice_coordinates(i, normal_surface, column_layout)
+            self._choice_surfaces.append((normal_surface, highlight_surface))
+            # 座標を整数にスナップして揺れを防止
+            self._choice_positions.append((int(round(pos_x)), int(round(pos_y))))
+
     def hide_choices(self):
         """選択肢を非表示にする"""
         self.is_showing_choices = False
         self.choices = []
         self.choice_rects = []
+        self._choice_surfaces = []
+        self._choice_positions = []
         self.hovered_choice = -1
         self.selected_choice = -1
         
@@ -378,23 +405,13 @@ class ChoiceRenderer:
             return
 
         # 頻繁に呼ばれるのでログ出力しない
+        # 描画済みサーフェスを選ぶだけ（ホバーでは再描画しない）
+        if len(self._choice_surfaces) != len(self.choices):
+            self._prepare_choice_surfaces()
 
-        for i, choice in enumerate(self.choices):
-            # ハイライト色を決定
-            color = self.highlight_color if i == self.hovered_choice else self.normal_color
-
-            # グリッドシステムで選択肢を描画（text_rendererと同じ効果）
-            choice_surface = self._render_choice_with_grid_system(choice, color)
-
-            # 多列レイアウトでの座標を計算
-            pos_x, pos_y = self._calculate_choice_coordinates(i, choice_surface, (self.current_columns, self.choices_per_column))
-
-            # 座標を整数にスナップして揺れを防止
-            pos_x = int(round(pos_x))
-            pos_y = int(round(pos_y))
-
-            # 描画（ログ出力しない）
-            self.screen.blit(choice_surface, (pos_x, pos_y))
+        for i, (normal_surface, highlight_surface) in enumerate(self._choice_surfaces):
+            choice_surface = highlight_surface if i == self.hovered_choice else normal_surface
+            self.screen.blit(choice_surface, self._choice_positions[i])
     
     def is_choice_showing(self):
         """選択肢が表示中かどうかを返す"""
@@ -415,12 +432,14 @@ class ChoiceRenderer:
     def set_choice_position(self, x, y):
         """選択肢表示位置を設定（仮想座標）"""
         self.text_start_x, self.text_start_y = scale_pos(x, y)
+        self._choice_surfaces = []  # 次の render で座標ごと作り直す
         if self.debug:
             print(f"選択肢表示位置を({x}, {y})に設定")
     
     def set_choice_spacing(self, spacing):
         """選択肢間のスペーシングを設定"""
         self.choice_spacing = spacing
+        self._choice_surfaces = []
         if self.debug:
             print(f"選択肢間スペーシングを{spacing}pxに設定")
     
@@ -428,5 +447,6 @@ class ChoiceRenderer:
         """選択肢の色を設定"""
         self.normal_color = normal_color
         self.highlight_color = highlight_color
+        self._choice_surfaces = []
         if self.debug:
             print(f"選択肢色を設定: 通常={normal_color}, ハイライト={highlight_color}")
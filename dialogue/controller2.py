@@ -620,6 +620,10 @@ def update_game(game_state):
         game_state['notification_manager'].update()
 
     if game_state.get("use_ir"):
+        # 数ステップ先の立ち絵・背景をワーカースレッドで先読み
+        asset_prefetcher = game_state.get("asset_prefetcher")
+        if asset_prefetcher:
+            asset_prefetcher.update(game_state)
         text_renderer = game_state.get("text_renderer")
         if text_renderer and text_renderer.skip_mode:
             if game_state.get("ir_anim_pending"):
@@ -52,6 +52,18 @@ class DialogueLoader:
         self.loading_tasks = {}  # ファイル読み込み中のタスク管理
         self.ir_data = None  # IR skeleton (optional)
 
+    def reset_for_event(self):
+        """別のイベントで使い回す前に、選択肢の履歴を捨ててストーリーフラグを読み直す"""
+        self.load_story_flags()
+        self.choice_history = {}
+        self.current_ks_file = None
+        self.choice_counter = 0
+        self.seed_annotations = {}
+        self.ir_data = None
+        # ホームの日記など別のローダーが name_manager を付け替えていることがある
+        from .name_manager import get_name_manager
+        get_name_manager().set_dialogue_loader(self)
+
     def _wrap_text_and_count_lines(self, text):
         """テキストを26文字で自動改行し、行数を返す"""
         if not text:
@@ -10,7 +10,7 @@ SubsystemBase を継承し、既存の dialogue システム（game_state 辞書
 
 追加問題B対応:
     on_enter()  : config.OFFSET_X/Y/SCALE を退避し 0/0/1.0 にリセット
-    cleanup()   : BGM/SE 停止 + config 値を復元
+    cleanup()   : BGM/SE 停止 + config 値を復元（自前で作った DialogueServices は後始末する）
 
 参照: docs/サブシステムのクラス化計画.md フェーズ3
 """
@@ -21,18 +21,20 @@ import pygame
 from core.runtime.subsystem_base import SubsystemBase
 from dialogue.model import initialize_game as _init_game
 from dialogue.model import advance_dialogue
+from dialogue.runtime_services import DialogueServices
 
 
 class DialogueSubsystem(SubsystemBase):
     """dialogue システムの SubsystemBase ラッパー"""
 
     def __init__(self, screen: pygame.Surface, virtual_screen: pygame.Surface,
-                 event_file: str | None = None):
+                 event_file: str | None = None, services=None):
         """
         Args:
             screen:         実画面（フルスクリーン）
             virtual_screen: 仮想画面（1440x1080）。dialogue はここに描画する
             event_file:     読み込む .ks ファイルパス（省略可）
+            services:       GameApplication が持つ DialogueServices（省略時はこのイベント専用に作る）
         """
         super().__init__(screen)
         self.virtual_screen = virtual_screen
@@ -47,6 +49,17 @@ class DialogueSubsystem(SubsystemBase):
         if event_file:
             self.current_event_id = os.path.splitext(os.path.basename(event_file))[0]
 
+        # 背景＋キャラクターのステージレイヤー（変化がなければ描き直さない）
+        from dialogue.stage_compositor import StageCompositor
+        self.stage_compositor = StageCompositor()
+
+        # services を借りなかったときはこのイベント専用に作り、cleanup() で止める
+        # （画像のワーカースレッド・フォント・マニフェストを残さない）
+        self._owned_services = None
+        if services is None:
+            services = DialogueServices(save_backlog=False)
+            self._owned_services = services
+
         # 段落セーブ用の最後の保存段落インデックス (Task 2c)
         self._last_saved_paragraph: int = -2
         self._ending_bgm_deadline: int | None = None
@@ -61,7 +74,7 @@ class DialogueSubsystem(SubsystemBase):
         try:
             # Initialize from the requested event so a small specialized
             # dialogue (such as HOME_DIARY) does not preload all of E001 first.
-            self.game_state = _init_game(event_file or "events/E001.ks")
+            self.game_state = _init_game(event_file or "events/E001.ks", services)
         finally:
             # 例外発生時も必ず config を復元（⑦修正）
             _cfg.OFFSET_X, _cfg.OFFSET_Y, _cfg.SCALE = _pre_x, _pre_y, _pre_scale
@@ -138,6 +151,10 @@ class DialogueSubsystem(SubsystemBase):
         except Exception as e:
             print(f"⚠️ DialogueSubsystem cleanup 音声停止エラー: {e}")
 
+        if self._owned_services is not None:
+            self._owned_services.cleanup()
+            self._owned_services = None
+
         # 座標系を復元（on_enter() が呼ばれていない場合は何もしない）
         if self._saved_offset_x is not None:
             from core import config
@@ -246,20 +263,14 @@ class DialogueSubsystem(SubsystemBase):
 
     def render(self):
         """画面描画: 仮想画面に描画してフルスクリーンにスケーリング転送"""
-        from dialogue.background_manager import draw_background
-        from dialogue.character_manager import draw_characters
         from dialogue.fade_manager import draw_fade_overlay
         from dialogue.controller2 import draw_input_blocked_notice
         from core.config import CONTENT_WIDTH, CONTENT_HEIGHT, OFFSET_X, OFFSET_Y
 
         gs = self.game_state
 
-        # 仮想画面クリア
-        self.virtual_screen.fill((0, 0, 0))
-
-        # 背景・キャラクター・フェード
-        draw_background(gs)
-        draw_characters(gs)
+        # 背景・キャラクター（保持したステージ、画面全体を覆う）・フェード
+        self.stage_compositor.render(gs, self.virtual_screen)
         draw_fade_overlay(gs)
 
         # UI エレメント（テキストボックス等）
@@ -334,7 +345,8 @@ class DialogueSubsystem(SubsystemBase):
         from dialogue.data_normalizer import normalize_dialogue_data
 
         try:
-            loader = DialogueLoader()
+            # initialize_game のローダーを使う（選択肢の記録・name_manager と同じインスタンス）
+            loader = self.game_state.get('dialogue_loader') or DialogueLoader()
             raw = loader.load_dialogue_from_ks(event_file)
             if not raw:
                 print(f"⚠️ DialogueSubsystem: イベントファイル読み込み失敗: {event_file}")
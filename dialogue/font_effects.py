@@ -1,6 +1,158 @@
+import json
+import os
+from collections import OrderedDict
+
 import pygame
 
-from core.config import FONT_EFFECTS, TEXT_RENDERER_CONFIG
+from core.config import FONT_EFFECTS, GLYPH_ATLAS_DIR, TEXT_RENDERER_CONFIG
+from core.path_utils import get_project_root
+
+# numpyの条件付きインポート（無い環境では縁取りをblitで重ねる）
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# 縁取り・ピクセル化済みグリフのアトラス（LRU）。本文・選択肢・バックログで共用する。
+_GLYPH_ATLAS_LIMIT = 2048
+_glyph_atlas = OrderedDict()
+# tools/bake_glyph_atlas.py で事前に焼いたグリフ（LRU の対象外）
+_baked_glyphs = {}
+# 読み込み済みの焼き込みアトラス: インデックスのパス → [(文字, 色, Surface)]
+_baked_atlases = {}
+# 焼き込みグリフを登録したフォント: (インデックスのパス, 種別) → (Font, FONT_EFFECTS の署名)
+# 同じフォントファイル・サイズを別の Font で登録し直したら、古い Font の登録は外す
+_baked_fonts = {}
+
+
+def font_effects_signature():
+    """現在の FONT_EFFECTS をキャッシュキーに使えるタプルにする。"""
+    return tuple(sorted(FONT_EFFECTS.items()))
+
+
+def get_cached_glyph(cache_key, render):
+    """cache_key に対応する描画済み Surface を返す。未登録なら render() で作る。
+
+    キーには FONT_EFFECTS の内容も含めるため、効果設定を変えると自動的に
+    別エントリになる。返す Surface は共有物なので呼び出し側で書き換えないこと。
+    """
+    key = (cache_key, font_effects_signature())
+    surface = _glyph_atlas.get(key)
+    if surface is not None:
+        _glyph_atlas.move_to_end(key)
+        return surface
+    surface = _baked_glyphs.get(key)
+    if surface is not None:
+        return surface
+
+    surface = render()
+    _store_glyph(key, surface)
+    return surface
+
+
+def _store_glyph(key, surface):
+    _glyph_atlas[key] = surface
+    while len(_glyph_atlas) > _GLYPH_ATLAS_LIMIT:
+        _glyph_atlas.popitem(last=False)
+
+
+def warm_outlined_glyphs(requests):
+    """アトラス未登録のグリフをまとめて縁取りし、登録する。
+
+    requests は (cache_key, make_layers) の列。make_layers() は
+    (本文Surface, 縁取り用の黒Surface または None) を返す。
+    行単位でまとめて渡すと縁取りが1パスで済む。
+    """
+    signature = font_effects_signature()
+    pending = {}
+    for cache_key, make_layers in requests:
+        key = (cache_key, signature)
+        if key not in _glyph_atlas and key not in _baked_glyphs and key not in pending:
+            pending[key] = make_layers
+    if not pending:
+        return
+
+    surfaces = compose_outlined_glyphs([make_layers() for make_layers in pending.values()])
+    for key, surface in zip(pending, surfaces):
+        _store_glyph(key, surface)
+
+
+def clear_glyph_atlas():
+    """フォント差し替え時などにグリフアトラスを破棄する。"""
+    _glyph_atlas.clear()
+    _baked_glyphs.clear()
+    _baked_atlases.clear()
+    _baked_fonts.clear()
+
+
+def font_effects_json():
+    """焼き込みアトラスの JSON に記録する FONT_EFFECTS（タプルはリストになる）"""
+    return json.loads(json.dumps(FONT_EFFECTS))
+
+
+def get_baked_atlas_index_path(font_filename, size, atlas_dir=None):
+    """焼き込みアトラスのインデックス JSON のパス（ページ PNG は同じ場所に並ぶ）"""
+    atlas_dir = atlas_dir or os.path.join(get_project_root(), GLYPH_ATLAS_DIR)
+    stem = os.path.splitext(font_filename)[0]
+    return os.path.join(atlas_dir, f"{stem}_{size}.json")
+
+
+def load_baked_glyph_atlas(font, font_filename, size, kinds=("outline", "effects"), atlas_dir=None):
+    """焼き込み済みの縁取りグリフを font 用に登録し、登録した文字数を返す。
+
+    アトラスが無い・FONT_EFFECTS が焼いたときと違う場合は何もしない
+    （その文字は従来どおり初回表示時にラスタライズされる）。
+    同じアトラス・種別に前に登録した Font があれば、その登録は置き換える。
+    kinds は登録先のキー種別。"outline" は本文・名前、"effects" は選択肢など。
+    """
+    index_path = get_baked_atlas_index_path(font_filename, size, atlas_dir)
+    glyphs = _baked_atlases.get(index_path)
+    if glyphs is None:
+        glyphs = _read_baked_atlas(index_path)
+        if glyphs is None:
+            return 0
+        _baked_atlases[index_path] = glyphs
+
+    signature = font_effects_signature()
+    for kind in kinds:
+        previous = _baked_fonts.get((index_path, kind))
+        if previous is not None and previous[0] is not font:
+            # 前のレンダラーの Font とそのグリフを抱え続けない
+            previous_font, previous_signature = previous
+            for char, color, _ in glyphs:
+                _baked_glyphs.pop(((kind, previous_font, char, color), previous_signature), None)
+        _baked_fonts[(index_path, kind)] = (font, signature)
+        for char, color, surface in glyphs:
+            _baked_glyphs[((kind, font, char, color), signature)] = surface
+    return len(glyphs)
+
+
+def _read_baked_atlas(index_path):
+    if not os.path.exists(index_path):
+        return None
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("effects") != font_effects_json() or index.get("outline_width") != get_outline_width():
+        return None
+
+    atlas_dir = os.path.dirname(index_path)
+    pages = []
+    for page_name in index.get("pages", []):
+        page = pygame.image.load(os.path.join(atlas_dir, page_name))
+        try:
+            page = page.convert_alpha()
+        except pygame.error:
+            pass  # 表示モード未設定（ツール・テスト）ならそのまま使う
+        pages.append(page)
+    return [
+        (char, tuple(color), pages[page].subsurface((x, y, w, h)))
+        for char, color, page, x, y, w, h in index.get("glyphs", [])
+    ]
 
 
 def apply_font_effects(text_surface):
@@ -32,18 +184,121 @@ def apply_font_effects(text_surface):
 
 def render_text_with_effects(font, text, color):
     """Render text with the same black outline style as dialogue body text."""
-    text_surface = apply_font_effects(font.render(text, True, color))
+    return get_cached_glyph(
+        ("effects", font, text, tuple(color)),
+        lambda: compose_outlined_glyphs([render_effect_layers(font, text, color)])[0],
+    )
+
+
+def prerender_text_with_effects(font, texts, color):
+    """render_text_with_effects の結果を texts 分まとめてアトラスへ載せる。"""
+    warm_outlined_glyphs(
+        (
+            ("effects", font, text, tuple(color)),
+            lambda text=text: render_effect_layers(font, text, color),
+        )
+        for text in texts
+    )
 
+
+def render_effect_layers(font, text, color):
+    """本文と縁取り用の黒文字を、効果適用済みの Surface 対で返す。"""
+    text_surface = apply_font_effects(font.render(text, True, color))
     if not FONT_EFFECTS.get("enable_shadow", False):
-        return text_surface
+        return text_surface, None
+    return text_surface, apply_font_effects(font.render(text, True, (0, 0, 0)))
 
-    outline_surface = apply_font_effects(font.render(text, True, (0, 0, 0)))
+
+def get_outline_width():
     shadow_offset = FONT_EFFECTS.get("shadow_offset", (6, 6))
-    outline_width = max(
+    return max(
         2,
         min(3, int(round(max(abs(shadow_offset[0]), abs(shadow_offset[1]))) // 2)),
     )
 
+
+def compose_outlined_glyphs(layers):
+    """(本文, 縁取り用) の Surface 対の列から縁取り済みグリフの列を作る。
+
+    2文字以上は全グリフのアルファを1つの配列に積み、膨張を1パスで行う。
+    1文字だけのときは従来のblit重ねの方が速いのでそちらを使う。
+    """
+    layers = list(layers)
+    outlined = [index for index, (_, outline) in enumerate(layers) if outline is not None]
+    results = [text_surface for text_surface, _ in layers]
+    if not outlined:
+        return results
+
+    outline_width = get_outline_width()
+    if NUMPY_AVAILABLE and len(outlined) > 1:
+        alphas = dilate_outline_alpha(
+            [pygame.surfarray.pixels_alpha(layers[index][1]) for index in outlined],
+            outline_width,
+        )
+        for index, alpha in zip(outlined, alphas):
+            results[index] = _finish_outlined_glyph(layers[index][0], alpha, outline_width)
+    else:
+        for index in outlined:
+            results[index] = _compose_outline_by_blits(*layers[index], outline_width)
+    return results
+
+
+def dilate_outline_alpha(alphas, outline_width):
+    """縁取りのアルファを (2w+1)² 近傍への膨張として一括計算する。
+
+    alphas は (幅, 高さ) の uint8 配列の列で、戻り値は各辺に outline_width
+    の余白を足した配列の列。SRCALPHA 同士の blit 合成
+    dA = sA + dA - sA*dA/255（切り捨て）を、blit と同じ dx 外側・dy 内側の
+    順に畳み込むので、blit を 24 回重ねた結果とピクセル単位で一致する。
+    （最大値フィルタは合成と一致しないため使わない）
+    """
+    w = outline_width
+    sizes = [alpha.shape for alpha in alphas]
+    max_w = max(size[0] for size in sizes)
+    max_h = max(size[1] for size in sizes)
+    count = len(alphas)
+
+    # 透明度の補数 c = 255 - a で持つと合成は c = c*cs/255（切り捨て）になる
+    source = np.full((count, max_w, max_h), 255, np.uint16)
+    for index, alpha in enumerate(alphas):
+        source[index, : sizes[index][0], : sizes[index][1]] -= alpha
+    coverage = np.full((count, max_w + 2 * w, max_h + 2 * w), 255, np.uint16)
+    product = np.empty_like(source)
+    carry = np.empty_like(source)
+
+    for dx in range(-w, w + 1):
+        for dy in range(-w, w + 1):
+            if dx == 0 and dy == 0:
+                continue
+            region = coverage[:, w + dx : w + dx + max_w, w + dy : w + dy + max_h]
+            np.multiply(source, region, out=product)
+            # x // 255 == (x + 1 + (x >> 8)) >> 8 （x <= 255*255 で厳密）
+            np.right_shift(product, 8, out=carry)
+            product += carry
+            product += 1
+            np.right_shift(product, 8, out=region)
+
+    np.subtract(255, coverage, out=coverage)
+    return [
+        coverage[index, : width + 2 * w, : height + 2 * w].astype(np.uint8)
+        for index, (width, height) in enumerate(sizes)
+    ]
+
+
+def _finish_outlined_glyph(text_surface, outline_alpha, outline_width):
+    tw, th = text_surface.get_size()
+    ow, oh = outline_alpha.shape
+    final_surface = pygame.Surface(
+        (max(tw + outline_width * 2, ow), max(th + outline_width * 2, oh)),
+        pygame.SRCALPHA,
+    )
+    # 縁取りは黒なので RGB は 0 のまま、アルファだけ書き込む
+    pygame.surfarray.pixels_alpha(final_surface)[:ow, :oh] = outline_alpha
+    final_surface.blit(text_surface, (outline_width, outline_width))
+    return final_surface.convert_alpha()
+
+
+def _compose_outline_by_blits(text_surface, outline_surface, outline_width):
     tw, th = text_surface.get_size()
     ow, oh = outline_surface.get_size()
     padding = outline_width
@@ -1,65 +1,32 @@
-﻿import pygame
-from core.services.bgm_manager import BGMManager
-from core.services.se_manager import SEManager
-from .dialogue_loader import DialogueLoader
-from core.services.image_manager import ImageManager
-from .text_renderer import TextRenderer
-from .backlog_manager import BacklogManager
-from .choice_renderer import ChoiceRenderer
-from .notification_manager import NotificationManager
+﻿from .asset_prefetcher import AssetPrefetcher
+from .background_manager import plan_background_zooms
+from .runtime_services import DialogueServices
 from core.config import *
 from .data_normalizer import normalize_dialogue_data
 from .ir_builder import build_ir_from_normalized, dump_ir_json, get_ir_dump_path
 
-def initialize_game(dialogue_file="events/E001.ks"):
+def initialize_game(dialogue_file="events/E001.ks", services=None):
     """ゲームの初期化を行う
 
     Args:
         dialogue_file (str): 読み込む対話ファイルのパス
+        services (DialogueServices): イベントをまたいで使い回すサービス。
+            None ならこのイベント専用に新しく作る（バックログは書き出さない）
 
     Note:
         戻り値のgame_state['screen']は呼び出し側で仮想画面に差し替える想定
     """
-    # Pygameを初期化（既に初期化されていても問題ない）
-    init_qt_application()
-    if not pygame.get_init():
-        pygame.init()
-    if not pygame.mixer.get_init():
-        pygame.mixer.init()
-
-    # 仮想画面サーフェスを作成（表示ウィンドウは作らない）
-    # 呼び出し側で適切なサーフェスに差し替えることを想定
-    screen = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
-
-    # 各マネージャーの初期化
-    bgm_manager = BGMManager(DEBUG)
-    se_manager = SEManager(DEBUG)
-    dialogue_loader = DialogueLoader(DEBUG)
-    image_manager = ImageManager(DEBUG)
-    text_renderer = TextRenderer(screen, DEBUG)
-    choice_renderer = ChoiceRenderer(screen, DEBUG)
-    notification_manager = NotificationManager(screen, DEBUG)
-    
-    # バックログマネージャーの初期化
-    backlog_fonts = {
-        "default": text_renderer.fonts["default"],
-        "text": text_renderer.fonts["text"],      # PyQt5フォント
-        "name": text_renderer.fonts["name"]       # PyQt5フォント
-    }
-    backlog_manager = BacklogManager(screen, text_renderer.fonts, DEBUG)
-    
-    # TextRendererにBacklogManagerを設定
-    text_renderer.set_backlog_manager(backlog_manager)
-    
-    # DialogueLoaderに通知システムを設定
-    dialogue_loader.notification_system = notification_manager
+    # 各マネージャー（画像キャッシュ・フォント）は services から借り、前のイベントの表示状態だけ捨てる
+    if services is None:
+        # アプリ共有のストアと同じファイルを2つ目のストアで開かない
+        services = DialogueServices(DEBUG, save_backlog=False)
+    services.begin_event()
+    dialogue_loader = services.dialogue_loader
+    image_manager = services.image_manager
 
     # 画像パスのスキャンと必須画像のみロード（仮想画面サイズを使用）
     try:
-        print("画像パススキャン中...")
-        image_manager.scan_image_paths(VIRTUAL_WIDTH, VIRTUAL_HEIGHT)
-        print("必須画像ロード中...")
-        images = image_manager.load_essential_images(VIRTUAL_WIDTH, VIRTUAL_HEIGHT)
+        images = services.load_images()
     except Exception as e:
         print(f"画像の初期化に失敗しました： {e}")
         return None
@@ -118,6 +85,9 @@ def initialize_game(dialogue_file="events/E001.ks"):
         except Exception as e:
             print(f"IR JSON dump failed: {e}")
 
+    # 背景はこのイベントで表示される最大サイズまで縮小して読み込む
+    image_manager.set_background_zooms(plan_background_zooms(ir_data.get("steps")))
+
     if "torso" in image_manager.image_paths and image_manager.image_paths["torso"]:
         first_char_key = list(image_manager.image_paths["torso"].keys())[0]
         print(f"キャラクター画像確認: {first_char_key} (元サイズで表示)")
@@ -158,15 +128,8 @@ def initialize_game(dialogue_file="events/E001.ks"):
     
     # ゲーム状態の初期化
     game_state = {
-        'screen': screen,
-        'bgm_manager': bgm_manager,
-        'se_manager': se_manager,
-        'dialogue_loader': dialogue_loader,
-        'image_manager': image_manager,
-        'text_renderer': text_renderer,
-        'choice_renderer': choice_renderer,
-        'backlog_manager': backlog_manager,
-        'notification_manager': notification_manager,
+        **services.game_state_entries(),
+        'asset_prefetcher': AssetPrefetcher(image_manager),
         'images': images,
         'dialogue_data': dialogue_data,
         'ir_data': ir_data,
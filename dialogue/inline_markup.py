@@ -260,3 +260,25 @@ def build_display_string(tokens: list, display_count: int) -> str:
 
     return "".join(result)
 
+
+def hide_pending_ruby(text: str, display_count: int) -> str:
+    """
+    display_count 文字目までに完結していないルビスパンのルビを外した文字列を返す。
+
+    文字送り中の行を全文で一度だけ描画して切り抜く際に使う。
+    build_display_string と同じく、ルビはベース文字がすべて表示されてから出す。
+
+    >>> hide_pending_ruby("私{愛沼|あいぬま}は", 2)
+    '私愛沼は'
+    """
+    tokens = parse_inline_markup(text)
+    revealed: list = []
+    pos = 0
+    for token in tokens:
+        span = 1 if isinstance(token, PlainChar) else len(token.base)
+        if isinstance(token, RubySpan) and pos + span > display_count:
+            revealed.extend(PlainChar(ch) for ch in token.base)
+        else:
+            revealed.append(token)
+        pos += span
+    return build_display_string(revealed, pos)
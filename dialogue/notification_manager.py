@@ -45,6 +45,10 @@ class NotificationManager:
         self.bg_color = (0, 0, 0, 180)  # 半透明黒
         self.text_color = (255, 255, 255)
         self.border_color = (100, 150, 255)
+
+        # カードの左上X（実座標）は固定なので先に求めておく
+        virtual_x = VIRTUAL_WIDTH - self.virtual_notification_width - self.virtual_margin_right
+        self.card_x, self.card_y = scale_pos(virtual_x, self.virtual_margin_top)
         
     def add_notification(self, message):
         """通知を追加"""
@@ -54,7 +58,9 @@ class NotificationManager:
             'message': message,
             'start_time': current_time,
             'y_offset': 0,  # アニメーション用
-            'alpha': 255
+            'alpha': 255,
+            # 背景・枠線・本文を描き込んだカード（フェードは blit 時のアルファだけで行う）
+            'surface': self._render_card(message),
         }
         
         self.notifications.append(notification)
@@ -74,12 +80,14 @@ class NotificationManager:
         if self.debug and self.notifications:
             print(f"[NOTIFICATION_UPDATE] 更新開始: 通知数={len(self.notifications)}")
         
-        # 期限切れの通知を削除
+        # 期限切れの通知を削除（期限切れがあるときだけリストを作り直す）
         old_count = len(self.notifications)
-        self.notifications = [
-            notif for notif in self.notifications 
-            if current_time - notif['start_time'] < self.notification_duration
-        ]
+        if any(current_time - notif['start_time'] >= self.notification_duration
+               for notif in self.notifications):
+            self.notifications = [
+                notif for notif in self.notifications 
+                if current_time - notif['start_time'] < self.notification_duration
+            ]
         
         if old_count != len(self.notifications):
             print(f"[NOTIFICATION] {old_count - len(self.notifications)}個の通知が期限切れで削除されました")
@@ -105,66 +113,36 @@ class NotificationManager:
             return  # 頻繁に呼ばれるのでログ出力しない
 
         # 通知描画（ログ出力しない）
-            
+        # カードは add_notification で描画済みなので、アルファと位置を変えて blit するだけ
         for i, notif in enumerate(self.notifications):
-            # 位置計算（4:3コンテンツ基準）
-            # 仮想座標で計算
-            virtual_x = VIRTUAL_WIDTH - self.virtual_notification_width - self.virtual_margin_right
-            virtual_y = self.virtual_margin_top + int(notif['y_offset'] / SCALE)
+            card = notif['surface']
+            card.set_alpha(notif['alpha'])
+            self.screen.blit(card, (self.card_x, self.card_y + notif['y_offset']))
 
-            # scale_pos()で実座標に変換
-            x, y = scale_pos(virtual_x, virtual_y)
-            
             if self.debug:
-                print(f"[NOTIFICATION_RENDER] 通知{i}: pos=({x},{y}), alpha={notif['alpha']}, message='{notif['message']}'")
-            
-            # 背景描画
-            bg_surface = pygame.Surface((self.notification_width, self.notification_height), pygame.SRCALPHA)
-            bg_surface.fill((*self.bg_color[:3], min(notif['alpha'], self.bg_color[3])))
-            
-            # 境界線描画
-            pygame.draw.rect(bg_surface, (*self.border_color, notif['alpha']), 
-                           (0, 0, self.notification_width, self.notification_height), 2)
-            
-            self.screen.blit(bg_surface, (x, y))
-            
-            # テキスト描画
-            text_color_with_alpha = (*self.text_color, notif['alpha'])
-            
-            # テキストを複数行に分割
-            lines = self._wrap_text(notif['message'], self.notification_width - 20)
-            
-            for j, line in enumerate(lines):
-                if self.debug:
-                    print(f"[NOTIFICATION_RENDER] テキスト行{j}: '{line}'")
-                
-                try:
-                    # 日本語対応のため、アンチエイリアスを有効にしてテキストを描画
-                    text_surface = self.font.render(line, True, self.text_color)
-                    
-                    if self.debug:
-                        print(f"[NOTIFICATION_RENDER] テキストサーフェス作成: サイズ={text_surface.get_size()}")
-                    
-                    # アルファ値を適用（簡単な方法に変更）
-                    if notif['alpha'] < 255:
-                        text_surface.set_alpha(notif['alpha'])
-                    
-                    text_x = x + 10
-                    text_y = y + 10 + (j * self.font.get_height())
-                    
-                    if self.debug:
-                        print(f"[NOTIFICATION_RENDER] テキスト描画位置: ({text_x}, {text_y})")
-                    
-                    self.screen.blit(text_surface, (text_x, text_y))
-                    
-                except Exception as e:
-                    print(f"[NOTIFICATION_RENDER] テキスト描画エラー: {e}")
-                    # フォールバック: シンプルな英語フォントで描画
-                    fallback_font = pygame.font.Font(None, 24)
-                    text_surface = fallback_font.render(line, True, self.text_color)
-                    text_x = x + 10
-                    text_y = y + 10 + (j * 24)
-                    self.screen.blit(text_surface, (text_x, text_y))
+                print(f"[NOTIFICATION_RENDER] 通知{i}: pos=({self.card_x},{self.card_y + notif['y_offset']}), alpha={notif['alpha']}, message='{notif['message']}'")
+
+    def _render_card(self, message):
+        """通知カード（背景・境界線・本文）を不透明度100%で1枚に描画する"""
+        card = pygame.Surface((self.notification_width, self.notification_height), pygame.SRCALPHA)
+        card.fill(self.bg_color)
+        pygame.draw.rect(card, (*self.border_color, 255),
+                         (0, 0, self.notification_width, self.notification_height), 2)
+
+        # テキストを複数行に分割
+        lines = self._wrap_text(message, self.notification_width - 20)
+        for j, line in enumerate(lines):
+            try:
+                # 日本語対応のため、アンチエイリアスを有効にしてテキストを描画
+                text_surface = self.font.render(line, True, self.text_color)
+                card.blit(text_surface, (10, 10 + j * self.font.get_height()))
+            except Exception as e:
+                print(f"[NOTIFICATION_RENDER] テキスト描画エラー: {e}")
+                # フォールバック: シンプルな英語フォントで描画
+                fallback_font = pygame.font.Font(None, 24)
+                text_surface = fallback_font.render(line, True, self.text_color)
+                card.blit(text_surface, (10, 10 + j * 24))
+        return card
     
     def _wrap_text(self, text, max_width):
         """テキストを指定幅で改行（日本語対応）"""
@@ -0,0 +1,181 @@
+"""
+dialogue/paragraph_layout.py
+本文段落のレイアウト（折り返し行・グリッド位置・ルビ/傍点配置・タネ当たり判定）
+
+TextRenderer.set_dialogue で一度だけ組み立て、毎フレームの描画と
+当たり判定はここを引くだけにする。座標は列（グリッド番号）で持ち、
+ピクセル位置は描画時にグリッド幅を掛けて求める。
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+
+import pygame
+
+from .inline_markup import (
+    PlainChar, RubySpan, BotenSpan, SeedSpan,
+    parse_inline_markup, hide_pending_ruby,
+)
+
+
+@dataclass(frozen=True)
+class GlyphPlacement:
+    """本文1文字の配置"""
+    char: str
+    column: int
+    seed_id: str | None = None
+
+
+@dataclass(frozen=True)
+class RubyPlacement:
+    """ルビの配置（ベース文字 column から span_chars 列ぶん）"""
+    ruby: str
+    column: int
+    span_chars: int
+
+
+@dataclass(frozen=True)
+class SeedPlacement:
+    """タネの配置（当たり判定用）"""
+    seed_id: str
+    column: int
+    length: int
+
+
+@dataclass
+class LayoutLine:
+    """折り返し済みの1行"""
+    markup: str
+    start: int              # 段落内での先頭の論理文字位置
+    line_chars: int
+    after_newline: bool
+    tokens: list
+    columns: list[int]      # tokens と同順の先頭列
+    glyphs: list[GlyphPlacement]
+    rubies: list[RubyPlacement]
+    boten_columns: list[int]
+    seeds: list[SeedPlacement]
+    _revealed_markup: dict = field(default_factory=dict, repr=False)
+    _seed_rects: dict = field(default_factory=dict, repr=False)
+
+    def revealed_markup(self, shown_chars):
+        """shown_chars 文字目までに完結していないルビを外したマークアップ。"""
+        complete = sum(
+            1 for ruby in self.rubies if ruby.column + ruby.span_chars <= shown_chars
+        )
+        if complete == len(self.rubies):
+            return self.markup
+        markup = self._revealed_markup.get(complete)
+        if markup is None:
+            markup = hide_pending_ruby(self.markup, shown_chars)
+            self._revealed_markup[complete] = markup
+        return markup
+
+    def seed_hit_rects(self, shown_chars, pos_x, base_y, grid_char_width, text_height):
+        """表示済み部分のタネ当たり判定。shown_chars が None なら行全体。"""
+        shown = self.line_chars if shown_chars is None else min(shown_chars, self.line_chars)
+        key = (shown, pos_x, base_y, grid_char_width, text_height)
+        rects = self._seed_rects.get(key)
+        if rects is None:
+            rects = [
+                {
+                    "seed_id": seed.seed_id,
+                    "rect": pygame.Rect(
+                        pos_x + seed.column * grid_char_width,
+                        base_y,
+                        min(seed.length, shown - seed.column) * grid_char_width,
+                        text_height,
+                    ),
+                }
+                for seed in self.seeds
+                if seed.column < shown
+            ]
+            self._seed_rects[key] = rects
+        return rects
+
+
+def build_layout_line(markup: str, start: int = 0, after_newline: bool = False) -> LayoutLine:
+    """1行ぶんのマークアップからレイアウトを組み立てる。"""
+    tokens = parse_inline_markup(markup)
+    columns = []
+    glyphs = []
+    rubies = []
+    boten_columns = []
+    seeds = []
+    column = 0
+    for token in tokens:
+        columns.append(column)
+        if isinstance(token, PlainChar):
+            glyphs.append(GlyphPlacement(token.char, column))
+            column += 1
+            continue
+
+        span_chars = len(token.base)
+        seed_id = token.seed_id if isinstance(token, SeedSpan) else None
+        glyphs.extend(
+            GlyphPlacement(ch, column + i, seed_id) for i, ch in enumerate(token.base)
+        )
+        if isinstance(token, RubySpan):
+            rubies.append(RubyPlacement(token.ruby, column, span_chars))
+        elif isinstance(token, BotenSpan):
+            boten_columns.extend(range(column, column + span_chars))
+        elif isinstance(token, SeedSpan):
+            seeds.append(SeedPlacement(token.seed_id, column, span_chars))
+        column += span_chars
+
+    return LayoutLine(
+        markup=markup,
+        start=start,
+        line_chars=column,
+        after_newline=after_newline,
+        tokens=tokens,
+        columns=columns,
+        glyphs=glyphs,
+        rubies=rubies,
+        boten_columns=boten_columns,
+        seeds=seeds,
+    )
+
+
+@dataclass
+class ParagraphLayout:
+    """段落全体のレイアウト。text と折り返し設定が変わるまで使い回す。"""
+    text: str
+    tokens: list
+    lines: list[LayoutLine]
+    # select_revealed_line_set に渡す (line, start, line_chars, after_newline) の列
+    reveal_lines: list = field(default_factory=list)
+    _lines_by_markup: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, text: str, wrap) -> "ParagraphLayout":
+        """text を wrap（1段落→行リスト）で全文一度だけ折り返す。
+
+        改行も論理文字1つとして数える。
+        """
+        lines = []
+        start = 0
+        for paragraph_index, paragraph in enumerate(text.split('\n')):
+            if paragraph_index > 0:
+                start += 1
+            for line_index, markup in enumerate(wrap(paragraph) or ['']):
+                line = build_layout_line(
+                    markup, start, after_newline=paragraph_index > 0 and line_index == 0
+                )
+                lines.append(line)
+                start += line.line_chars
+        layout = cls(
+            text=text,
+            tokens=parse_inline_markup(text),
+            lines=lines,
+            reveal_lines=[
+                (line.markup, line.start, line.line_chars, line.after_newline)
+                for line in lines
+            ],
+        )
+        for line in lines:
+            layout._lines_by_markup.setdefault(line.markup, line)
+        return layout
+
+    def line_for(self, markup: str) -> LayoutLine | None:
+        return self._lines_by_markup.get(markup)
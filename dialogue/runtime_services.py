@@ -0,0 +1,129 @@
+"""
+dialogue/runtime_services.py
+イベントをまたいで使い回す会話用サービス（画像・音声・フォント・レンダラー）
+
+- GameApplication が1つ持ち、DialogueSubsystem は initialize_game 経由で借りる
+- 中身は最初の begin_event で作る（DialogueSubsystem が座標系を仮想画面モードにしている間に作るため）
+- 画像キャッシュ・フォント・Qt は最初のイベントでだけ作り、以降のイベントでは温かいまま使う
+- begin_event で前のイベントの表示状態（本文・選択肢・通知・バックログ表示・ストーリーフラグ）だけを捨てる
+- GameApplication は家の日記・朝の会話にも同じものを渡す
+- services を渡さない DialogueSubsystem はイベント専用に作り（バックログは書かない）、cleanup で止める
+- save_backlog=False ならバックログをメモリにだけ持ち、data/current_state/ に書かない（プレイヤー・ツール用）
+"""
+
+import os
+
+import pygame
+
+from core.config import (
+    BACKLOG_MEMORY_ENTRIES,
+    DEBUG,
+    DECODED_IMAGE_CACHE_DIR,
+    VIRTUAL_HEIGHT,
+    VIRTUAL_WIDTH,
+    init_qt_application,
+)
+from core.path_utils import get_user_cache_dir
+from core.services.bgm_manager import BGMManager
+from core.services.image_manager import ImageManager
+from core.services.se_manager import SEManager
+from .backlog_manager import BacklogManager
+from .backlog_store import BacklogStore, get_backlog_state_path
+from .choice_renderer import ChoiceRenderer
+from .dialogue_loader import DialogueLoader
+from .notification_manager import NotificationManager
+from .text_renderer import TextRenderer
+
+
+class DialogueServices:
+    """会話イベントが共有する長寿命のサービス一式"""
+
+    def __init__(self, debug=DEBUG, save_backlog=True):
+        self.debug = debug
+        self.save_backlog = save_backlog
+        self.started = False
+        self.images = None  # load_images の結果（必須UI画像）
+        self.events_started = 0
+
+    def _start(self):
+        """サービスを作る（text_renderer 等は scale_pos で座標をベイクする）"""
+        init_qt_application()
+        if not pygame.get_init():
+            pygame.init()
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+
+        debug = self.debug
+        # 呼び出し側（DialogueSubsystem）が仮想画面に差し替える
+        self.screen = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
+
+        self.bgm_manager = BGMManager(debug)
+        self.se_manager = SEManager(debug)
+        self.dialogue_loader = DialogueLoader(debug)
+        # デコード済み画像はユーザーのキャッシュディレクトリに残し、次のイベント・次回起動ではデコードせずに読む
+        self.image_manager = ImageManager(
+            debug, decode_cache_dir=os.path.join(get_user_cache_dir(), DECODED_IMAGE_CACHE_DIR)
+        )
+        self.text_renderer = TextRenderer(self.screen, debug)
+        self.choice_renderer = ChoiceRenderer(self.screen, debug)
+        self.notification_manager = NotificationManager(self.screen, debug)
+        # 本編のバックログは data/current_state/ に書き出し、古いエントリはそこから読み戻す
+        self.backlog_manager = BacklogManager(
+            self.screen, self.text_renderer.fonts, debug, store=self._open_backlog_store()
+        )
+        self.text_renderer.set_backlog_manager(self.backlog_manager)
+        self.dialogue_loader.notification_system = self.notification_manager
+        self.started = True
+
+    def _open_backlog_store(self):
+        """セーブ対象のファイルに書き出すストア（save_backlog=False ならメモリだけのストア）"""
+        if not self.save_backlog:
+            return BacklogStore()
+        return BacklogStore(get_backlog_state_path(), BACKLOG_MEMORY_ENTRIES)
+
+    def load_images(self):
+        """画像パスのスキャンと必須画像のロード（最初の1回だけ）"""
+        if self.images is None:
+            print("画像パススキャン中...")
+            self.image_manager.scan_image_paths(VIRTUAL_WIDTH, VIRTUAL_HEIGHT)
+            print("必須画像ロード中...")
+            self.images = self.image_manager.load_essential_images(VIRTUAL_WIDTH, VIRTUAL_HEIGHT)
+        return self.images
+
+    def begin_event(self):
+        """新しいイベントの前に、前のイベントの表示状態を捨てる（キャッシュとフォントは残す）"""
+        if not self.started:
+            self._start()
+        else:
+            self.text_renderer.reset_for_event()
+            self.choice_renderer.hide_choices()
+            self.choice_renderer.clear_last_selected()
+            self.notification_manager.clear_all()
+            # セーブのロードで data/current_state/ が差し替わったときだけ読み直す
+            store = self.backlog_manager.entries
+            if not store.is_current():
+                store = self._open_backlog_store()
+            self.backlog_manager.reset_for_event(store)
+            self.dialogue_loader.reset_for_event()
+        self.events_started += 1
+
+    def game_state_entries(self):
+        """game_state に入れるサービス"""
+        return {
+            'screen': self.screen,
+            'bgm_manager': self.bgm_manager,
+            'se_manager': self.se_manager,
+            'dialogue_loader': self.dialogue_loader,
+            'image_manager': self.image_manager,
+            'text_renderer': self.text_renderer,
+            'choice_renderer': self.choice_renderer,
+            'backlog_manager': self.backlog_manager,
+            'notification_manager': self.notification_manager,
+        }
+
+    def cleanup(self):
+        """アプリ終了時にワーカースレッドを止める"""
+        if not self.started:
+            return
+        self.image_manager.cleanup()
+        self.dialogue_loader.cleanup()
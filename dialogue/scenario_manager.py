@@ -10,6 +10,7 @@ from .character_manager import (
 )
 from .background_manager import show_background, move_background
 from .fade_manager import start_fadeout, start_fadein
+from .stage_compositor import mark_stage_dirty
 
 def advance_dialogue(game_state):
     """次の対話に進む"""
@@ -21,6 +22,8 @@ def advance_dialogue(game_state):
         return False
 
     game_state['current_paragraph'] += 1
+    # 旧形式は台詞の段落でも表情が変わるので、送るたびにステージを描き直す
+    mark_stage_dirty(game_state)
 
     # 境界チェック
     if game_state['current_paragraph'] >= len(game_state['dialogue_data']):
@@ -224,6 +227,9 @@ def _ir_dispatch_action(game_state, action):
     target = action.get("target")
     params = action.get("params") or {}
 
+    if action_type and (action_type.startswith(("chara_", "bg_")) or action_type == "background"):
+        mark_stage_dirty(game_state)
+
     if action_type == "chara_show":
         _ir_handle_character_show(game_state, target, params)
     elif action_type == "chara_shift":
@@ -0,0 +1,73 @@
+"""
+dialogue/stage_compositor.py
+背景とキャラクターを重ねた「ステージ」レイヤーを保持し、変化のないフレームでは描き直さない
+
+- bg_* / chara_* アクション（旧形式では段落送り）とまばたきのコマ送りで mark_stage_dirty が呼ばれる
+- 背景・キャラクターのアニメーションやパーツのフェード中は画面へ直接描く
+- それ以外のフレームは保持したステージを1回 blit するだけ（テキスト・フェードはその上に重ねる）
+"""
+
+import pygame
+
+
+def mark_stage_dirty(game_state):
+    """次のフレームでステージを描き直させる"""
+    game_state['stage_dirty'] = True
+
+
+def is_stage_animating(game_state):
+    """背景・キャラクターが毎フレーム変化している間は True"""
+    bg_state = game_state.get('background_state') or {}
+    return bool(
+        bg_state.get('anim')
+        or game_state.get('character_anim')
+        or game_state.get('character_part_fades')
+        or game_state.get('character_hide_pending')
+    )
+
+
+class StageCompositor:
+    """draw_background + draw_characters の結果をキャッシュして screen に合成する"""
+
+    def __init__(self):
+        self.stage = None
+        self._valid = False
+        self.rebuilds = 0
+
+    def invalidate(self):
+        self._valid = False
+
+    def render(self, game_state, screen):
+        """ステージを screen に描く。戻り値は背景・キャラクターを描き直したかどうか"""
+        if game_state.get('stage_dirty'):
+            game_state['stage_dirty'] = False
+            self._valid = False
+
+        if is_stage_animating(game_state):
+            # アニメーション中はキャッシュを経由せずに直接描き、終わったら作り直す
+            self._draw(game_state, screen)
+            self._valid = False
+            return True
+
+        if self.stage is None or self.stage.get_size() != screen.get_size():
+            self.stage = pygame.Surface(screen.get_size(), 0, screen)
+            self._valid = False
+        redrawn = not self._valid
+        if redrawn:
+            self._draw(game_state, self.stage)
+            self._valid = True
+            self.rebuilds += 1
+        screen.blit(self.stage, (0, 0))
+        return redrawn
+
+    def _draw(self, game_state, target):
+        from dialogue.background_manager import draw_background
+        from dialogue.character_manager import draw_characters
+
+        screen = game_state.get('screen')
+        game_state['screen'] = target
+        try:
+            draw_background(game_state)
+            draw_characters(game_state)
+        finally:
+            game_state['screen'] = screen
@@ -1,14 +1,23 @@
 ﻿import pygame
+from collections import OrderedDict
 from core.config import *
 from .scroll_manager import ScrollManager
 from .name_manager import get_name_manager
 from .date_manager import get_current_game_date
-from .font_effects import render_text_with_effects
+from .font_effects import (
+    compose_outlined_glyphs,
+    font_effects_signature,
+    get_cached_glyph,
+    load_baked_glyph_atlas,
+    render_text_with_effects,
+    warm_outlined_glyphs,
+)
 from .historical_weather import get_historical_weather
+from .paragraph_layout import ParagraphLayout, build_layout_line
 from .inline_markup import (
-    parse_inline_markup, has_inline_markup, wrap_markup_text,
+    parse_inline_markup, wrap_markup_text,
     PlainChar, RubySpan, BotenSpan, SeedSpan,
-    build_display_string, total_base_chars, get_logical_char,
+    total_base_chars, get_logical_char,
 )
 import os
 from PyQt5.QtGui import QFont, QFontDatabase
@@ -29,6 +38,33 @@ def select_current_line_set(lines, max_lines):
     return lines[page_start:page_start + max_lines]
 
 
+def select_revealed_line_set(reveal_lines, displayed_chars, max_lines):
+    """Return the current page of a typewriter paragraph wrapped in full.
+
+    ``reveal_lines`` holds ``(line, start, line_chars, after_newline)`` for
+    every wrapped row of the complete text. A row appears once its first
+    character (or the newline before it) is revealed, which matches wrapping
+    the partially displayed string. Returns ``(line, shown_chars, line_chars)``
+    for the rows of the current page.
+    """
+    present = 0
+    for _line, start, _line_chars, after_newline in reveal_lines:
+        if displayed_chars < start + (0 if after_newline else 1):
+            break
+        present += 1
+    if present == 0 or max_lines <= 0:
+        return []
+    page_start = ((present - 1) // max_lines) * max_lines
+    return [
+        (line, max(0, min(displayed_chars - start, line_chars)), line_chars)
+        for line, start, line_chars, _after_newline
+        in reveal_lines[page_start:present]
+    ]
+
+
+_LINE_SURFACE_CACHE_LIMIT = 32
+_LAYOUT_LINE_CACHE_LIMIT = 64
+
 PUNCTUATION_CLOSERS = frozenset(")）]］}｝〉》」』】〕〙〗〟'\"’”")
 
 RUBY_FONT_RATIO = float(TEXT_RENDERER_CONFIG.get('ruby_font_ratio', 0.45))
@@ -72,6 +108,8 @@ class TextRenderer:
         if QApplication.instance() is None:
             init_qt_application()
 
+        # _init_fonts が dialogue 用フォントファイルを読めたときだけ True にする
+        self._dialogue_font_file_loaded = False
         self.fonts = self._init_fonts()
         self.text_color = TEXT_COLOR
         self.text_color_female = TEXT_COLOR_FEMALE
@@ -125,6 +163,8 @@ class TextRenderer:
             "name": self.fonts["name_pygame"],
             "ruby": self.fonts["ruby_pygame"],
         }
+        # 事前に焼いた縁取りグリフを登録（アトラスに無い文字だけ表示時にラスタライズする）
+        self._load_baked_glyphs()
 
         # ルビ領域の高さを事前計算
         _base_h = self.fonts["text_pygame"].get_height()
@@ -140,6 +180,11 @@ class TextRenderer:
         self.seed_annotations = {}
         self.seed_hit_rects = []
         self.hovered_seed_id = None
+        # set_dialogue で一度だけ組み立てる段落レイアウトと、ラスタライズ済み行サーフェスのキャッシュ
+        self._paragraph_layout = None
+        self._layout_line_cache = OrderedDict()
+        self._grid_char_width_cache = None
+        self._line_surface_cache = OrderedDict()
 
         self.displayed_chars = 0        # 論理ベース文字数カウンタ
         self.last_char_time = 0
@@ -193,11 +238,7 @@ class TextRenderer:
         return bool(self.seed_manager and self.seed_manager.can_show(seed_id))
 
     def update_seed_hover(self, mouse_pos):
-        self.hovered_seed_id = None
-        for item in self.seed_hit_rects:
-            if item["rect"].collidepoint(mouse_pos):
-                self.hovered_seed_id = item["seed_id"]
-                break
+        self.hovered_seed_id = self.seed_at(mouse_pos)
         try:
             cursor = (
                 pygame.SYSTEM_CURSOR_HAND
@@ -210,6 +251,7 @@ class TextRenderer:
         return self.hovered_seed_id
 
     def seed_at(self, mouse_pos):
+        # seed_hit_rects は描画時に段落レイアウトから引いた表示中のタネだけを持つ
         for item in self.seed_hit_rects:
             if item["rect"].collidepoint(mouse_pos):
                 return item["seed_id"]
@@ -262,6 +304,7 @@ class TextRenderer:
                         fonts["text_pygame"] = pygame.font.Font(dialogue_font_path, text_font_size)
                         ruby_font_size = max(8, int(text_font_size * RUBY_FONT_RATIO))
                         fonts["ruby_pygame"] = pygame.font.Font(dialogue_font_path, ruby_font_size)
+                        self._dialogue_font_file_loaded = True
 
                         if self.debug:
                             print("PyQt5とPygameのdialogue用フォント読み込み成功")
@@ -341,38 +384,68 @@ class TextRenderer:
         # 透明最適化（描画の滲み対策というより速度向上）
         return processed_surface.convert_alpha()
 
-    def _render_outline_surface(self, font, text, color):
-        """本文テキスト専用の黒縁取りを描画する"""
+    def _load_baked_glyphs(self):
+        """tools/bake_glyph_atlas.py の出力を本文・名前フォントに登録する"""
+        if not self._dialogue_font_file_loaded:
+            return  # フォールバックフォントにはアトラスを使わない
+        for font_key, size in (("text", FONT_TEXT_SIZE), ("name", FONT_NAME_SIZE)):
+            count = load_baked_glyph_atlas(
+                self.pygame_fonts[font_key], SERIF_FONT_FILENAME, size, kinds=("outline",)
+            )
+            if self.debug and count:
+                print(f"[TEXT] 焼き込みグリフ {count} 件を登録 ({font_key})")
+
+    def _render_outline_layers(self, font, text, color):
+        """本文と縁取り用の黒文字を、効果適用済みの Surface 対で返す"""
         text_surface = font.render(text, True, color)
         text_surface = self._apply_font_effects(text_surface, is_shadow=False)
 
         if not FONT_EFFECTS.get("enable_shadow", False):
-            return text_surface
+            return text_surface, None
 
         outline_color = (0, 0, 0)
         outline_surface = font.render(text, True, outline_color)
         outline_surface = self._apply_font_effects(outline_surface, is_shadow=True)
+        return text_surface, outline_surface
 
-        shadow_offset = FONT_EFFECTS.get("shadow_offset", (6, 6))
-        outline_width = max(2, min(3, int(round(max(abs(shadow_offset[0]), abs(shadow_offset[1]))) // 2)))
-
-        tw, th = text_surface.get_size()
-        ow, oh = outline_surface.get_size()
-        padding = outline_width
-        final_surface = pygame.Surface((max(tw, ow) + padding * 2, max(th, oh) + padding * 2), pygame.SRCALPHA)
-
-        for dx in range(-outline_width, outline_width + 1):
-            for dy in range(-outline_width, outline_width + 1):
-                if dx == 0 and dy == 0:
-                    continue
-                final_surface.blit(outline_surface, (padding + dx, padding + dy))
-
-        final_surface.blit(text_surface, (padding, padding))
-        return final_surface.convert_alpha()
+    def _render_outline_surface(self, font, text, color):
+        """本文テキスト専用の黒縁取りを描画する"""
+        return compose_outlined_glyphs([self._render_outline_layers(font, text, color)])[0]
 
     
     def _render_text_with_effects(self, font, text, color, is_name=False):
-        return self._render_outline_surface(font, text, color)
+        """縁取り済みグリフをアトラスから取得する（未登録時のみラスタライズ）"""
+        return get_cached_glyph(
+            ("outline", font, text, tuple(color)),
+            lambda: self._render_outline_surface(font, text, color),
+        )
+
+    def _warm_line_glyphs(self, layout_line, color):
+        """行内の未登録グリフをまとめて縁取りする（縁取りを1パスで済ませる）"""
+        font = self.pygame_fonts["text"]
+        requests = []
+        for glyph in layout_line.glyphs[:self.max_chars_per_line]:
+            glyph_color = color
+            if glyph.seed_id is not None and self._seed_enabled(glyph.seed_id):
+                glyph_color = (
+                    SEED_TEXT_HOVER_COLOR
+                    if glyph.seed_id == self.hovered_seed_id
+                    else SEED_TEXT_COLOR
+                )
+            requests.append((
+                ("outline", font, glyph.char, tuple(glyph_color)),
+                lambda ch=glyph.char, glyph_color=glyph_color: self._render_outline_layers(
+                    font, ch, glyph_color
+                ),
+            ))
+        warm_outlined_glyphs(requests)
+
+    def _render_plain_glyph(self, font, text, color):
+        """ルビ・傍点用のエフェクトなしグリフをアトラスから取得する"""
+        return get_cached_glyph(
+            ("plain", font, text, tuple(color)),
+            lambda: font.render(text, True, color),
+        )
 
     def _render_stable_text_line(self, displayed_line, color):
         """文字送り時の揺れを防ぐ安定した行描画（絶対座標グリッドシステム）"""
@@ -381,46 +454,112 @@ class TextRenderer:
         
         # 【根本解決】絶対座標グリッドシステム
         # 各文字を固定されたグリッド位置に配置することで揺れを完全に解消
-        
-        return self._render_text_with_grid_system(displayed_line, color)
-    
-    def _render_text_with_grid_system(self, text_line, color):
-        """絶対座標グリッドシステムで文字を描画（ルビ・傍点対応）"""
-        if not text_line:
-            return pygame.Surface((1, 1), pygame.SRCALPHA)
-
-        tokens = parse_inline_markup(text_line)
+        # 行単位でキャッシュし、同じ行は毎フレーム再ラスタライズしない
+        hovered_seed_id = self.hovered_seed_id if "[seed" in displayed_line else None
+        cache_key = (
+            displayed_line, tuple(color), hovered_seed_id,
+            self.max_chars_per_line, self.char_spacing, font_effects_signature(),
+        )
+        cached = self._line_surface_cache.get(cache_key)
+        if cached is not None:
+            self._line_surface_cache.move_to_end(cache_key)
+            return cached
+
+        line_surface = self._render_text_with_grid_system(displayed_line, color)
+        self._line_surface_cache[cache_key] = line_surface
+        while len(self._line_surface_cache) > _LINE_SURFACE_CACHE_LIMIT:
+            self._line_surface_cache.popitem(last=False)
+        return line_surface
 
-        # グリッド幅計算
-        sample_surface = self.pygame_fonts["text"].render("あ", True, color)
-        base_char_width = sample_surface.get_width()
+    def _get_grid_char_width(self):
+        """本文1文字分のグリッド幅（"あ" の幅 × 横伸ばし × 余白係数 + 文字間隔）"""
         stretch_factor = (
             FONT_EFFECTS.get("stretch_factor", 1.0)
             if FONT_EFFECTS.get("enable_stretched", False) else 1.0
         )
+        cache_key = (
+            self.pygame_fonts["text"], stretch_factor,
+            TEXT_RENDERER_CONFIG["grid_char_width_margin"], self.char_spacing,
+        )
+        cached = self._grid_char_width_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        base_char_width = self.pygame_fonts["text"].size("あ")[0]
         grid_char_width = (
             int(base_char_width * stretch_factor * TEXT_RENDERER_CONFIG["grid_char_width_margin"])
             + self.char_spacing
         )
+        self._grid_char_width_cache = (cache_key, grid_char_width)
+        return grid_char_width
+
+    def _get_paragraph_layout(self):
+        """現在の段落レイアウトを返す（set_dialogue か設定変更後の初回だけ組み立てる）"""
+        layout = self._paragraph_layout
+        if layout is None or layout.text != self.current_text:
+            layout = ParagraphLayout.build(self.current_text, self._wrap_text)
+            self._paragraph_layout = layout
+        return layout
+
+    def _get_paragraph_lines(self):
+        """select_revealed_line_set に渡す (line, start, line_chars, after_newline) のリスト"""
+        return self._get_paragraph_layout().reveal_lines
+
+    def _get_layout_line(self, line):
+        """行マークアップのレイアウトを返す。現在の段落の行ならそのまま引く。"""
+        layout = self._paragraph_layout
+        layout_line = layout.line_for(line) if layout is not None else None
+        if layout_line is not None:
+            return layout_line
+
+        layout_line = self._layout_line_cache.get(line)
+        if layout_line is not None:
+            self._layout_line_cache.move_to_end(line)
+            return layout_line
+        layout_line = build_layout_line(line)
+        self._layout_line_cache[line] = layout_line
+        while len(self._layout_line_cache) > _LAYOUT_LINE_CACHE_LIMIT:
+            self._layout_line_cache.popitem(last=False)
+        return layout_line
+
+    def _draw_revealed_line(self, line, shown_chars, line_chars, color, pos_x, base_y):
+        """キャッシュ済みの行サーフェスを表示済み文字数ぶんだけ切り抜いて描画する。"""
+        pos_y = base_y - self.ruby_h
+        if shown_chars >= line_chars:
+            text_surface = self._render_stable_text_line(line, color)
+            self.screen.blit(text_surface, (pos_x, pos_y))
+            return
+
+        # 未完了のルビは出さない行を描画し、表示済みの列までを切り抜く
+        text_surface = self._render_stable_text_line(
+            self._get_layout_line(line).revealed_markup(shown_chars), color
+        )
+        reveal_rect = pygame.Rect(
+            0, 0, shown_chars * self._get_grid_char_width(), text_surface.get_height()
+        )
+        self.screen.blit(text_surface, (pos_x, pos_y), reveal_rect)
+    
+    def _render_text_with_grid_system(self, text_line, color):
+        """絶対座標グリッドシステムで文字を描画（ルビ・傍点対応）"""
+        if not text_line:
+            return pygame.Surface((1, 1), pygame.SRCALPHA)
+
+        layout_line = self._get_layout_line(text_line)
+        self._warm_line_glyphs(layout_line, color)
+        grid_char_width = self._get_grid_char_width()
 
         # サーフェス高さ: ruby領域 + base領域 + 余裕
         # base text は常に ruby_h 下に描画し、blit側で ruby_h 分上にシフトする
         base_h = self.pygame_fonts["text"].get_height()
         line_height = base_h + self.ruby_h + 4
 
-        total_base = sum(
-            len(t.base) if isinstance(t, (RubySpan, BotenSpan, SeedSpan)) else 1
-            for t in tokens
-        )
-        max_chars = min(total_base, self.max_chars_per_line)
+        max_chars = min(layout_line.line_chars, self.max_chars_per_line)
         line_width = grid_char_width * max_chars
 
         line_surface = pygame.Surface((line_width, line_height), pygame.SRCALPHA)
         line_surface.fill((0, 0, 0, 0))
 
-        char_count = 0
-
-        for token in tokens:
+        for token, char_count in zip(layout_line.tokens, layout_line.columns):
             if char_count >= self.max_chars_per_line:
                 break
 
@@ -431,7 +570,6 @@ class TextRenderer:
                 )
                 # base text は ruby_h 下に配置（blitで上シフトして画面Y位置は変わらない）
                 line_surface.blit(char_surface, (grid_x, self.ruby_h))
-                char_count += 1
 
             elif isinstance(token, RubySpan):
                 span_chars = min(len(token.base), self.max_chars_per_line - char_count)
@@ -447,11 +585,9 @@ class TextRenderer:
 
                 # ルビ（両端揃え）
                 _blit_ruby_justified(line_surface, token.ruby,
-                    lambda ch: self.pygame_fonts["ruby"].render(ch, True, color),
+                    lambda ch: self._render_plain_glyph(self.pygame_fonts["ruby"], ch, color),
                     grid_x, span_width)
 
-                char_count += span_chars
-
             elif isinstance(token, BotenSpan):
                 span_chars = min(len(token.base), self.max_chars_per_line - char_count)
                 grid_x = char_count * grid_char_width
@@ -464,12 +600,10 @@ class TextRenderer:
                     line_surface.blit(ch_surf, (grid_x + i * grid_char_width, self.ruby_h))
 
                     # 傍点（各文字中央上、ruby_h の直上）
-                    dot_surf = self.pygame_fonts["ruby"].render("·", True, color)
+                    dot_surf = self._render_plain_glyph(self.pygame_fonts["ruby"], "·", color)
                     dot_x = (grid_x + i * grid_char_width
                               + (grid_char_width - dot_surf.get_width()) // 2)
                     line_surface.blit(dot_surf, (dot_x, 0))
-
-                char_count += span_chars
 
             elif isinstance(token, SeedSpan):
                 span_chars = min(len(token.base), self.max_chars_per_line - char_count)
@@ -497,7 +631,6 @@ class TextRenderer:
                             (x + grid_char_width - 2, underline_y),
                             2,
                         )
-                char_count += span_chars
 
         return line_surface
 
@@ -616,6 +749,45 @@ class TextRenderer:
     def set_backlog_manager(self, backlog_manager):
         self.backlog_manager = backlog_manager
 
+    def reset_for_event(self):
+        """別のイベントで使い回す前に、前のイベントの本文・タネ・オート状態を捨てる
+
+        フォントとラスタライズ済みの行・グリフのキャッシュはそのまま残す。
+        """
+        self.event_datetime = None
+        self.current_text = ""
+        self.current_character_name = None
+        self.current_force_female = False
+        self._current_tokens = []
+        self._total_base_chars = 0
+        self.seed_manager = None
+        self.seed_event_id = None
+        self.seed_annotations = {}
+        self.seed_hit_rects = []
+        self.hovered_seed_id = None
+        self._paragraph_layout = None
+
+        self.displayed_chars = 0
+        self.last_char_time = 0
+        self.is_text_complete = False
+        self.punctuation_waiting = False
+        self.punctuation_wait_start = 0
+        self.paragraph_transition_waiting = False
+        self.paragraph_transition_start = 0
+        self.scroll_just_ended = False
+
+        self.auto_mode = False
+        self.skip_mode = False
+        self.text_complete_time = 0
+        self.is_ready_for_next = False
+        self.auto_ready_logged = False
+
+        self.last_speaker = None
+        self.previous_text = None
+        self.scroll_manager = ScrollManager(self.debug)
+        self.scroll_manager.set_text_renderer(self)
+        self.backlog_added_for_current = True
+
     def toggle_auto_mode(self):
         self.auto_mode = not self.auto_mode
         if self.auto_mode:
@@ -687,8 +859,10 @@ class TextRenderer:
         self.current_text = str(substituted_text)
         self.current_character_name = str(substituted_character_name)
         self.current_force_female = bool(force_female)
-        # トークンをキャッシュ（文字送り・描画で共用）
-        self._current_tokens = parse_inline_markup(self.current_text)
+        # 段落レイアウト（トークン・折り返し・配置）はここで一度だけ組み立てる
+        self._line_surface_cache = OrderedDict()
+        self._paragraph_layout = None
+        self._current_tokens = self._get_paragraph_layout().tokens
         self._total_base_chars = total_base_chars(self._current_tokens)
         if self.seed_manager and self.seed_event_id:
             for token in self._current_tokens:
@@ -749,7 +923,7 @@ class TextRenderer:
                     self.backlog_manager.entries[-1]["text"] == self.previous_text and
                     bool(self.backlog_manager.entries[-1].get("force_female")) ==
                     bool(getattr(self, 'previous_force_female', False))):
-                    removed_entry = self.backlog_manager.entries.pop()
+                    removed_entry = self.backlog_manager.pop_entry()
                     if self.debug:
                         print(f"[BACKLOG] スクロール開始時に重複エントリを削除: {removed_entry['speaker']} - {removed_entry['text'][:30]}...")
 
@@ -960,23 +1134,15 @@ class TextRenderer:
         if self.scroll_manager.is_scroll_mode():
             return self.render_scroll_text()
         
-        # 【重要】文字送り時の揺れ対策：完全な文字列でエフェクトを計算してからマスクで切り取る
-        full_text = self.current_text  # 完全なテキスト
-        # ルビ方式A: 論理ベース文字数から表示文字列を構築
-        display_text_segment = build_display_string(self._current_tokens, self.displayed_chars)
-        
-        # テキストを26文字で自動改行
-        all_lines = self._wrap_text(display_text_segment)
+        # 【重要】文字送り時の揺れ対策：全文を一度だけ折り返して行ごとに描画し、
+        # 表示済み文字数ぶんだけ切り抜いて見せる（フレーム毎の再折り返し・再描画をしない）
+        reveal_lines = self._get_paragraph_lines()
         
         # 最大3行を1セットとして表示する。4行目に入った時点で、直前の
         # 3行をまとめて消し、新しいセットを先頭行から描画する。
-        lines_to_draw = select_current_line_set(all_lines, self.max_display_lines)
-        if self.debug and len(all_lines) > self.max_display_lines:
-            set_number = ((len(all_lines) - 1) // self.max_display_lines) + 1
-            print(
-                f"[SCROLL] 単一テキストを{self.max_display_lines}行単位で表示: "
-                f"{len(all_lines)}行目はセット{set_number}"
-            )
+        lines_to_draw = select_revealed_line_set(
+            reveal_lines, self.displayed_chars, self.max_display_lines
+        )
 
         # 話者名と本文に適用する色を決定
         text_color_to_use = self.text_color_female if self.current_force_female else self.text_color
@@ -998,54 +1164,39 @@ class TextRenderer:
                     print(f"キャラクター名描画エラー: {e}, 名前: '{self.current_character_name}'")
 
         y = self.text_start_y
-        for single_line in lines_to_draw:
-            if single_line: # 空の行は描画しない
+        for single_line, shown_chars, line_chars in lines_to_draw:
+            if single_line and shown_chars > 0: # 空の行は描画しない
                 try:
                     # 【揺れ対策】完全な行でエフェクトを適用してから部分表示でマスク
-                    text_surface = self._render_stable_text_line(single_line, text_color_to_use)
                     # 座標を整数にスナップして揺れを防止
                     pos_x = int(round(self.text_start_x))
                     # サーフェス内 base text は ruby_h 下にあるので、上にシフトして画面 Y を固定
-                    pos_y = int(round(y)) - self.ruby_h
-                    self.screen.blit(text_surface, (pos_x, pos_y))
-                    self._record_seed_hit_rects(single_line, pos_x, int(round(y)))
+                    self._draw_revealed_line(
+                        single_line, shown_chars, line_chars,
+                        text_color_to_use, pos_x, int(round(y)),
+                    )
+                    self._record_seed_hit_rects(
+                        single_line, shown_chars, pos_x, int(round(y))
+                    )
                 except Exception as e:
                     if self.debug:
                         print(f"テキスト描画エラー: {e}, テキスト: '{single_line}'")
             y += self.text_line_height # 各行の後に高さを加算
         return y
 
-    def _record_seed_hit_rects(self, text_line, pos_x, base_y):
-        tokens = parse_inline_markup(text_line)
-        sample_surface = self.pygame_fonts["text"].render("あ", True, self.text_color)
-        stretch_factor = (
-            FONT_EFFECTS.get("stretch_factor", 1.0)
-            if FONT_EFFECTS.get("enable_stretched", False)
-            else 1.0
-        )
-        grid_width = (
-            int(
-                sample_surface.get_width()
-                * stretch_factor
-                * TEXT_RENDERER_CONFIG["grid_char_width_margin"]
+    def _record_seed_hit_rects(self, text_line, shown_chars, pos_x, base_y):
+        """表示済み部分のタネ当たり判定を段落レイアウトから引いて登録する"""
+        layout_line = self._get_layout_line(text_line)
+        if not layout_line.seeds:
+            return
+        self.seed_hit_rects.extend(
+            item
+            for item in layout_line.seed_hit_rects(
+                shown_chars, pos_x, base_y,
+                self._get_grid_char_width(), self.pygame_fonts["text"].get_height(),
             )
-            + self.char_spacing
+            if self._seed_enabled(item["seed_id"])
         )
-        char_count = 0
-        for token in tokens:
-            if isinstance(token, PlainChar):
-                char_count += 1
-                continue
-            span_length = len(token.base)
-            if isinstance(token, SeedSpan) and self._seed_enabled(token.seed_id):
-                rect = pygame.Rect(
-                    pos_x + char_count * grid_width,
-                    base_y,
-                    span_length * grid_width,
-                    self.pygame_fonts["text"].get_height(),
-                )
-                self.seed_hit_rects.append({"seed_id": token.seed_id, "rect": rect})
-            char_count += span_length
 
     def render_scroll_text(self):
         """スクロールテキストを描画する（各行に適切な話者名を表示）"""
@@ -1064,18 +1215,16 @@ class TextRenderer:
         line_speaker_mapping = []  # 各行がどの話者の何行目かを記録
         
         for block_index, text_block_content in enumerate(scroll_text_blocks):
-            text_to_render_for_block = text_block_content
-            
             is_latest_block = (block_index == len(scroll_text_blocks) - 1)
+            # テキストを26文字で自動改行（各行は (行, 表示済み文字数, 行の文字数)）
+            lines_in_block = [(line, None, None) for line in self._wrap_text(text_block_content)]
             if is_latest_block and not self.is_text_complete:
-                # 最新のブロックで文字送り中の場合、表示する部分までを切り出す
+                # 最新のブロックで文字送り中の場合、全文の折り返しから表示済み部分までを使う
                 if self.current_text in text_block_content or text_block_content in self.current_text:
-                    # 現在の表示状況に合わせて切り取り
-                    displayed_portion = build_display_string(self._current_tokens, self.displayed_chars)
-                    text_to_render_for_block = displayed_portion
-
-            # テキストを26文字で自動改行
-            lines_in_block = self._wrap_text(text_to_render_for_block)
+                    reveal_lines = self._get_paragraph_lines()
+                    lines_in_block = select_revealed_line_set(
+                        reveal_lines, self.displayed_chars, len(reveal_lines)
+                    )
             
             # 各行に話者情報をマッピング
             block_speaker = line_speakers[block_index] if block_index < len(line_speakers) else None
@@ -1130,7 +1279,7 @@ class TextRenderer:
         
         # 描画処理（修正：各行ごとに正しい話者の色を適用）
         y = self.text_start_y
-        for line_index, single_line in enumerate(lines_to_draw):
+        for line_index, (single_line, shown_chars, line_chars) in enumerate(lines_to_draw):
             speaker_name_to_show = ""
             # デフォルトの色を設定
             speaker_text_color = self.text_color
@@ -1167,17 +1316,23 @@ class TextRenderer:
                         print(f"スクロール話者名描画エラー: {e}, 名前: '{speaker_name_to_show}'")
             
             # テキストを描画（この行の話者の色を使用）
-            if single_line:  # 空の行は描画しない
+            if single_line and shown_chars != 0:  # 空の行は描画しない
                 try:
                     # 【重要】スクロール時もグリッドシステムを使用
-                    text_surface = self._render_stable_text_line(single_line, speaker_text_color)
                     # スクロール時のテキスト座標も整数にスナップ
                     scroll_text_x = int(round(self.text_start_x))
-                    scroll_text_y = int(round(y)) - self.ruby_h
-                    self.screen.blit(text_surface, (scroll_text_x, scroll_text_y))
+                    if shown_chars is None:
+                        text_surface = self._render_stable_text_line(single_line, speaker_text_color)
+                        self.screen.blit(text_surface, (scroll_text_x, int(round(y)) - self.ruby_h))
+                    else:
+                        self._draw_revealed_line(
+                            single_line, shown_chars, line_chars,
+                            speaker_text_color, scroll_text_x, int(round(y)),
+                        )
                     if mapping.get('is_latest_block'):
                         self._record_seed_hit_rects(
-                            single_line,
+                            single_line,
+                            shown_chars,
                             scroll_text_x,
                             int(round(y)),
                         )
@@ -1231,6 +1386,7 @@ class TextRenderer:
     def set_max_chars_per_line(self, max_chars):
         """1行あたりの最大文字数を設定"""
         self.max_chars_per_line = max_chars
+        self._paragraph_layout = None
         if self.debug:
             print(f"1行あたりの最大文字数を{max_chars}文字に設定")
     
@@ -1250,6 +1406,7 @@ class TextRenderer:
     def set_char_spacing(self, spacing):
         """文字間隔を設定"""
         self.char_spacing = spacing
+        self._paragraph_layout = None
         if self.debug:
             print(f"文字間隔を{spacing}pxに設定")
     
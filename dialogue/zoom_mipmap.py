@@ -0,0 +1,102 @@
+"""
+dialogue/zoom_mipmap.py
+ズームアニメーション用のミップマップと量子化したズーム段
+
+- quantize_zoom: ズーム率を対数で等間隔の段に丸める（トゥイーン中の拡縮キーの種類を抑える）
+- get_mipmap_level: 元画像を 1/2 ずつ縮小したピラミッドの1段
+- scale_from_mipmap: 目標サイズ以上で最も小さい段から最終サイズへ拡縮する
+
+静止中の拡縮（get_scaled_image）とはキャッシュを分けるので、
+ズームのトゥイーン1回で通常の拡縮キャッシュが押し流されることはない。
+"""
+
+import math
+from collections import OrderedDict
+
+import pygame
+
+from core.config import ZOOM_BUCKETS_PER_OCTAVE
+
+# ピラミッドの段（元画像そのものは含まない）。サーフェスのバイト数で上限管理
+_MIPMAP_CACHE_BYTES = 128 * 1024 * 1024
+_mipmap_cache = OrderedDict()
+_mipmap_cache_bytes = 0
+# 段から最終サイズへ拡縮した結果（トゥイーン1回ぶんの段×レイヤーが収まる程度）
+_MIPMAP_SCALED_CACHE_BYTES = 192 * 1024 * 1024
+_mipmap_scaled_cache = OrderedDict()
+_mipmap_scaled_cache_bytes = 0
+
+
+def quantize_zoom(zoom):
+    """ズーム率を 2 倍あたり ZOOM_BUCKETS_PER_OCTAVE 段のいずれかに丸める"""
+    if zoom <= 0:
+        return zoom
+    step = round(math.log2(zoom) * ZOOM_BUCKETS_PER_OCTAVE)
+    return 2.0 ** (step / ZOOM_BUCKETS_PER_OCTAVE)
+
+
+def _surface_bytes(surface):
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+
+def get_mipmap_level(image, level):
+    """level 回 1/2 に縮小した画像（0 なら元画像）"""
+    global _mipmap_cache_bytes
+    if level <= 0:
+        return image
+    key = (image, level)
+    cached = _mipmap_cache.get(key)
+    if cached is not None:
+        _mipmap_cache.move_to_end(key)
+        return cached
+
+    parent = get_mipmap_level(image, level - 1)
+    size = (max(1, parent.get_width() // 2), max(1, parent.get_height() // 2))
+    # 他の拡縮と同じ最近傍で間引く（乗算済みでないアルファを平均すると縁が暗くなる）
+    surface = pygame.transform.scale(parent, size)
+    _mipmap_cache[key] = surface
+    _mipmap_cache_bytes += _surface_bytes(surface)
+    while _mipmap_cache_bytes > _MIPMAP_CACHE_BYTES and len(_mipmap_cache) > 1:
+        _, evicted = _mipmap_cache.popitem(last=False)
+        _mipmap_cache_bytes -= _surface_bytes(evicted)
+    return surface
+
+
+def _mipmap_level_for(image, size):
+    """size 以上を保てる最も深い段の番号"""
+    width, height = image.get_size()
+    level = 0
+    while width // 2 >= max(size[0], 1) and height // 2 >= max(size[1], 1):
+        width //= 2
+        height //= 2
+        level += 1
+    return level
+
+
+def scale_from_mipmap(image, size):
+    """image を size に拡縮する。縮小は size 以上で最も小さいミップマップ段から行う"""
+    global _mipmap_scaled_cache_bytes
+    size = (max(0, int(size[0])), max(0, int(size[1])))
+    key = (image, size)
+    cached = _mipmap_scaled_cache.get(key)
+    if cached is not None:
+        _mipmap_scaled_cache.move_to_end(key)
+        return cached
+
+    source = get_mipmap_level(image, _mipmap_level_for(image, size))
+    scaled = source if source.get_size() == size else pygame.transform.scale(source, size)
+    _mipmap_scaled_cache[key] = scaled
+    _mipmap_scaled_cache_bytes += _surface_bytes(scaled)
+    while _mipmap_scaled_cache_bytes > _MIPMAP_SCALED_CACHE_BYTES and len(_mipmap_scaled_cache) > 1:
+        _, evicted = _mipmap_scaled_cache.popitem(last=False)
+        _mipmap_scaled_cache_bytes -= _surface_bytes(evicted)
+    return scaled
+
+
+def clear_mipmap_cache():
+    """ピラミッドと拡縮結果のキャッシュを破棄する"""
+    global _mipmap_cache_bytes, _mipmap_scaled_cache_bytes
+    _mipmap_cache.clear()
+    _mipmap_scaled_cache.clear()
+    _mipmap_cache_bytes = 0
+    _mipmap_scaled_cache_bytes = 0
@@ -10,6 +10,7 @@ import pygame
 
 from core.path_utils import get_resource_path
 from core.runtime.subsystem_base import SubsystemBase
+from core.services.asset_pack import get_asset_packs
 from core.services.time_manager import get_time_manager
 from home.morning_flow import MorningFlow
 
@@ -82,9 +83,14 @@ class HomeModule(SubsystemBase):
         "phone3": 0,
     }
 
-    def __init__(self, screen: pygame.Surface, clock_ms=None):
+    # GameApplication's shared DialogueServices; the diary and morning dialogues
+    # borrow it so the app keeps one image cache and one backlog store.
+    _dialogue_services = None
+
+    def __init__(self, screen: pygame.Surface, clock_ms=None, dialogue_services=None):
         super().__init__(screen)
         self._clock_ms = clock_ms or pygame.time.get_ticks
+        self._dialogue_services = dialogue_services
         self._phase = self.DIARY
         self._transition: _ImageTransition | None = None
         self._diary_dialogue = None
@@ -92,7 +98,7 @@ class HomeModule(SubsystemBase):
         self._choice_renderer = None
         self._choice_actions: tuple[str, ...] = ()
         self._images = self._load_home_images()
-        self.morning_flow = MorningFlow(screen)
+        self.morning_flow = MorningFlow(screen, dialogue_services=dialogue_services)
 
         # Kept as a lightweight compatibility view for older callers/tests.
         self.choices = [
@@ -120,13 +126,13 @@ class HomeModule(SubsystemBase):
         for index in range(4):
             key = f"home{index:02d}"
             path = get_resource_path("images", os.path.join("BG", f"{key}.jpg"))
-            if not os.path.exists(path):
+            if not get_asset_packs().exists(path):
                 path = get_resource_path("images", os.path.join("BG", f"{key}.JPG"))
             paths[key] = path
         images = {}
         for key, path in paths.items():
             try:
-                image = pygame.image.load(path)
+                image = get_asset_packs().load_image(path)
                 if key == "phone3":
                     image = self._prepare_phone_overlay(image)
                 scaled = self._scale_cover(image, (VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
@@ -169,7 +175,7 @@ class HomeModule(SubsystemBase):
 
     def on_enter(self):
         """Every genuine return home starts with that evening's diary line."""
-        self.morning_flow = MorningFlow(self.screen)
+        self.morning_flow = MorningFlow(self.screen, dialogue_services=self._dialogue_services)
         self._transition = None
         self._phase = self.DIARY
         self._choice_actions = ()
@@ -202,6 +208,7 @@ class HomeModule(SubsystemBase):
                 self.screen,
                 self.screen,
                 self.DIARY_DIALOGUE_FILE,
+                self._dialogue_services,
             )
             desk_path = get_resource_path(
                 "images", os.path.join("UI", "home", "desk3.png")
@@ -503,7 +510,7 @@ class HomeModule(SubsystemBase):
     def _ensure_morning_flow(self):
         flow = self.__dict__.get("morning_flow")
         if flow is None:
-            flow = MorningFlow(getattr(self, "screen", None))
+            flow = MorningFlow(getattr(self, "screen", None), dialogue_services=self._dialogue_services)
             self.__dict__["morning_flow"] = flow
         return flow
 
@@ -11,8 +11,10 @@ class MorningFlow:
 
     DIALOGUE_FILE = "events/HOME_MORNING_DEPARTURE.ks"
 
-    def __init__(self, screen, dialogue_factory=None):
+    def __init__(self, screen, dialogue_factory=None, dialogue_services=None):
         self.screen = screen
+        # GameApplication's shared DialogueServices (None builds a private one per dialogue)
+        self.dialogue_services = dialogue_services
         self.sequence = None
         self.frame_presented = False
         self.preload_attempted = False
@@ -79,8 +81,7 @@ class MorningFlow:
             preloaded_subsystem=dialogue,
         )
 
-    @staticmethod
-    def _build_dialogue(screen, event_file):
+    def _build_dialogue(self, screen, event_file):
         from dialogue.dialogue_subsystem import DialogueSubsystem
 
-        return DialogueSubsystem(screen, screen, event_file)
+        return DialogueSubsystem(screen, screen, event_file, self.dialogue_services)
@@ -24,6 +24,7 @@ from menu.main_menu import MainMenu
 from menu.load_screen import LoadScreen
 from map.map import FieldMap
 from dialogue.dialogue_subsystem import DialogueSubsystem
+from dialogue.runtime_services import DialogueServices
 from core.ui.title_subsystem import TitleSubsystem
 from core.flow.event_progress import EventProgress
 from core.flow.game_flow import (
@@ -62,6 +63,9 @@ class GameApplication:
         self.home_module = None
         self.option_subsystem = None
 
+        # 会話イベントが借りる画像キャッシュ・フォント・レンダラー（最初のイベントで作る）
+        self.dialogue_services = DialogueServices()
+
         self.event_progress = EventProgress()
         self.game_flow = GameFlowController(
             self,
@@ -334,7 +338,7 @@ class GameApplication:
         if not self.home_module:
             try:
                 show_loading("家を読み込み中...", self.window_surface)
-                self.home_module = HomeModule(self.screen)
+                self.home_module = HomeModule(self.screen, dialogue_services=self.dialogue_services)
                 hide_loading()
             except Exception as e:
                 print(f"❌ 家モジュール初期化エラー: {e}")
@@ -380,7 +384,12 @@ class GameApplication:
         try:
             if request.display_loading:
                 show_loading('イベントを読み込み中...', self.window_surface)
-            dialogue = DialogueSubsystem(self.screen, self.virtual_screen, event_file)
+            dialogue = DialogueSubsystem(
+                self.screen,
+                self.virtual_screen,
+                event_file,
+                self.dialogue_services,
+            )
             if request.display_loading:
                 hide_loading()
             self.switch_to(dialogue, 'dialogue')
@@ -476,7 +485,8 @@ class GameApplication:
         save_manager = get_save_manager()
         if save_manager.reset_current_state():
             print("🎮 ゲーム状態を初期化しました")
-        
+
+        self.dialogue_services.cleanup()
         pygame.quit()
         print("✅ アプリケーション終了")
 
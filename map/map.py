@@ -18,6 +18,7 @@ from core.path_utils import get_project_root as _get_project_root
 # TimeManagerとBGMManagerをインポート
 from core.services.time_manager import get_time_manager
 from core.ui.loading_screen import show_loading, hide_loading
+from core.services.asset_pack import get_asset_packs
 from core.services.bgm_manager import BGMManager
 from core.runtime.subsystem_base import SubsystemBase
 
@@ -409,9 +410,9 @@ class FieldMap(SubsystemBase):
         
         print(f"プロジェクトルート: {project_root}")
         print(f"画像ディレクトリ: {icon_dir}")
-        print(f"ディレクトリ存在確認: {os.path.exists(icon_dir)}")
-        if os.path.exists(icon_dir):
-            print(f"アイコンファイル一覧: {os.listdir(icon_dir)}")
+        print(f"ディレクトリ存在確認: {get_asset_packs().exists(icon_dir)}")
+        if get_asset_packs().exists(icon_dir):
+            print(f"アイコンファイル一覧: {get_asset_packs().listdir(icon_dir)}")
         
         for char in self.characters:
             if char.image_file:
@@ -419,10 +420,10 @@ class FieldMap(SubsystemBase):
                     # 画像パスを構築
                     image_path = os.path.join(icon_dir, char.image_file)
                     print(f"読み込み試行: {image_path}")
-                    print(f"ファイル存在確認: {os.path.exists(image_path)}")
+                    print(f"ファイル存在確認: {get_asset_packs().exists(image_path)}")
                     
                     # 画像を読み込み
-                    char.image = pygame.image.load(image_path)
+                    char.image = get_asset_packs().load_image(image_path)
                     
                     # 高解像度で画像を保存（複数サイズ用）
                     original_image = char.image
@@ -1536,9 +1537,9 @@ class FieldMap(SubsystemBase):
 
                 background_loaded = False
                 for background_path in possible_paths:
-                    if os.path.exists(background_path):
+                    if get_asset_packs().exists(background_path):
                         from core.config import CONTENT_WIDTH, CONTENT_HEIGHT
-                        self.background_image = pygame.image.load(background_path)
+                        self.background_image = get_asset_packs().load_image(background_path)
                         # 4:3コンテンツサイズに合わせてスケール（正確な値を使用）
                         content_size = (CONTENT_WIDTH, CONTENT_HEIGHT)
                         self.background_image = pygame.transform.scale(self.background_image, content_size)
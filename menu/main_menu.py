@@ -8,6 +8,7 @@ import pygame
 
 from core.path_utils import get_project_root
 from core.runtime.subsystem_base import SubsystemBase
+from core.services.asset_pack import get_asset_packs
 from core.services.save_manager import get_save_manager
 from dialogue.choice_renderer import ChoiceRenderer
 from dialogue.name_manager import get_name_manager
@@ -93,7 +94,7 @@ class MainMenu(SubsystemBase):
         for index in range(4):
             path = os.path.join(root, "images", "UI", "menu", f"door{index}.png")
             try:
-                image = pygame.image.load(path).convert()
+                image = get_asset_packs().load_image(path).convert()
             except Exception as error:
                 print(f"[MAIN_MENU] 扉画像の読み込みに失敗: {path}: {error}")
                 image = pygame.Surface(self.screen.get_size())
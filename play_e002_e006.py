@@ -24,6 +24,7 @@ from core.ui.option_overlay import MockOptionOverlay
 from core.runtime.subsystem_base import SubsystemBase
 from core.ui.title_subsystem import TitleSubsystem
 from dialogue.dialogue_subsystem import DialogueSubsystem
+from dialogue.runtime_services import DialogueServices
 from main import GameApplication, MOCK_AWAIT_FRAMES
 
 
@@ -327,6 +328,8 @@ class AlternatingScenarioApplication(GameApplication):
 
     def __init__(self):
         super().__init__()
+        # バックログも data/current_state/ に書かず、メモリにだけ持つ
+        self.dialogue_services = DialogueServices(save_backlog=False)
         self._last_activity_at_ms = pygame.time.get_ticks()
         self._idle_await_overlay = None
 
@@ -379,6 +382,7 @@ class AlternatingScenarioApplication(GameApplication):
                 self.screen,
                 self.virtual_screen,
                 event_file,
+                self.dialogue_services,
             )
             _apply_ks_audio_volume(dialogue)
         except Exception as exc:
@@ -0,0 +1,38 @@
+import pygame
+import pytest
+
+from core.services.image_manager import ImageManager
+
+
+@pytest.fixture
+def make_image_manager(tmp_path):
+    """tmp_path に書き出した PNG を image_paths に載せた ImageManager を作る
+
+    images は (tmp_path からのディレクトリ, 種別, キー, Surface) の列。同じテストで
+    もう一度呼ぶと既にあるファイルは書き直さない（キャッシュを開き直す確認用）。
+    作った ImageManager はテストの終わりに cleanup する。
+    """
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    managers = []
+
+    def make(images, cache_budgets=None, decode_cache_dir=None):
+        manager = ImageManager(
+            debug=False,
+            cache_budgets=cache_budgets,
+            decode_cache_dir=str(decode_cache_dir) if decode_cache_dir else None,
+        )
+        manager.image_paths = {}
+        for directory, image_type, key, surface in images:
+            folder = tmp_path / directory
+            folder.mkdir(parents=True, exist_ok=True)
+            path = folder / f"{key}.png"
+            if not path.exists():
+                pygame.image.save(surface, str(path))
+            manager.image_paths.setdefault(image_type, {})[key] = str(path)
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager.cleanup()
@@ -0,0 +1,70 @@
+import os
+
+import pygame
+
+from core.services import asset_manifest, image_manager
+from core.services.asset_manifest import build_asset_manifest, load_asset_manifest, read_image_size
+from core.services.image_manager import ImageManager
+
+
+def _save(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pygame.image.save(pygame.Surface(size), str(path))
+
+
+def _images(tmp_path):
+    images = tmp_path / "images"
+    _save(images / "BG" / "room.png", (64, 36))
+    _save(images / "01MMK" / "MMK_T00_ARM12.png", (20, 50))
+    _save(images / "01MMK" / "MMK_F00_EYE01.png", (8, 4))
+    _save(images / "UI" / "ui.text-box.png", (30, 10))
+    return images
+
+
+def test_header_sizes_match_decoded_sizes(tmp_path):
+    for name, size in (("a.png", (17, 9)), ("b.jpg", (33, 21))):
+        _save(tmp_path / name, size)
+        assert read_image_size(str(tmp_path / name)) == size
+    (tmp_path / "broken.png").write_bytes(b"not an image")
+    assert read_image_size(str(tmp_path / "broken.png")) is None
+
+
+def test_only_changed_directories_are_rescanned(tmp_path, monkeypatch):
+    images = _images(tmp_path)
+    manifest_path = str(tmp_path / "manifest.json")
+    first = load_asset_manifest(str(images), manifest_path)
+    assert sorted(entry[:2] for entry in first["assets"]) == [
+        ["bg", "room"], ["eye", "MMK_F00_EYE01"], ["torso", "MMK_T00_ARM12"], ["ui", "text-box"],
+    ]
+
+    scanned = []
+    original = asset_manifest._scan_dir
+    monkeypatch.setattr(
+        asset_manifest, "_scan_dir",
+        lambda root, rel_dir, previous: scanned.append(rel_dir) or original(root, rel_dir, previous),
+    )
+    assert load_asset_manifest(str(images), manifest_path) == first
+    assert scanned == []
+
+    _save(images / "BG" / "hall.png", (40, 20))
+    stat = os.stat(images / "BG")
+    os.utime(images / "BG", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    updated = load_asset_manifest(str(images), manifest_path)
+    assert scanned == ["BG"]
+    assert ["bg", "hall", "BG/hall.png", 40, 20] in [entry[:5] for entry in updated["assets"]]
+    assert build_asset_manifest(str(images))["assets"] == updated["assets"]
+
+
+def test_scan_image_paths_reads_the_manifest(tmp_path, monkeypatch):
+    images = _images(tmp_path)
+    monkeypatch.setattr(image_manager, "get_project_root", lambda: str(tmp_path))
+    monkeypatch.setattr(image_manager, "ASSET_MANIFEST_PATH", "data/asset_manifest.json")
+
+    manager = ImageManager(debug=False, decode_cache_dir=str(tmp_path / "cache"))
+    manager.scan_image_paths(1920, 1080)
+
+    assert os.path.exists(tmp_path / "data" / "asset_manifest.json")
+    assert manager.image_paths["bg"]["room"] == os.path.join(str(images), "BG/room.png")
+    assert manager.image_paths["ui"]["text-box"].endswith("ui.text-box.png")
+    assert manager.get_image_size("torso", "MMK_T00_ARM12") == (20, 50)
+    assert manager.get_image_size("bg", "missing") is None
@@ -0,0 +1,120 @@
+import os
+import wave
+
+import pygame
+
+from core.services.asset_pack import AssetPacks, PackReader, build_asset_pack
+from core.services.bgm_manager import BGMManager
+from core.services.image_manager import ImageManager
+from core.services.se_manager import SEManager
+
+
+def _project(tmp_path):
+    """images/01MMK に立ち絵1枚、sounds/ses と sounds/bgms に音声を置いたプロジェクト"""
+    pygame.init()
+    chara_dir = tmp_path / "images" / "01MMK"
+    chara_dir.mkdir(parents=True)
+    image = pygame.Surface((6, 4), pygame.SRCALPHA)
+    image.fill((200, 100, 50, 255))
+    pygame.image.save(image, str(chara_dir / "MMK_T00.png"))
+    for sub in ("ses", "bgms"):
+        (tmp_path / "sounds" / sub).mkdir(parents=True)
+    for path in (tmp_path / "sounds" / "ses" / "door.wav", tmp_path / "sounds" / "bgms" / "theme.wav"):
+        with wave.open(str(path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(22050)
+            f.writeframes(b"\x00\x00" * 2205)
+    return tmp_path
+
+
+def _build(project, pack_dir):
+    build_asset_pack(str(pack_dir / "characters.mkpak"), str(project), ["images/[0-9][0-9][A-Z][A-Z][A-Z]"])
+    build_asset_pack(str(pack_dir / "sounds.mkpak"), str(project), ["sounds/ses", "sounds/bgms"])
+    return AssetPacks(str(pack_dir), str(project))
+
+
+def test_pack_serves_slices_of_the_original_bytes(tmp_path):
+    project = _project(tmp_path / "project")
+    packs = _build(project, tmp_path / "packs")
+    image_path = project / "images" / "01MMK" / "MMK_T00.png"
+
+    data = packs.read(str(image_path))
+    assert isinstance(data, memoryview)
+    assert bytes(data) == image_path.read_bytes()
+    stat = os.stat(image_path)
+    assert packs.stat(str(image_path)) == (stat.st_mtime_ns, stat.st_size)
+    assert packs.read(str(project / "images" / "01MMK" / "missing.png")) is None
+    assert list(packs.entries_under("images")) == [("images/01MMK/MMK_T00.png", 6, 4)]
+    packs.close()
+
+
+def test_managers_read_from_the_pack_when_loose_files_are_gone(tmp_path):
+    project = _project(tmp_path / "project")
+    packs = _build(project, tmp_path / "packs")
+    image_path = project / "images" / "01MMK" / "MMK_T00.png"
+    os.remove(image_path)
+    os.remove(project / "sounds" / "ses" / "door.wav")
+    os.remove(project / "sounds" / "bgms" / "theme.wav")
+
+    pygame.display.set_mode((1, 1))
+    manager = ImageManager(debug=False, asset_packs=packs)
+    manager.image_paths = {"torso": {"MMK_T00": str(image_path)}}
+    image = manager.get_image("torso", "MMK_T00")
+    assert image.get_size() == (6, 4)
+    assert tuple(image.get_at((0, 0))) == (200, 100, 50, 255)
+
+    pygame.mixer.init()
+    se_manager = SEManager(debug=False, asset_packs=packs)
+    sound = se_manager._get_cached_sound(str(project / "sounds" / "ses" / "door.wav"))
+    assert abs(sound.get_length() - 0.1) < 0.01
+
+    bgm_manager = BGMManager(debug=False, asset_packs=packs)
+    bgm_manager.BGM_PATH = str(project / "sounds" / "bgms")
+    assert bgm_manager.get_bgm_for_scene("theme") == "theme.wav"
+    assert packs.listdir(bgm_manager.BGM_PATH) == ["theme.wav"]
+    manager.cleanup()
+    se_manager.cleanup()
+
+
+def test_pack_reader_hands_pygame_slices_of_the_mapped_pack(tmp_path):
+    project = _project(tmp_path / "project")
+    packs = _build(project, tmp_path / "packs")
+    image_path = project / "images" / "01MMK" / "MMK_T00.png"
+    expected = image_path.read_bytes()
+
+    reader = packs.source(str(image_path))
+    assert isinstance(reader, PackReader)
+    # 読むたびに要求された分だけを返し、パック側の中身を抱え込まない
+    assert reader.read(8) == expected[:8] and reader.tell() == 8
+    assert reader.seek(-4, 2) == len(expected) - 4 and reader.read() == expected[-4:]
+    reader.seek(0)
+    buffer = bytearray(len(expected) + 10)
+    assert reader.readinto(buffer) == len(expected) and bytes(buffer[:len(expected)]) == expected
+
+    os.remove(image_path)
+    image = packs.load_image(str(image_path))
+    assert image.get_size() == (6, 4) and tuple(image.get_at((0, 0))) == (200, 100, 50, 255)
+    packs.close()
+
+
+def test_loose_files_are_used_when_the_pack_is_stale_or_missing_them(tmp_path):
+    project = _project(tmp_path / "project")
+    _build(project, tmp_path / "packs").close()
+    chara_dir = project / "images" / "01MMK"
+
+    # パックに無いファイルはばらのファイルから
+    packs = AssetPacks(str(tmp_path / "packs"), str(project))
+    new_path = chara_dir / "MMK_T01.png"
+    assert packs.source(str(new_path)) == str(new_path)
+    assert packs.listdir(str(project / "sounds" / "ses")) == ["door.wav"]
+    packs.close()
+
+    # ファイルが増えて元ディレクトリの更新時刻が変わったパックは使わない
+    pygame.image.save(pygame.Surface((2, 2)), str(new_path))
+    os.utime(chara_dir, ns=(0, os.stat(chara_dir).st_mtime_ns + 1_000_000_000))
+    packs = AssetPacks(str(tmp_path / "packs"), str(project))
+    assert [os.path.basename(pack.path) for pack in packs.packs] == ["sounds.mkpak"]
+    assert packs.read(str(chara_dir / "MMK_T00.png")) is None
+    assert packs.exists(str(chara_dir / "MMK_T00.png"))
+    packs.close()
@@ -0,0 +1,111 @@
+import threading
+
+import pygame
+
+from core.services.decode_pipeline import PRIORITY_NEXT_STEP, PRIORITY_PREFETCH
+from dialogue.asset_prefetcher import AssetPrefetcher, collect_step_assets
+
+
+def _step(*actions):
+    return {"actions": [dict(action) for action in actions]}
+
+
+def _images(names):
+    return [("", image_type, key, pygame.Surface((8, 8), pygame.SRCALPHA)) for image_type, key in names]
+
+
+def _drain(manager):
+    assert manager.decode_pipeline.wait_idle(timeout=5)
+    manager.finalize_decoded(budget_ms=1000)
+
+
+def test_collects_torso_parts_and_backgrounds_from_steps():
+    step = _step(
+        {"action": "chara_show", "target": "MMK_T00", "params": {"eye": "EYE01", "mouth": ""}},
+        {"action": "chara_shift", "target": "momoko", "params": {"torso": "MMK_T01", "brow": "BRO02"}},
+        {"action": "chara_shift", "target": "momoko", "params": {"eye": "EYE03"}},
+        {"action": "bg_show", "params": {"storage": "BG_ROOM"}},
+        {"action": "se_play", "params": {"file": "door"}},
+    )
+
+    assert collect_step_assets(step) == [
+        ("torso", "MMK_T00"),
+        ("eye", "EYE01"),
+        ("torso", "MMK_T01"),
+        ("brow", "BRO02"),
+        ("eye", "EYE03"),
+        ("bg", "BG_ROOM"),
+    ]
+
+
+def test_prefetched_images_are_cache_hits_when_the_step_runs(make_image_manager):
+    manager = make_image_manager(_images([("torso", "T00"), ("eye", "E01"), ("bg", "ROOM"), ("bg", "FAR")]))
+    steps = [
+        _step({"action": "bg_show", "params": {"storage": "ROOM"}}),
+        _step({"action": "chara_show", "target": "T00", "params": {"eye": "E01"}}),
+        _step(),
+        _step({"action": "bg_show", "params": {"storage": "FAR"}}),
+    ]
+    game_state = {"ir_data": {"steps": steps}, "ir_step_index": -1}
+    prefetcher = AssetPrefetcher(manager, lookahead=2)
+
+    prefetcher.update(game_state)
+    prefetcher.update(game_state)
+    _drain(manager)
+
+    for image_type, key in (("bg", "ROOM"), ("torso", "T00"), ("eye", "E01"), ("bg", "FAR")):
+        assert manager.get_image(image_type, key) is not None
+    stats = prefetcher.get_stats()
+    # 先読みは窓内の3枚だけ（同じステップ位置では再投入しない）、FAR は要求時に読み込み
+    assert stats["prefetched"] == 3
+    assert (stats["hits"], stats["late"], stats["demand_loads"]) == (3, 0, 1)
+    assert stats["hit_rate"] == 0.75
+    assert stats["worst_stall_ms"] > 0
+
+
+def test_request_during_prefetch_waits_for_the_worker_and_counts_as_late(make_image_manager, monkeypatch):
+    manager = make_image_manager(_images([("torso", "T00")]))
+    release = threading.Event()
+    decode = manager._decode_pixels
+
+    def slow_decode(filepath, size, pixel_format):
+        release.wait(timeout=5)
+        return decode(filepath, size, pixel_format)
+
+    monkeypatch.setattr(manager, "_decode_pixels", slow_decode)
+    assert manager.prefetch_image("torso", "T00")
+    assert not manager.prefetch_image("torso", "T00")
+    threading.Timer(0.05, release.set).start()
+
+    assert manager.get_image("torso", "T00") is not None
+    _drain(manager)
+    stats = manager.get_prefetch_stats()
+    assert (stats["hits"], stats["late"], stats["demand_loads"]) == (0, 1, 0)
+    assert stats["worst_stall_ms"] >= 40
+
+
+def test_next_step_is_decoded_first_and_finished_images_are_finalized_every_frame(make_image_manager):
+    manager = make_image_manager(_images([("torso", "T00"), ("bg", "ROOM"), ("bg", "FAR")]))
+    submitted = []
+    finalized = []
+    prefetch = manager.prefetch_image
+    manager.prefetch_image = lambda *args, **kwargs: submitted.append((args, kwargs["priority"])) or prefetch(*args, **kwargs)
+    manager.finalize_decoded = lambda: finalized.append(True)
+    steps = [
+        _step({"action": "bg_show", "params": {"storage": "ROOM"}}),
+        _step({"action": "chara_show", "target": "T00", "params": {}}),
+        _step({"action": "bg_show", "params": {"storage": "ROOM"}}, {"action": "bg_show", "params": {"storage": "FAR"}}),
+    ]
+    game_state = {"ir_data": {"steps": steps}, "ir_step_index": -1}
+    prefetcher = AssetPrefetcher(manager, lookahead=3)
+
+    prefetcher.update(game_state)
+    prefetcher.update(game_state)
+
+    assert submitted == [
+        (("bg", "ROOM"), PRIORITY_NEXT_STEP),
+        (("torso", "T00"), PRIORITY_PREFETCH),
+        (("bg", "FAR"), PRIORITY_PREFETCH),
+    ]
+    # ステップが進まないフレームでも仕上げは進める
+    assert len(finalized) == 2
@@ -0,0 +1,109 @@
+import pygame
+
+from core.config import VIRTUAL_HEIGHT, VIRTUAL_WIDTH
+from dialogue import background_manager
+from dialogue.background_manager import draw_background, plan_background_zooms
+
+
+class _Images:
+    def __init__(self, images):
+        self.images = images
+
+    def get_image(self, image_type, image_id):
+        return self.images.get((image_type, image_id))
+
+
+def setup_function():
+    pygame.init()
+    background_manager._bg_masters.clear()
+    background_manager._bg_frame_cache.clear()
+
+
+def _source():
+    # 位置ずれが分かるように縦縞と横縞を入れる
+    source = pygame.Surface((640, 480))
+    for x in range(0, 640, 8):
+        source.fill((x % 256, 80, 160), (x, 0, 4, 480))
+    for y in range(0, 480, 10):
+        source.fill((40, y % 256, 20), (0, y, 640, 3))
+    return source
+
+
+def _state(source, zoom, pos=(0, 0), anim=None, steps=None):
+    return {
+        "screen": pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT)),
+        "image_manager": _Images({("bg", "room"): source}),
+        "ir_data": {"steps": steps or []},
+        "background_state": {"current_bg": "room", "zoom": zoom, "pos": list(pos), "anim": anim},
+    }
+
+
+def _steps():
+    return [
+        {"actions": [{"action": "bg_show", "params": {"storage": "room", "zoom": "1.1"}}]},
+        {"actions": [{"action": "bg_move", "params": {"zoom": "1.5"}}]},
+        {"actions": [{"action": "bg_show", "params": {"storage": "hall", "zoom": "1.0"}}]},
+    ]
+
+
+def test_plan_collects_the_largest_zoom_per_background():
+    assert plan_background_zooms(_steps()) == {"room": 1.5, "hall": 1.0}
+
+
+def test_pan_and_zoom_reuse_one_master(monkeypatch):
+    source = _source()
+    scales = []
+    original = pygame.transform.scale
+    monkeypatch.setattr(
+        pygame.transform, "scale", lambda surface, size: scales.append(size) or original(surface, size)
+    )
+    state = _state(source, 1.1, steps=_steps())
+    bg_state = state["background_state"]
+    bg_state["anim"] = {"start_zoom": 1.1, "target_zoom": 1.5}
+    for frame in range(21):
+        bg_state["zoom"] = 1.1 + 0.4 * frame / 20
+        bg_state["pos"] = [frame * 3, -frame * 2]
+        draw_background(state)
+
+    master_size = background_manager._background_size(1.5)
+    assert scales.count(master_size) == 1
+    # マスター以外の拡縮は、どれも画面に収まるサイズ
+    assert all(w <= VIRTUAL_WIDTH and h <= VIRTUAL_HEIGHT for w, h in scales if (w, h) != master_size)
+
+
+def test_master_zoom_frames_match_a_direct_scale():
+    source = _source()
+    state = _state(source, 1.5, pos=(37, -21), steps=_steps())
+    draw_background(state)
+
+    size = background_manager._background_size(1.5)
+    expected = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
+    expected.blit(
+        pygame.transform.scale(source, size),
+        ((VIRTUAL_WIDTH - size[0]) // 2 + 37, (VIRTUAL_HEIGHT - size[1]) // 2 - 21),
+    )
+    assert pygame.image.tobytes(state["screen"], "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def test_static_frames_are_not_rescaled_and_only_margins_are_filled(monkeypatch):
+    source = _source()
+    state = _state(source, 1.1, steps=_steps())
+    draw_background(state)
+
+    scales = []
+    fills = []
+    monkeypatch.setattr(pygame.transform, "scale", lambda surface, size: scales.append(size))
+    screen = state["screen"]
+    state["screen"] = type("Screen", (pygame.Surface,), {"fill": lambda self, *a: fills.append(a) or pygame.Surface.fill(self, *a)})(
+        screen.get_size()
+    )
+    draw_background(state)
+    assert scales == [] and fills == []
+
+    # 縮小時は余白を1回だけ塗る
+    state["background_state"]["zoom"] = 0.8
+    state["ir_data"] = {"steps": []}
+    monkeypatch.undo()
+    draw_background(state)
+    assert fills == [((20, 20, 40),)]
+    assert state["screen"].get_at((0, 0))[:3] == (20, 20, 40)
@@ -0,0 +1,77 @@
+from dialogue import backlog_store
+from dialogue.backlog_store import BacklogRecord, BacklogStore
+
+
+def test_store_keeps_only_the_memory_window_and_reads_old_entries_back(tmp_path):
+    path = tmp_path / "backlog.jsonl"
+    store = BacklogStore(str(path), memory_entries=10)
+    for index in range(200):
+        store.add("A" if index % 2 else "B", f"line{index}", force_female=index == 7)
+
+    assert len(store) == 200
+    assert store.resident_count() == 10
+    assert store[-1] == {"speaker": "A", "text": "line199", "force_female": False}
+    assert store[7] == {"speaker": "A", "text": "line7", "force_female": True}
+    assert [entry["text"] for entry in store[-3:]] == ["line197", "line198", "line199"]
+    # 読み戻しはページ単位なので、リングに1ページぶん増えるだけ
+    assert store.resident_count() <= 10 + backlog_store._READBACK_PAGE_SIZE
+    assert store.speakers == ["B", "A"]
+
+
+def test_records_are_slotted_and_speakers_interned(tmp_path):
+    store = BacklogStore(str(tmp_path / "backlog.jsonl"), memory_entries=4)
+    for index in range(50):
+        store.add("話者", f"セリフ{index}")
+
+    assert store.speakers == ["話者"]
+    assert not hasattr(BacklogRecord(0, 0, "", False), "__dict__")
+    assert store.speaker_key(0) == store.speaker_key(49)
+
+
+def test_backlog_survives_reopen_and_pop_truncates_the_file(tmp_path):
+    path = tmp_path / "backlog.jsonl"
+    store = BacklogStore(str(path), memory_entries=3)
+    for index in range(20):
+        store.add("A", f"line{index}")
+    assert store.pop()["text"] == "line19"
+    store.add("B", "line19b")
+
+    reopened = BacklogStore(str(path), memory_entries=3)
+    assert len(reopened) == 20
+    assert reopened[0]["text"] == "line0"
+    assert reopened[-1] == {"speaker": "B", "text": "line19b", "force_female": False}
+    assert path.read_bytes().count(b"\n") == 20
+
+
+def test_reopen_drops_a_partially_written_last_line(tmp_path):
+    path = tmp_path / "backlog.jsonl"
+    store = BacklogStore(str(path))
+    store.add("A", "one")
+    with open(path, "ab") as handle:
+        handle.write(b'{"speaker": "A", "te')
+
+    reopened = BacklogStore(str(path))
+    reopened.add("A", "two")
+    assert [entry["text"] for entry in BacklogStore(str(path))] == ["one", "two"]
+
+
+def test_store_without_spill_path_keeps_everything_in_memory():
+    store = BacklogStore()
+    for index in range(500):
+        store.add("A", f"line{index}")
+
+    assert store.resident_count() == 500
+    assert store[0]["text"] == "line0"
+
+
+def test_is_current_tracks_own_writes_and_detects_a_replaced_file(tmp_path):
+    path = tmp_path / "backlog.jsonl"
+    store = BacklogStore(str(path), memory_entries=4)
+    store.add("A", "one")
+    store.add("A", "two")
+    store.pop()
+    assert store.is_current()
+
+    path.write_bytes(b'{"speaker": "B", "text": "loaded", "force_female": false}\n')
+    assert not store.is_current()
+    assert BacklogStore().is_current()
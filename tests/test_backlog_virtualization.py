@@ -0,0 +1,105 @@
+import pygame
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QApplication
+
+from dialogue.backlog_manager import BacklogManager
+
+
+class _Names:
+    def substitute_variables(self, text):
+        return text
+
+
+_qt_app = None
+
+
+def _manager():
+    global _qt_app
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    _qt_app = QApplication.instance() or QApplication([])
+    manager = BacklogManager(
+        pygame.Surface((1920, 1080), pygame.SRCALPHA),
+        {"text": QFont("Sans", 20), "name": QFont("Sans", 20)},
+    )
+    manager.name_manager = _Names()
+    return manager
+
+
+def test_add_entry_wraps_only_the_new_entry(monkeypatch):
+    manager = _manager()
+    wrapped = []
+    original = manager._wrap_text
+    monkeypatch.setattr(
+        manager, "_wrap_text", lambda text, max_chars=26: wrapped.append(text) or original(text, max_chars)
+    )
+
+    for index in range(200):
+        manager.add_entry("A" if index % 2 else "B", f"セリフ{index:03d}" * 5)
+    wrapped.clear()
+    manager.toggle_backlog()
+    manager.render()
+
+    assert wrapped == []
+    assert manager._count_total_lines() == 400
+    assert manager.scroll_position == 400 - manager._get_visible_lines()
+
+
+def test_render_builds_only_the_visible_window_once(monkeypatch):
+    manager = _manager()
+    for index in range(100):
+        manager.add_entry("A", f"line{index}")
+    built = []
+    original = manager._render_with_fx_uncached
+    monkeypatch.setattr(
+        manager,
+        "_render_with_fx_uncached",
+        lambda text, qfont, color: built.append(text) or original(text, qfont, color),
+    )
+
+    manager.toggle_backlog()
+    manager.render()
+    manager.render()
+
+    assert built == [f"line{index}" for index in range(89, 100)]
+
+    manager.scroll_up()
+    manager.render()
+    assert built[-1] == "line88"
+    assert len(built) == 12
+
+
+def _index_lines(manager):
+    manager._sync_line_index()
+    return [manager._line_at(i)[1:] for i in range(manager._line_total)]
+
+
+def test_speaker_is_shown_only_when_it_changes_and_pop_entry_shrinks_index():
+    manager = _manager()
+    manager.add_entry("A", "one")
+    manager.add_entry("A", "two")
+    manager.add_entry("B", "three")
+
+    assert [speaker for speaker, _ in _index_lines(manager)] == ["A", "", "B"]
+
+    manager.pop_entry()
+    manager.add_entry("A", "four")
+    assert _index_lines(manager) == [("A", "one"), ("", "two"), ("", "four")]
+
+    # entries を直接縮めても次の描画で索引が追従する
+    manager.entries.pop()
+    manager.entries.add("C", "five")
+    assert manager._count_total_lines() == 3
+    assert _index_lines(manager)[-1] == ("C", "five")
+
+
+def test_empty_entry_takes_no_lines():
+    manager = _manager()
+    manager.add_entry("A", "one")
+    # add_entry は空文を弾くので、ストアへ直接積む
+    manager.entries.add("B", "")
+    manager.entries.add("B", "two")
+
+    assert manager._count_total_lines() == 2
+    # 空のエントリは行を持たないが、話者の切り替わりには数える
+    assert _index_lines(manager) == [("A", "one"), ("", "two")]
@@ -0,0 +1,82 @@
+import os
+
+import pygame
+import pytest
+
+from core.config import VIRTUAL_HEIGHT, VIRTUAL_WIDTH
+
+
+def _images():
+    images = []
+    for key, size in (("big", (2732, 2048)), ("small", (640, 480))):
+        source = pygame.Surface(size)
+        source.fill((30, 90, 150))
+        images.append(("BG", "bg", key, source))
+    return images
+
+
+@pytest.fixture
+def open_manager(make_image_manager, tmp_path):
+    """同じ背景とキャッシュディレクトリで ImageManager を開き直す"""
+    return lambda: make_image_manager(_images(), decode_cache_dir=tmp_path / "cache")
+
+
+def test_oversized_background_is_decoded_at_the_largest_shown_size(open_manager):
+    manager = open_manager()
+    # 縮小が有効になるまでは元サイズのまま
+    assert manager.get_image("bg", "big").get_size() == (2732, 2048)
+
+    manager.set_background_zooms({"big": 1.0})
+    image = manager.get_image("bg", "big")
+    assert image.get_size() == (VIRTUAL_WIDTH, VIRTUAL_HEIGHT)
+    pixel = image.get_at((100, 100))
+    # 不透明な背景は不透明のまま（色は smoothscale の丸めで 1～3 下がることがある）
+    assert pixel.a == 255 and all(abs(c - e) <= 3 for c, e in zip(pixel[:3], (30, 90, 150)))
+    # 元から小さい背景は拡大しない
+    assert manager.get_image("bg", "small").get_size() == (640, 480)
+
+    # ズームの上限が上がれば、その大きさで読み直す
+    manager.set_background_zooms({"big": 1.5})
+    assert manager.get_image("bg", "big").get_size() == (int(VIRTUAL_WIDTH * 1.5), int(VIRTUAL_HEIGHT * 1.5))
+
+
+def test_downscale_is_reused_from_disk_until_the_source_changes(open_manager, monkeypatch):
+    manager = open_manager()
+    manager.set_background_zooms({"big": 1.0})
+    manager.get_image("bg", "big")
+
+    smoothscales = []
+    original = pygame.transform.smoothscale
+    monkeypatch.setattr(
+        pygame.transform, "smoothscale", lambda surface, size: smoothscales.append(size) or original(surface, size)
+    )
+    reopened = open_manager()
+    reopened.set_background_zooms({"big": 1.0})
+    assert reopened.get_image("bg", "big").get_size() == (VIRTUAL_WIDTH, VIRTUAL_HEIGHT)
+    assert smoothscales == []
+
+    # 元画像が変われば作り直す（古いキャッシュは使わない）
+    stat = os.stat(reopened.image_paths["bg"]["big"])
+    os.utime(reopened.image_paths["bg"]["big"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    reopened.set_background_zooms(None)
+    reopened.set_background_zooms({"big": 1.0})
+    reopened.get_image("bg", "big")
+    assert smoothscales == [(VIRTUAL_WIDTH, VIRTUAL_HEIGHT)]
+
+
+def test_fine_detail_is_averaged_instead_of_aliased(open_manager, tmp_path):
+    manager = open_manager()
+    # 1px おきの縦縞。最近傍を経由するとまばらな白黒の縞になる
+    stripes = pygame.Surface((2732, 2048), pygame.SRCALPHA)
+    stripes.fill((0, 0, 0, 255))
+    for x in range(0, 2732, 2):
+        stripes.fill((255, 255, 255, 255), (x, 0, 1, 2048))
+    path = tmp_path / "BG" / "stripes.png"
+    pygame.image.save(stripes, str(path))
+    manager.image_paths["bg"]["stripes"] = str(path)
+    manager.set_background_zooms({"stripes": 1.0})
+
+    image = manager.get_image("bg", "stripes")
+    row = [image.get_at((x, 500)) for x in range(VIRTUAL_WIDTH)]
+    assert max(p.r for p in row) - min(p.r for p in row) < 32
+    assert all(p.a == 255 for p in row)
@@ -0,0 +1,69 @@
+import pygame
+
+from dialogue.character_manager import _blit_with_alpha, render_face_parts
+
+
+class _CountingSurface(pygame.Surface):
+    copies = 0
+
+    def copy(self):
+        type(self).copies += 1
+        return super().copy()
+
+
+def _reference_blit(screen, image, pos, alpha):
+    temp = pygame.Surface.copy(image)
+    temp.set_alpha(alpha)
+    screen.blit(temp, pos)
+
+
+def _part():
+    image = _CountingSurface((32, 24), pygame.SRCALPHA)
+    for x in range(32):
+        for y in range(24):
+            image.set_at((x, y), (x * 8, y * 10, 255 - x * 4, (x * 7 + y * 11) % 256))
+    return image
+
+
+def _backgrounds():
+    opaque = pygame.Surface((48, 40))
+    opaque.fill((40, 90, 140))
+    translucent = pygame.Surface((48, 40), pygame.SRCALPHA)
+    translucent.fill((200, 30, 60, 120))
+    return opaque, translucent
+
+
+def test_alpha_blit_is_pixel_equivalent_to_copy_and_set_alpha():
+    pygame.init()
+    image = _part()
+    for alpha in (1, 64, 128, 200, 254):
+        for background in _backgrounds():
+            expected = background.copy()
+            actual = background.copy()
+            _reference_blit(expected, image, (5, 7), alpha)
+            _blit_with_alpha(actual, image, (5, 7), alpha)
+            assert pygame.image.tobytes(actual, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+    # 元 Surface の全体アルファは元に戻っている
+    assert image.get_alpha() == 255
+
+
+def test_face_part_fade_does_not_copy_part_surfaces(monkeypatch):
+    pygame.init()
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: 500)
+    _CountingSurface.copies = 0
+    torso = pygame.Surface((40, 40), pygame.SRCALPHA)
+    images = {("torso", "T00"): torso, ("eye", "A"): _part(), ("eye", "B"): _part()}
+    manager = type("Images", (), {"get_image": lambda self, kind, key: images.get((kind, key))})()
+    game_state = {
+        "screen": pygame.Surface((64, 64)),
+        "image_manager": manager,
+        "character_pos": {"momoko": [0, 0]},
+        "character_torso": {"momoko": "T00"},
+        "character_expressions": {"momoko": {}},
+    }
+    fade_map = {"eye": {"from": "A", "to": "B", "start_time": 0, "duration": 1000}}
+
+    for _ in range(5):
+        render_face_parts(game_state, "momoko", "", "B", "", "", 1.0, fade_map=fade_map, current_time=500)
+
+    assert _CountingSurface.copies == 0
@@ -0,0 +1,114 @@
+import pygame
+
+from core.config import VIRTUAL_HEIGHT
+from dialogue import character_manager
+from dialogue.character_manager import clear_character_composite_cache, draw_characters
+
+
+class _ImageManager:
+    def __init__(self, images):
+        self.images = images
+        self.requests = 0
+
+    def get_image(self, image_type, image_id):
+        self.requests += 1
+        return self.images.get((image_type, image_id))
+
+
+def _layer(size, color, rect):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color, rect)
+    return surface
+
+
+def _images():
+    height = VIRTUAL_HEIGHT
+    return {
+        ("torso", "T00"): _layer((60, height), (200, 120, 90, 255), (5, 0, 50, height)),
+        ("eye", "EYE01"): _layer((40, 30), (20, 40, 200, 160), (5, 5, 30, 10)),
+        ("eye", "BLINK"): _layer((40, 30), (20, 20, 20, 255), (5, 12, 30, 3)),
+        ("mouth", "M01"): _layer((20, 20), (230, 10, 60, 90), (2, 2, 16, 8)),
+    }
+
+
+def _game_state(screen, manager, names=("momoko",)):
+    return {
+        "dialogue_data": [],
+        "current_paragraph": 0,
+        "screen": screen,
+        "image_manager": manager,
+        "active_characters": list(names),
+        "character_pos": {name: [100 + 200 * i, 0] for i, name in enumerate(names)},
+        "character_zoom": {name: 1.0 for name in names},
+        "character_torso": {name: "T00" for name in names},
+        "character_expressions": {
+            name: {"eye": "EYE01", "mouth": "M01", "eye_blink": "BLINK"} for name in names
+        },
+        "character_blink_state": {},
+        "character_part_fades": {},
+        "character_anim": {},
+        "show_face_parts": True,
+    }
+
+
+def setup_function():
+    pygame.init()
+    clear_character_composite_cache()
+
+
+def test_flattened_character_matches_per_layer_drawing():
+    manager = _ImageManager(_images())
+    flat_screen = pygame.Surface((800, VIRTUAL_HEIGHT))
+    flat_screen.fill((30, 60, 90))
+    layered_screen = flat_screen.copy()
+
+    draw_characters(_game_state(flat_screen, manager))
+    state = _game_state(layered_screen, manager)
+    # 何も描かないパーツのフェードを入れて、レイヤーごとの描画経路を通す
+    state["character_part_fades"] = {"momoko": {"cheek": {"from": "", "to": "", "duration": 0}}}
+    draw_characters(state)
+
+    flat = pygame.image.tobytes(flat_screen, "RGB")
+    layered = pygame.image.tobytes(layered_screen, "RGB")
+    assert max(abs(a - b) for a, b in zip(flat, layered)) <= 2
+    assert flat != pygame.image.tobytes(pygame.Surface((800, VIRTUAL_HEIGHT)), "RGB")
+
+
+def test_three_characters_cost_three_blits_per_frame():
+    manager = _ImageManager(_images())
+    blits = []
+    screen = type("Screen", (), {"blit": lambda self, *args, **kwargs: blits.append(args)})()
+    state = _game_state(screen, manager, names=("a", "b", "c"))
+
+    draw_characters(state)
+    draw_characters(state)
+
+    assert len(blits) == 6
+    assert len(character_manager._character_composite_cache) == 1
+
+    # まばたき中は閉じ目の合成を別に持つ
+    state["character_blink_state"] = {"a": {"current_state": "blinking"}}
+    blits.clear()
+    draw_characters(state)
+    assert len(blits) == 3
+    assert len(character_manager._character_composite_cache) == 2
+
+
+def test_composite_cache_is_bounded_by_bytes(monkeypatch):
+    manager = _ImageManager(_images())
+    screen = pygame.Surface((800, VIRTUAL_HEIGHT))
+    state = _game_state(screen, manager)
+    draw_characters(state)
+    one = next(iter(character_manager._character_composite_cache.values()))[0]
+    monkeypatch.setattr(
+        character_manager,
+        "_CHARACTER_COMPOSITE_CACHE_BYTES",
+        one.get_bytesize() * one.get_width() * one.get_height() + 1,
+    )
+
+    for zoom in (1.0, 0.9, 0.8):
+        state["character_zoom"]["momoko"] = zoom
+        draw_characters(state)
+
+    assert len(character_manager._character_composite_cache) == 1
+    assert character_manager._character_composite_cache_bytes <= character_manager._CHARACTER_COMPOSITE_CACHE_BYTES
@@ -0,0 +1,61 @@
+import pygame
+
+from dialogue.choice_renderer import ChoiceRenderer
+
+
+def _renderer():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    renderer = ChoiceRenderer(pygame.Surface((1920, 1080), pygame.SRCALPHA))
+    renderer.name_manager = type("Names", (), {"substitute_variables": lambda self, text: text})()
+    return renderer
+
+
+def test_hovering_a_three_column_grid_does_not_rasterize(monkeypatch):
+    renderer = _renderer()
+    rendered = []
+    original = renderer._render_choice_with_grid_system
+    monkeypatch.setattr(
+        renderer,
+        "_render_choice_with_grid_system",
+        lambda text, color: rendered.append((text, color)) or original(text, color),
+    )
+    layouts = []
+    original_layout = renderer._calculate_column_layout
+    monkeypatch.setattr(
+        renderer,
+        "_calculate_column_layout",
+        lambda count: layouts.append(count) or original_layout(count),
+    )
+
+    renderer.show_choices([f"選択肢{index}" for index in range(9)])
+    assert renderer.current_columns == 3
+    assert len(rendered) == 18
+    assert layouts == [9]
+
+    for rect in renderer.choice_rects:
+        renderer.handle_mouse_motion(rect.center)
+        renderer.render()
+    renderer.handle_mouse_motion((0, 0))
+    renderer.render()
+
+    assert len(rendered) == 18
+    assert layouts == [9]
+
+
+def test_render_blits_the_highlight_variant_for_the_hovered_choice():
+    renderer = _renderer()
+    renderer.show_choices(["はい", "いいえ"])
+    blits = []
+    renderer.screen = type("Screen", (), {"blit": lambda self, surface, pos: blits.append((surface, pos))})()
+
+    renderer.handle_mouse_motion(renderer.choice_rects[1].center)
+    renderer.render()
+
+    normal, _ = renderer._choice_surfaces[0]
+    _, highlight = renderer._choice_surfaces[1]
+    assert blits == [(normal, renderer._choice_positions[0]), (highlight, renderer._choice_positions[1])]
+    assert blits[1][1] == renderer.choice_rects[1].topleft
+
+    renderer.hide_choices()
+    assert renderer._choice_surfaces == []
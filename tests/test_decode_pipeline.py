@@ -0,0 +1,147 @@
+import threading
+import time
+
+import pygame
+
+from core.services.decode_pipeline import (
+    PRIORITY_NEXT_STEP,
+    PRIORITY_PREFETCH,
+    DecodePipeline,
+)
+
+
+class _GatedDecode:
+    """最初の job で止まり、release されるまで待つ decode。実行順を記録する"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.order = []
+
+    def __call__(self, job):
+        self.order.append(job)
+        self.started.set()
+        self.release.wait(timeout=5)
+        return f"decoded:{job}"
+
+
+def test_jobs_run_in_priority_order_and_queued_jobs_are_promoted():
+    decode = _GatedDecode()
+    pipeline = DecodePipeline(decode, workers=1)
+    pipeline.submit("first", "first", PRIORITY_PREFETCH)
+    assert decode.started.wait(timeout=5)  # ワーカーは first で止まっている
+
+    assert pipeline.submit("far", "far", PRIORITY_PREFETCH)
+    assert pipeline.submit("next", "next", PRIORITY_NEXT_STEP)
+    assert pipeline.submit("late", "late", PRIORITY_PREFETCH)
+    # 既に並んでいる late を引き上げる（投入し直しはしない）
+    assert not pipeline.submit("late", "late", PRIORITY_NEXT_STEP)
+    decode.release.set()
+
+    assert pipeline.wait_idle(timeout=5)
+    assert decode.order == ["first", "next", "late", "far"]
+    pipeline.shutdown()
+
+
+def test_take_withdraws_a_queued_job_and_waits_for_a_running_one():
+    decode = _GatedDecode()
+    pipeline = DecodePipeline(decode, workers=1)
+    pipeline.submit("running", "running")
+    assert decode.started.wait(timeout=5)
+    pipeline.submit("queued", "queued")
+
+    # キューにあるだけの要求は取り下げ、要求側がその場でデコードする
+    assert pipeline.take("queued") == (False, None)
+    assert not pipeline.is_pending("queued")
+
+    threading.Timer(0.05, decode.release.set).start()
+    assert pipeline.take("running", timeout=5) == (True, "decoded:running")
+    assert pipeline.wait_idle(timeout=5)
+    assert decode.order == ["running"]
+    assert pipeline.pending_count() == 0
+    pipeline.shutdown()
+
+
+def test_finalize_stops_at_the_budget_and_leaves_the_rest_for_the_next_frame():
+    pipeline = DecodePipeline(lambda job: job, workers=2)
+    for key, priority in (("a", PRIORITY_PREFETCH), ("b", PRIORITY_NEXT_STEP)):
+        pipeline.submit(key, key, priority)
+    assert pipeline.wait_idle(timeout=5)
+
+    finished = []
+
+    def slow_finish(key, result):
+        finished.append(result)
+        time.sleep(0.005)
+
+    # 予算を超えても1件は進める
+    assert pipeline.finalize(slow_finish, budget_ms=1.0) == 1
+    assert pipeline.pending_count() == 1
+    assert pipeline.finalize(slow_finish, budget_ms=1000.0) == 1
+    assert finished == ["b", "a"]
+    assert pipeline.finalize(slow_finish) == 0
+    pipeline.shutdown()
+
+
+def test_failed_decodes_are_finalized_as_none():
+    def decode(job):
+        raise ValueError(job)
+
+    pipeline = DecodePipeline(decode, workers=1)
+    pipeline.submit("broken", "broken")
+    assert pipeline.wait_idle(timeout=5)
+    results = []
+    pipeline.finalize(lambda key, result: results.append((key, result)))
+    assert results == [("broken", None)]
+    pipeline.shutdown()
+
+
+def test_workers_only_decode_pixels_and_surfaces_are_made_on_finalize(make_image_manager, monkeypatch):
+    source = pygame.Surface((4, 3), pygame.SRCALPHA)
+    source.fill((10, 20, 30, 128))
+    manager = make_image_manager([("", "torso", "T00", source)])
+    path = manager.image_paths["torso"]["T00"]
+
+    main_thread = threading.current_thread()
+    decoded = []
+    surface_threads = []
+    decode_pixels = manager._decode_pixels
+    frombuffer = pygame.image.frombuffer
+
+    def tracking_decode(*args):
+        result = decode_pixels(*args)
+        decoded.append((threading.current_thread(), result))
+        return result
+
+    def tracking_frombuffer(*args, **kwargs):
+        surface_threads.append(threading.current_thread())
+        return frombuffer(*args, **kwargs)
+
+    monkeypatch.setattr(manager, "_decode_pixels", tracking_decode)
+    assert manager.prefetch_image("torso", "T00")
+    assert manager.decode_pipeline.wait_idle(timeout=5)
+    # ワーカーが返すのは生ピクセルだけ
+    (worker, (pixels, size, pixel_format, layout)), = decoded
+    assert worker is not main_thread
+    assert isinstance(pixels, bytearray) and size == (4, 3) and layout is None
+    assert f"{path}_original" not in manager.image_cache
+    monkeypatch.setattr(pygame.image, "frombuffer", tracking_frombuffer)
+
+    assert manager.finalize_decoded() == 1
+    assert surface_threads == [main_thread]
+    image = manager.get_image("torso", "T00")
+    assert image.get_size() == (4, 3)
+    assert tuple(image.get_at((0, 0))) == (10, 20, 30, 128)
+    assert manager.get_prefetch_stats()["hits"] == 1
+
+
+def test_a_decode_waiting_only_for_finalize_counts_as_a_prefetch_hit(make_image_manager):
+    manager = make_image_manager([("", "torso", "T00", pygame.Surface((4, 3), pygame.SRCALPHA))])
+
+    assert manager.prefetch_image("torso", "T00")
+    assert manager.decode_pipeline.wait_idle(timeout=5)
+    # finalize の前に要求されても、デコードは先読みで済んでいる
+    assert manager.get_image("torso", "T00").get_size() == (4, 3)
+    stats = manager.get_prefetch_stats()
+    assert (stats["hits"], stats["late"], stats["demand_loads"]) == (1, 0, 0)
+    assert manager.finalize_decoded() == 0
@@ -0,0 +1,92 @@
+import os
+
+import pygame
+import pytest
+
+
+def _images():
+    images = []
+    for directory, image_type, key in (("BG", "bg", "room"), ("01MMK", "eye", "MMK_F00_EYE01_00")):
+        surface = pygame.Surface((48, 40), pygame.SRCALPHA)
+        surface.fill((10, 120, 200, 255) if image_type == "bg" else (0, 0, 0, 0))
+        surface.fill((250, 30, 40, 128), (12, 9, 6, 5))
+        images.append((directory, image_type, key, surface))
+    return images
+
+
+@pytest.fixture
+def open_manager(make_image_manager, tmp_path):
+    """同じ画像とキャッシュディレクトリで ImageManager を開き直す"""
+    return lambda: make_image_manager(_images(), decode_cache_dir=tmp_path / "cache")
+
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+def test_second_load_maps_the_cache_without_decoding(open_manager, monkeypatch):
+    first = open_manager()
+    expected_bg = first.get_image("bg", "room")
+    expected_eye, offset, canvas = first.get_image_layout("eye", "MMK_F00_EYE01_00")
+    assert first.get_cache_stats()["decoded_cache_writes"] == 2
+
+    reopened = open_manager()
+    monkeypatch.setattr(pygame.image, "load", lambda *args: (_ for _ in ()).throw(AssertionError("decoded")))
+    bg = reopened.get_image("bg", "room")
+    eye, mapped_offset, mapped_canvas = reopened.get_image_layout("eye", "MMK_F00_EYE01_00")
+
+    assert _pixels(bg) == _pixels(expected_bg)
+    assert bg.get_masks() == expected_bg.get_masks()
+    # 顔パーツは切り詰めた形と元キャンバス上の配置がそのまま戻る
+    assert eye.get_size() == (6, 5) and _pixels(eye) == _pixels(expected_eye)
+    assert (mapped_offset, mapped_canvas) == (offset, canvas) == ((12, 9), (48, 40))
+    assert reopened.get_cache_stats()["decoded_cache_hits"] == 2
+
+
+def test_mapped_surfaces_are_private_and_stale_files_are_ignored(open_manager):
+    open_manager().get_image("bg", "room")
+    reopened = open_manager()
+    bg = reopened.get_image("bg", "room")
+    bg.fill((0, 0, 0, 0))
+
+    # 描き込みはファイルに戻らない
+    assert open_manager().get_image("bg", "room").get_at((0, 0)) == (10, 120, 200, 255)
+
+    # 元画像が更新されれば読み直す
+    path = reopened.image_paths["bg"]["room"]
+    surface = pygame.Surface((48, 40), pygame.SRCALPHA)
+    surface.fill((1, 2, 3, 255))
+    pygame.image.save(surface, path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    updated = open_manager()
+    assert updated.get_image("bg", "room").get_at((0, 0)) == (1, 2, 3, 255)
+    assert updated.get_cache_stats()["decoded_cache_hits"] == 0
+
+
+def test_cache_directory_is_kept_within_its_byte_budget(open_manager, tmp_path):
+    manager = open_manager()
+    # 1枚ぶん（ヘッダ込み）しか入らない
+    manager.decode_cache_bytes = 48 * 40 * 4 + 64
+    manager.get_image("bg", "room")
+    manager.get_image("eye", "MMK_F00_EYE01_00")
+
+    files = os.listdir(tmp_path / "cache")
+    assert len(files) == 1 and files[0].startswith("MMK_F00_EYE01_00_")
+
+
+def test_cached_pixels_are_read_without_keeping_the_file_open(open_manager):
+    open_manager().get_image("bg", "room")
+    reopened = open_manager()
+    fd_dir = f"/proc/{os.getpid()}/fd"
+    before = len(os.listdir(fd_dir)) if os.path.isdir(fd_dir) else None
+
+    pixels, size, _, _ = reopened._decode_pixels(reopened.image_paths["bg"]["room"])
+    bg = reopened.get_image("bg", "room")
+
+    assert isinstance(pixels, bytearray) and size == (48, 40)
+    assert reopened.get_cache_stats()["decoded_cache_hits"] == 2
+    if before is not None:
+        # キャッシュに残ったサーフェスがファイル記述子を握らない
+        assert len(os.listdir(fd_dir)) == before
+    assert bg.get_at((0, 0)) == (10, 120, 200, 255)
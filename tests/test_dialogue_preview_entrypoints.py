@@ -115,3 +115,17 @@ def test_snapshot_server_forces_utf8_stdio(monkeypatch):
 
     for stream in streams:
         assert stream.calls == [{"encoding": "utf-8", "errors": "strict"}]
+
+
+def test_step_preview_runtime_builds_an_image_manager_with_preview_budgets():
+    runtime = preview_dialogue.create_step_preview_runtime()
+    try:
+        image_manager = runtime["image_manager"]
+        assert image_manager.cache_budgets == preview_dialogue.PREVIEW_IMAGE_CACHE_BUDGETS
+        assert runtime["images"]
+        assert runtime["virtual_screen"].get_size() == (
+            preview_dialogue.VIRTUAL_WIDTH,
+            preview_dialogue.VIRTUAL_HEIGHT,
+        )
+    finally:
+        runtime["image_manager"].cleanup()
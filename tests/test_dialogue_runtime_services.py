@@ -0,0 +1,122 @@
+import os
+
+import pygame
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+from dialogue.dialogue_subsystem import DialogueSubsystem
+from dialogue.runtime_services import DialogueServices
+
+
+_qt_app = None
+
+
+@pytest.fixture(scope="module")
+def screens():
+    global _qt_app
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.mixer.init()
+    _qt_app = QApplication.instance() or QApplication([])
+    virtual_screen = pygame.Surface((1440, 1080))
+    return pygame.display.set_mode((1, 1)), virtual_screen
+
+
+def test_events_borrow_the_same_warm_services(screens):
+    services = DialogueServices(save_backlog=False)
+    first = DialogueSubsystem(*screens, "events/E001.ks", services)
+    image_manager = first.game_state["image_manager"]
+    essential = first.game_state["images"]
+    fonts = first.game_state["text_renderer"].fonts
+
+    second = DialogueSubsystem(*screens, "events/E066.ks", services)
+
+    assert services.events_started == 2
+    for key in ("image_manager", "text_renderer", "choice_renderer", "backlog_manager", "se_manager"):
+        assert second.game_state[key] is first.game_state[key]
+    assert second.game_state["text_renderer"].fonts is fonts
+    # 必須UI画像は読み直さず、固定したキャッシュに残っている
+    assert second.game_state["images"] is essential
+    assert image_manager._pinned_keys <= set(image_manager.image_cache)
+    # 旧イベントの game_state は別物（進行状態は共有しない）
+    assert second.game_state is not first.game_state
+    assert second.game_state["dialogue_loader"].current_ks_file == "events/E066.ks"
+
+
+def test_begin_event_drops_the_previous_event_state(screens):
+    services = DialogueServices(save_backlog=False)
+    first = DialogueSubsystem(*screens, "events/E001.ks", services)
+    text_renderer = first.game_state["text_renderer"]
+    text_renderer.toggle_auto_mode()
+    text_renderer.current_text = "前のイベントの本文"
+    text_renderer.set_event_datetime("2026-04-01 08:00")
+    first.game_state["choice_renderer"].show_choices(["はい", "いいえ"])
+    first.game_state["notification_manager"].add_notification("通知")
+    backlog_manager = first.game_state["backlog_manager"]
+    backlog_manager.is_showing = True
+    old_scroll_manager = text_renderer.scroll_manager
+
+    DialogueSubsystem(*screens, "events/E066.ks", services)
+
+    assert not text_renderer.auto_mode
+    assert text_renderer.current_text == ""
+    assert text_renderer.scroll_manager is not old_scroll_manager
+    assert not services.choice_renderer.is_choice_showing()
+    assert services.notification_manager.get_notification_count() == 0
+    assert not backlog_manager.is_showing_backlog()
+    assert text_renderer.seed_event_id == "E066"
+
+
+def test_subsystems_without_services_still_build_their_own(screens):
+    first = DialogueSubsystem(*screens, "events/E001.ks")
+    second = DialogueSubsystem(*screens, "events/E001.ks")
+
+    assert first.game_state["image_manager"] is not second.game_state["image_manager"]
+
+
+def test_subsystems_clean_up_only_the_services_they_built(screens, monkeypatch):
+    cleaned = []
+    monkeypatch.setattr(DialogueServices, "cleanup", lambda self: cleaned.append(self))
+    shared = DialogueServices(save_backlog=False)
+    borrowing = DialogueSubsystem(*screens, "events/E001.ks", shared)
+    owning = DialogueSubsystem(*screens, "events/E001.ks")
+    owned = owning._owned_services
+
+    borrowing.cleanup()
+    owning.cleanup()
+    owning.cleanup()
+
+    # 借りたものは止めず、自前のものは1度だけ止める
+    assert owned is not None and owned is not shared
+    assert cleaned == [owned]
+
+
+def test_saved_backlog_is_reopened_only_when_the_file_was_replaced(screens, tmp_path, monkeypatch):
+    path = tmp_path / "backlog.jsonl"
+    monkeypatch.setattr("dialogue.runtime_services.get_backlog_state_path", lambda: str(path))
+    services = DialogueServices()
+    first = DialogueSubsystem(*screens, "events/E001.ks", services)
+    store = first.game_state["backlog_manager"].entries
+    store.add("A", "一行目")
+
+    DialogueSubsystem(*screens, "events/E066.ks", services)
+    assert services.backlog_manager.entries is store
+
+    # セーブのロードでファイルが差し替わったら開き直す
+    path.write_text('{"speaker": "B", "text": "ロードした行", "force_female": false}\n' * 2, encoding="utf-8")
+    DialogueSubsystem(*screens, "events/E066.ks", services)
+    reopened = services.backlog_manager.entries
+    assert reopened is not store
+    assert [entry["text"] for entry in reopened] == ["ロードした行", "ロードした行"]
+
+
+def test_services_without_saved_backlog_never_touch_the_state_file(screens, tmp_path, monkeypatch):
+    path = tmp_path / "backlog.jsonl"
+    monkeypatch.setattr("dialogue.runtime_services.get_backlog_state_path", lambda: str(path))
+    services = DialogueServices(save_backlog=False)
+    first = DialogueSubsystem(*screens, "events/E001.ks", services)
+    first.game_state["backlog_manager"].entries.add("A", "保存しない行")
+    DialogueSubsystem(*screens, "events/E066.ks", services)
+
+    assert services.backlog_manager.entries.spill_path is None
+    assert not path.exists()
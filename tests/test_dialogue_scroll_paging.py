@@ -1,4 +1,6 @@
-from dialogue.text_renderer import select_current_line_set
+import pygame
+
+from dialogue.text_renderer import select_current_line_set, select_revealed_line_set
 from dialogue.text_renderer import TextRenderer
 from dialogue.inline_markup import parse_inline_markup, total_base_chars
 from dialogue.scroll_manager import ScrollManager
@@ -76,8 +78,10 @@ def test_text_renderer_reserves_the_completed_dialogue_line_count_up_front():
 
 
 def test_normal_dialogue_renderer_draws_only_the_new_set():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
     drawn = []
-    renderer = TextRenderer.__new__(TextRenderer)
+    renderer = TextRenderer(pygame.Surface((1920, 1080)))
     renderer.current_text = "1234"
     renderer.current_character_name = ""
     renderer.current_force_female = False
@@ -141,3 +145,69 @@ def test_scroll_dialogue_renderer_draws_only_the_new_set():
     renderer.render_scroll_text()
 
     assert drawn == ["4"]
+
+
+def test_revealed_line_set_follows_typewriter_over_fully_wrapped_lines():
+    reveal_lines = [
+        ("abc", 0, 3, False),
+        ("def", 3, 3, False),
+        ("", 7, 0, True),
+        ("gh", 7, 2, False),
+    ]
+
+    assert select_revealed_line_set(reveal_lines, 0, 2) == []
+    assert select_revealed_line_set(reveal_lines, 3, 2) == [("abc", 3, 3)]
+    assert select_revealed_line_set(reveal_lines, 4, 2) == [
+        ("abc", 3, 3),
+        ("def", 1, 3),
+    ]
+    # 改行文字が表示された時点で空行が現れ、次のセットに切り替わる
+    assert select_revealed_line_set(reveal_lines, 7, 2) == [("", 0, 0)]
+    assert select_revealed_line_set(reveal_lines, 8, 2) == [
+        ("", 0, 0),
+        ("gh", 1, 2),
+    ]
+
+
+def test_typewriter_frames_clip_the_cached_line_instead_of_rerasterizing():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    rasterized = []
+    blits = []
+    renderer = TextRenderer(pygame.Surface((1920, 1080)))
+    renderer.pygame_fonts = {"text": pygame.font.Font(None, 40)}
+    renderer.char_spacing = 1
+    renderer.max_chars_per_line = 20
+    renderer.hovered_seed_id = None
+    renderer.current_text = "abcdef"
+    renderer.current_character_name = ""
+    renderer.current_force_female = False
+    renderer.max_display_lines = 3
+    renderer.text_color = (255, 255, 255)
+    renderer.text_color_female = (255, 200, 255)
+    renderer.text_start_x = 0
+    renderer.text_start_y = 0
+    renderer.text_line_height = 1
+    renderer.ruby_h = 0
+    renderer.debug = False
+    renderer.scroll_manager = type(
+        "Scroll", (), {"is_scroll_mode": lambda self: False}
+    )()
+    renderer.screen = type(
+        "Screen", (), {"blit": lambda self, surface, pos, area=None: blits.append(area)}
+    )()
+    renderer._render_text_with_grid_system = (
+        lambda line, color: rasterized.append(line) or pygame.Surface((60, 10))
+    )
+    renderer._record_seed_hit_rects = lambda *args: None
+
+    for displayed_chars in range(1, 7):
+        renderer.displayed_chars = displayed_chars
+        renderer.render_paragraph()
+
+    assert rasterized == ["abcdef"]
+    grid_width = renderer._get_grid_char_width()
+    assert [area.width for area in blits[:5]] == [
+        grid_width * count for count in range(1, 6)
+    ]
+    assert blits[5] is None
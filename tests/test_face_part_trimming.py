@@ -0,0 +1,79 @@
+import pygame
+
+from core.config import VIRTUAL_HEIGHT
+from dialogue.character_manager import clear_character_composite_cache, draw_characters, render_face_parts
+
+
+def _canvas(rect, color):
+    # draw_characters は胴体を VIRTUAL_HEIGHT に合わせるので、その高さで作って等倍にする
+    surface = pygame.Surface((64, VIRTUAL_HEIGHT), pygame.SRCALPHA)
+    surface.fill(color, rect)
+    return surface
+
+
+_LAYERS = {
+    ("torso", "MMK_T00_ARM00_CLO00"): _canvas((8, 0, 48, VIRTUAL_HEIGHT), (200, 120, 90, 255)),
+    ("eye", "MMK_F00_EYE01_00"): _canvas((20, 30, 16, 6), (20, 40, 200, 180)),
+    ("mouth", "MMK_F00_MOU01_00"): _canvas((28, 50, 8, 4), (230, 10, 60, 255)),
+}
+
+
+class _FullCanvasImages:
+    """余白を切り詰めない（従来どおりの）画像管理"""
+
+    def __init__(self, images):
+        self.images = images
+
+    def get_image(self, image_type, image_id):
+        return self.images.get((image_type, image_id))
+
+
+def _trimming_manager(make_image_manager):
+    return make_image_manager([("01MMK", image_type, key, surface) for (image_type, key), surface in _LAYERS.items()])
+
+
+def _game_state(manager, zoom):
+    return {
+        "dialogue_data": [],
+        "current_paragraph": 0,
+        "screen": pygame.Surface((160, VIRTUAL_HEIGHT + 20), pygame.SRCALPHA),
+        "image_manager": manager,
+        "active_characters": ["momoko"],
+        "character_pos": {"momoko": [20, 10]},
+        "character_zoom": {"momoko": zoom},
+        "character_torso": {"momoko": "MMK_T00_ARM00_CLO00"},
+        "character_expressions": {"momoko": {"eye": "MMK_F00_EYE01_00", "mouth": "MMK_F00_MOU01_00"}},
+        "character_blink_state": {},
+        "character_part_fades": {},
+        "character_anim": {},
+        "show_face_parts": True,
+    }
+
+
+def test_face_parts_are_cached_as_opaque_crops_with_offsets(make_image_manager):
+    manager = _trimming_manager(make_image_manager)
+
+    eye, offset, canvas = manager.get_image_layout("eye", "MMK_F00_EYE01_00")
+    assert eye.get_size() == (16, 6)
+    assert (offset, canvas) == ((20, 30), (64, VIRTUAL_HEIGHT))
+    # 胴体は切り詰めない
+    torso = manager.get_image_layout("torso", "MMK_T00_ARM00_CLO00")
+    assert torso[0].get_size() == (64, VIRTUAL_HEIGHT) and torso[1] == (0, 0)
+    assert manager.get_cache_stats()["categories"]["face_part"]["resident_bytes"] == 16 * 6 * 4
+
+
+def test_trimmed_parts_draw_where_the_full_canvas_did(make_image_manager):
+    manager = _trimming_manager(make_image_manager)
+    for zoom in (1.0, 0.5):
+        trimmed = _game_state(manager, zoom)
+        full = _game_state(_FullCanvasImages(_LAYERS), zoom)
+        for state in (trimmed, full):
+            render_face_parts(state, "momoko", "", "MMK_F00_EYE01_00", "MMK_F00_MOU01_00", "", zoom)
+        assert pygame.image.tobytes(trimmed["screen"], "RGBA") == pygame.image.tobytes(full["screen"], "RGBA")
+
+        clear_character_composite_cache()
+        trimmed = _game_state(manager, zoom)
+        full = _game_state(_FullCanvasImages(_LAYERS), zoom)
+        for state in (trimmed, full):
+            draw_characters(state)
+        assert pygame.image.tobytes(trimmed["screen"], "RGBA") == pygame.image.tobytes(full["screen"], "RGBA")
@@ -0,0 +1,192 @@
+import pygame
+
+from core.config import FONT_EFFECTS
+from dialogue import font_effects
+from core.path_utils import get_font_path
+from dialogue.font_effects import (
+    _compose_outline_by_blits,
+    _glyph_atlas,
+    clear_glyph_atlas,
+    compose_outlined_glyphs,
+    get_cached_glyph,
+    get_outline_width,
+    prerender_text_with_effects,
+    render_effect_layers,
+    render_text_with_effects,
+)
+from dialogue.text_renderer import TextRenderer
+
+
+def setup_function():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    clear_glyph_atlas()
+
+
+def teardown_function():
+    clear_glyph_atlas()
+
+
+def test_effected_glyph_is_rasterized_once_per_key():
+    font = pygame.font.Font(None, 24)
+
+    first = render_text_with_effects(font, "A", (255, 255, 255))
+    second = render_text_with_effects(font, "A", (255, 255, 255))
+    other_color = render_text_with_effects(font, "A", (255, 0, 0))
+
+    assert first is second
+    assert other_color is not first
+    assert len(_glyph_atlas) == 2
+
+
+def test_font_effects_change_invalidates_cached_glyph(monkeypatch):
+    font = pygame.font.Font(None, 24)
+    outlined = render_text_with_effects(font, "A", (255, 255, 255))
+
+    monkeypatch.setitem(FONT_EFFECTS, "enable_shadow", False)
+    plain = render_text_with_effects(font, "A", (255, 255, 255))
+
+    assert plain is not outlined
+    assert plain.get_width() < outlined.get_width()
+
+
+def test_glyph_atlas_is_lru_bounded(monkeypatch):
+    monkeypatch.setattr(font_effects, "_GLYPH_ATLAS_LIMIT", 3)
+    for index in range(4):
+        get_cached_glyph(("test", index), lambda: pygame.Surface((1, 1)))
+
+    cached_keys = [key[0] for key in _glyph_atlas]
+    assert ("test", 0) not in cached_keys
+    assert cached_keys[-1] == ("test", 3)
+
+    get_cached_glyph(("test", 1), lambda: pygame.Surface((1, 1)))
+    get_cached_glyph(("test", 4), lambda: pygame.Surface((1, 1)))
+    cached_keys = [key[0] for key in _glyph_atlas]
+    assert ("test", 1) in cached_keys
+    assert ("test", 2) not in cached_keys
+
+
+def test_text_renderer_grid_reuses_atlas_glyphs_across_frames(monkeypatch):
+    renderer = TextRenderer(pygame.Surface((1920, 1080)))
+    renderer.pygame_fonts = {
+        "text": pygame.font.Font(None, 40),
+        "ruby": pygame.font.Font(None, 18),
+    }
+    renderer.ruby_h = 12
+    renderer.char_spacing = 1
+    renderer.max_chars_per_line = 26
+    renderer.seed_manager = None
+    renderer.hovered_seed_id = None
+    rasterized = []
+    original = TextRenderer._render_outline_layers
+    monkeypatch.setattr(
+        TextRenderer,
+        "_render_outline_layers",
+        lambda self, font, text, color: rasterized.append(text)
+        or original(self, font, text, color),
+    )
+
+    renderer._render_text_with_grid_system("ABAB", (255, 255, 255))
+    renderer._render_text_with_grid_system("ABAB", (255, 255, 255))
+
+    assert rasterized == ["A", "B"]
+
+
+def _rgba(surface):
+    return (
+        pygame.surfarray.array3d(surface).tolist(),
+        pygame.surfarray.array_alpha(surface).tolist(),
+    )
+
+
+def test_dilated_outline_is_pixel_identical_to_blit_outline():
+    font = pygame.font.Font(get_font_path("MPLUS1p-Regular.ttf"), 40)
+    texts = list("あ漢字、。「」Ag!") + ["…", "ー"]
+    colors = [(255, 255, 255), (255, 180, 200)]
+    layers = [render_effect_layers(font, text, color) for text in texts for color in colors]
+
+    dilated = compose_outlined_glyphs(layers)
+    expected = [_compose_outline_by_blits(*pair, get_outline_width()) for pair in layers]
+
+    for actual, reference in zip(dilated, expected):
+        assert actual.get_size() == reference.get_size()
+        assert _rgba(actual) == _rgba(reference)
+
+
+def test_prerender_fills_atlas_in_one_batch():
+    font = pygame.font.Font(None, 24)
+
+    prerender_text_with_effects(font, ["A", "B", "A"], (255, 255, 255))
+
+    assert len(_glyph_atlas) == 2
+    cached = render_text_with_effects(font, "B", (255, 255, 255))
+    assert len(_glyph_atlas) == 2
+    assert _rgba(cached) == _rgba(
+        _compose_outline_by_blits(
+            *render_effect_layers(font, "B", (255, 255, 255)), get_outline_width()
+        )
+    )
+
+
+def _bake(tmp_path, text, color):
+    from tools.bake_glyph_atlas import bake_atlas
+
+    font_path = get_font_path("MPLUS1p-Regular.ttf")
+    requests = [(ch, color) for ch in text]
+    bake_atlas(font_path, "MPLUS1p-Regular.ttf", 40, requests, str(tmp_path), page_size=128)
+    return pygame.font.Font(font_path, 40)
+
+
+def test_baked_atlas_glyphs_match_live_rendering_without_rasterizing(tmp_path):
+    color = (255, 255, 255)
+    font = _bake(tmp_path, "放課後の教室", color)
+    live = {
+        ch: compose_outlined_glyphs([render_effect_layers(font, ch, color)])[0]
+        for ch in "放課後の教室"
+    }
+    clear_glyph_atlas()
+
+    loaded = font_effects.load_baked_glyph_atlas(
+        font, "MPLUS1p-Regular.ttf", 40, atlas_dir=str(tmp_path)
+    )
+
+    assert loaded == 6
+    for ch, expected in live.items():
+        baked = get_cached_glyph(("outline", font, ch, color), lambda: None)
+        assert baked.get_size() == expected.get_size()
+        assert pygame.image.tobytes(baked, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+    # アトラスに無い文字だけがその場で描画される
+    prerender_text_with_effects(font, ["放", "X"], color)
+    assert [key[0][2] for key in _glyph_atlas] == ["X"]
+
+
+def test_baked_atlas_for_other_font_effects_is_ignored(tmp_path):
+    import json
+
+    font = _bake(tmp_path, "あ", (255, 255, 255))
+    index_path = font_effects.get_baked_atlas_index_path("MPLUS1p-Regular.ttf", 40, str(tmp_path))
+    with open(index_path, "r", encoding="utf-8") as f:
+        index = json.load(f)
+    index["effects"] = dict(index["effects"], stretch_factor=9.0)
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+
+    assert font_effects.load_baked_glyph_atlas(
+        font, "MPLUS1p-Regular.ttf", 40, atlas_dir=str(tmp_path)
+    ) == 0
+
+
+def test_registering_a_new_font_replaces_the_previous_fonts_baked_glyphs(tmp_path):
+    color = (255, 255, 255)
+    first = _bake(tmp_path, "放課後", color)
+    clear_glyph_atlas()
+    font_effects.load_baked_glyph_atlas(first, "MPLUS1p-Regular.ttf", 40, atlas_dir=str(tmp_path))
+    entries = len(font_effects._baked_glyphs)
+
+    # 新しいレンダラーが同じフォントファイル・サイズを開き直す
+    second = pygame.font.Font(get_font_path("MPLUS1p-Regular.ttf"), 40)
+    font_effects.load_baked_glyph_atlas(second, "MPLUS1p-Regular.ttf", 40, atlas_dir=str(tmp_path))
+
+    assert len(font_effects._baked_glyphs) == entries
+    assert all(key[0][1] is second for key in font_effects._baked_glyphs)
+    assert get_cached_glyph(("outline", second, "放", color), lambda: None) is not None
@@ -225,6 +225,7 @@ def test_regular_dialogue_keeps_loading_screen(monkeypatch):
     app.window_surface = object()
     app.current_event_id = None
     app.dialogue_completion_result = None
+    app.dialogue_services = object()
     switched = []
     loading_calls = []
 
@@ -256,3 +257,39 @@ def test_morning_dialogue_completion_does_not_record_or_advance_event():
     assert switched == ["map"]
     assert app.current_event_id is None
     assert app.dialogue_completion_result is None
+
+
+def test_home_diary_and_morning_dialogues_borrow_the_app_dialogue_services(monkeypatch):
+    import dialogue.dialogue_subsystem as subsystem_module
+    import home.home as home_module
+
+    built = []
+
+    class FakeDialogue:
+        def __init__(self, screen, virtual_screen, event_file, services=None):
+            built.append((event_file, services))
+            self.game_state = {
+                "image_manager": type("Images", (), {"image_paths": {}})(),
+                "choice_renderer": None,
+            }
+
+        def on_enter(self):
+            pass
+
+        def cleanup(self):
+            pass
+
+    monkeypatch.setattr(subsystem_module, "DialogueSubsystem", FakeDialogue)
+    monkeypatch.setattr(home_module.HomeModule, "_load_home_images", lambda self: {})
+    services = object()
+    home = home_module.HomeModule(pygame.Surface((4, 4)), dialogue_services=services)
+    home.journal_new_seed_ids = []
+    monkeypatch.setattr(home, "_append_new_seed_diary_lines", lambda dialogue: None)
+
+    home._start_diary()
+    home.morning_flow.preload_dialogue()
+
+    assert built == [
+        (home_module.HomeModule.DIARY_DIALOGUE_FILE, services),
+        ("events/HOME_MORNING_DEPARTURE.ks", services),
+    ]
@@ -0,0 +1,60 @@
+import pygame
+
+
+def _images():
+    return [
+        (directory, image_type, key, pygame.Surface(size, pygame.SRCALPHA))
+        for directory, image_type, key, size in (
+            ("BG", "bg", "BG_A", (40, 30)),
+            ("BG", "bg", "BG_B", (40, 30)),
+            ("BG", "bg", "BG_C", (40, 30)),
+            ("01MMK", "torso", "MMK_T00_ARM00_CLO00", (10, 20)),
+            ("01MMK", "eye", "MMK_F00_EYE01_00", (4, 4)),
+        )
+    ]
+
+
+def test_cache_evicts_by_bytes_within_the_category(make_image_manager):
+    # 背景は2枚ぶんの予算。胴体・顔パーツは背景の追い出しに巻き込まれない
+    manager = make_image_manager(_images(), cache_budgets={"bg": 2 * 40 * 30 * 4})
+    manager.get_image("torso", "MMK_T00_ARM00_CLO00")
+    manager.get_image("eye", "MMK_F00_EYE01_00")
+    for key in ("BG_A", "BG_B", "BG_C"):
+        manager.get_image("bg", key)
+
+    cached = " ".join(manager.image_cache)
+    assert "BG_A" not in cached
+    assert "BG_B" in cached and "BG_C" in cached
+    assert "MMK_T00_ARM00_CLO00" in cached and "MMK_F00_EYE01_00" in cached
+
+    stats = manager.get_cache_stats()
+    assert stats["evictions"] == 1
+    assert stats["categories"]["bg"]["resident_bytes"] == 2 * 40 * 30 * 4
+    assert stats["categories"]["torso"]["resident_bytes"] == 10 * 20 * 4
+    assert stats["categories"]["face_part"]["entries"] == 1
+    assert stats["resident_bytes"] == 2 * 40 * 30 * 4 + 10 * 20 * 4 + 4 * 4 * 4
+
+
+def test_pinned_entries_are_never_evicted(make_image_manager):
+    manager = make_image_manager(_images(), cache_budgets={"bg": 40 * 30 * 4})
+    manager.get_image("bg", "BG_A")
+    pinned_key, = manager.image_cache
+    manager.pin_image(pinned_key)
+    manager.get_image("bg", "BG_B")
+    manager.get_image("bg", "BG_C")
+
+    assert pinned_key in manager.image_cache
+    assert [key for key in manager.image_cache if key != pinned_key] == [
+        manager.image_paths["bg"]["BG_C"] + "_original"
+    ]
+    assert manager.get_cache_stats()["pinned"] == 1
+
+
+def test_cache_stats_report_hit_ratio(make_image_manager):
+    manager = make_image_manager(_images(), cache_budgets={})
+    manager.get_image("bg", "BG_A")
+    manager.get_image("bg", "BG_A")
+    manager.get_image("bg", "BG_A")
+    manager.get_image("bg", "BG_B")
+
+    assert manager.get_cache_stats()["cache_hit_ratio"] == 0.5
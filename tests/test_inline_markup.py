@@ -22,6 +22,7 @@ from dialogue.inline_markup import (
     has_inline_markup,
     wrap_markup_text,
     PlainChar, RubySpan, BotenSpan, SeedSpan, build_display_string,
+    hide_pending_ruby,
 )
 
 
@@ -256,3 +257,9 @@ class TestWrapMarkupText:
 def test_seed_progressive_display_keeps_clickable_markup():
     tokens = parse_inline_markup('[seed id="S1"]手掛かり[/seed]')
     assert build_display_string(tokens, 2) == '[seed id="S1"]手掛[/seed]'
+
+
+def test_hide_pending_ruby_drops_ruby_until_span_is_complete():
+    text = "私{愛沼|あいぬま}は{boten:絶対}"
+    assert hide_pending_ruby(text, 2) == "私愛沼は{boten:絶}{boten:対}"
+    assert hide_pending_ruby(text, 3) == "私{愛沼|あいぬま}は{boten:絶}{boten:対}"
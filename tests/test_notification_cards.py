@@ -0,0 +1,60 @@
+import pygame
+
+from dialogue import notification_manager
+from dialogue.notification_manager import NotificationManager
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+def _manager(monkeypatch):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    clock = _Clock()
+    monkeypatch.setattr(notification_manager.time, "time", clock.time)
+    return NotificationManager(pygame.Surface((1920, 1080), pygame.SRCALPHA)), clock
+
+
+def test_fading_cards_only_change_blit_alpha_and_position(monkeypatch):
+    manager, clock = _manager(monkeypatch)
+    for index in range(3):
+        manager.add_notification(f"タネ解放 {index}: 長めの通知メッセージを折り返して表示する")
+    cards = [notif["surface"] for notif in manager.notifications]
+
+    allocations = []
+    original_surface = pygame.Surface
+    monkeypatch.setattr(
+        notification_manager.pygame,
+        "Surface",
+        lambda *args, **kwargs: allocations.append(args) or original_surface(*args, **kwargs),
+    )
+    monkeypatch.setattr(manager, "_wrap_text", lambda *args: allocations.append("wrap") or [])
+    blits = []
+    manager.screen = type("Screen", (), {"blit": lambda self, surface, pos: blits.append((surface, pos))})()
+
+    for elapsed in (0.0, 1.0, 3.6, 3.9):
+        clock.now = 1000.0 + elapsed
+        manager.update()
+        manager.render()
+
+    assert allocations == []
+    assert [surface for surface, _ in blits[-3:]] == cards
+    assert cards[0].get_alpha() < 255
+    assert [pos[1] for _, pos in blits[-3:]] == [
+        manager.card_y + index * (manager.notification_height + manager.notification_spacing)
+        for index in range(3)
+    ]
+
+
+def test_expired_notifications_are_removed(monkeypatch):
+    manager, clock = _manager(monkeypatch)
+    manager.add_notification("one")
+    clock.now += manager.notification_duration / 1000.0
+    manager.update()
+
+    assert manager.notifications == []
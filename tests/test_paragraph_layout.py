@@ -0,0 +1,111 @@
+import pygame
+
+from dialogue import paragraph_layout
+from dialogue.inline_markup import wrap_markup_text
+from dialogue.paragraph_layout import (
+    GlyphPlacement,
+    ParagraphLayout,
+    RubyPlacement,
+    SeedPlacement,
+    build_layout_line,
+)
+from dialogue.text_renderer import TextRenderer
+
+
+class _SeedVisibility:
+    def can_show(self, seed_id):
+        return True
+
+
+def _renderer(text):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    renderer = TextRenderer(pygame.Surface((1920, 1080)))
+    renderer.pygame_fonts = {
+        "text": pygame.font.Font(None, 40),
+        "ruby": pygame.font.Font(None, 18),
+    }
+    renderer.ruby_h = 12
+    renderer.char_spacing = 1
+    renderer.max_chars_per_line = 26
+    renderer.max_display_lines = 3
+    renderer.seed_manager = _SeedVisibility()
+    renderer.hovered_seed_id = None
+    renderer.debug = False
+    renderer.current_text = text
+    renderer.current_character_name = ""
+    renderer.current_force_female = False
+    renderer.text_color = (255, 255, 255)
+    renderer.text_color_female = (255, 200, 220)
+    renderer.text_start_x = 100
+    renderer.text_start_y = 80
+    renderer.text_line_height = 50
+    renderer.seed_hit_rects = []
+    renderer.screen = pygame.Surface((800, 300), pygame.SRCALPHA)
+    renderer.scroll_manager = type(
+        "Scroll", (), {"is_scroll_mode": lambda self: False}
+    )()
+    return renderer
+
+
+def test_layout_line_places_glyphs_ruby_boten_and_seeds_on_grid_columns():
+    line = build_layout_line('あ{愛沼|あいぬま}{boten:絶対}[seed id="S1"]温泉[/seed]')
+
+    assert line.line_chars == 7
+    assert line.columns == [0, 1, 3, 5]
+    assert line.glyphs[1] == GlyphPlacement("愛", 1)
+    assert line.glyphs[5] == GlyphPlacement("温", 5, "S1")
+    assert line.rubies == [RubyPlacement("あいぬま", 1, 2)]
+    assert line.boten_columns == [3, 4]
+    assert line.seeds == [SeedPlacement("S1", 5, 2)]
+    assert line.revealed_markup(2) == "あ愛沼{boten:絶}{boten:対}[seed id=\"S1\"]温泉[/seed]"
+    assert line.revealed_markup(3) == line.markup
+
+
+def test_paragraph_layout_counts_newline_as_one_logical_char():
+    layout = ParagraphLayout.build("abcd\nef", lambda text: wrap_markup_text(text, 3))
+
+    assert layout.reveal_lines == [
+        ("abc", 0, 3, False),
+        ("d", 3, 1, False),
+        ("ef", 5, 2, True),
+    ]
+
+
+def test_hover_hit_testing_is_a_lookup_into_the_paragraph_layout(monkeypatch):
+    renderer = _renderer('前置き[seed id="S1"]温泉[/seed]の話')
+    renderer.displayed_chars = 7
+    renderer._render_stable_text_line = lambda line, color: pygame.Surface((1, 1))
+    renderer.render_paragraph()
+    layout = renderer._paragraph_layout
+
+    parsed = []
+    original_parse = paragraph_layout.parse_inline_markup
+    monkeypatch.setattr(
+        paragraph_layout,
+        "parse_inline_markup",
+        lambda text: parsed.append(text) or original_parse(text),
+    )
+    renderer.seed_hit_rects = []
+    renderer.render_paragraph()
+    grid_width = renderer._get_grid_char_width()
+    hit = renderer.seed_at((100 + 3 * grid_width + 1, 81))
+
+    assert hit == "S1"
+    assert renderer.seed_at((100 + 6 * grid_width, 81)) is None
+    assert renderer._paragraph_layout is layout
+    assert parsed == []
+
+
+def test_layout_setters_invalidate_the_paragraph_layout():
+    renderer = _renderer("あいうえおかきくけこ")
+    first = renderer._get_paragraph_layout()
+    assert renderer._get_paragraph_layout() is first
+
+    renderer.set_max_chars_per_line(4)
+    wrapped = renderer._get_paragraph_layout()
+    assert wrapped is not first
+    assert [line.markup for line in wrapped.lines] == ["あいうえ", "おかきく", "けこ"]
+
+    renderer.set_char_spacing(3)
+    assert renderer._get_paragraph_layout() is not wrapped
@@ -0,0 +1,99 @@
+import pygame
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QApplication
+
+from dialogue import backlog_manager
+from dialogue.backlog_manager import (
+    BacklogManager,
+    prerender_texts_with_qfont,
+    render_text_strip_with_qfont,
+    render_text_with_qfont,
+    render_text_with_qfont_cached,
+)
+
+
+_qt_app = None
+
+
+def _font():
+    global _qt_app
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    _qt_app = QApplication.instance() or QApplication([])
+    return QFont("Sans", 20)
+
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+def test_qimage_bridge_keeps_channel_order():
+    surface = render_text_with_qfont("■", _font(), (200, 40, 10))
+    opaque = [
+        surface.get_at((x, y))
+        for x in range(surface.get_width())
+        for y in range(surface.get_height())
+        if surface.get_at((x, y)).a == 255
+    ]
+
+    assert opaque
+    assert all(tuple(color)[:3] == (200, 40, 10) for color in opaque)
+
+
+def test_strip_rows_match_single_renders():
+    font = _font()
+    texts = ["あいう", "", "long line of text", "x"]
+    rows = render_text_strip_with_qfont(texts, font, (255, 255, 255))
+
+    for text, row in zip(texts, rows):
+        single = render_text_with_qfont(text, font, (255, 255, 255))
+        assert row.get_size() == single.get_size()
+        assert _pixels(row) == _pixels(single)
+
+
+def test_text_cache_evicts_by_byte_size(monkeypatch):
+    font = _font()
+    monkeypatch.setattr(backlog_manager, "_text_render_cache", backlog_manager.OrderedDict())
+    monkeypatch.setattr(backlog_manager, "_text_render_cache_bytes", 0)
+    sizes = [
+        surface.get_pitch() * surface.get_height()
+        for surface in (render_text_with_qfont(text, font, (255, 255, 255)) for text in ("abd", "abe"))
+    ]
+    limit = sum(sizes)
+    monkeypatch.setattr(backlog_manager, "_TEXT_RENDER_CACHE_BYTES_LIMIT", limit)
+
+    for text in ("abc", "abd", "abe"):
+        render_text_with_qfont_cached(text, font, (255, 255, 255))
+
+    assert [key[0] for key in backlog_manager._text_render_cache] == ["abd", "abe"]
+    assert backlog_manager._text_render_cache_bytes <= limit
+
+
+def test_backlog_page_is_rendered_as_one_strip_per_color(monkeypatch):
+    font = _font()
+    manager = BacklogManager(
+        pygame.Surface((1920, 1080), pygame.SRCALPHA), {"text": font, "name": font}
+    )
+    manager.name_manager = type("Names", (), {"substitute_variables": lambda self, text: text})()
+    for index in range(30):
+        manager.add_entry("A", f"strip line {index}")
+
+    strips = []
+    original = backlog_manager.render_text_strip_with_qfont
+    monkeypatch.setattr(
+        backlog_manager,
+        "render_text_strip_with_qfont",
+        lambda texts, qfont, color: strips.append(list(texts)) or original(texts, qfont, color),
+    )
+    manager.toggle_backlog()
+    manager.render()
+
+    text_strips = [batch for batch in strips if batch[0].startswith("strip line")]
+    assert text_strips[0] == [f"strip line {index}" for index in range(19, 30)]
+    assert all(len(batch) > 1 for batch in strips)
+
+    # 描画済みの行はもう一度ストリップを作らない
+    count = len(strips)
+    prerender_texts_with_qfont(["strip line 29"], manager.backlog_text_font, manager.default_text_color)
+    manager.render()
+    assert len(strips) == count
@@ -18,7 +18,7 @@ class _SeedVisibility:
 
 
 def _renderer(visible=True):
-    renderer = TextRenderer.__new__(TextRenderer)
+    renderer = TextRenderer(pygame.Surface((1920, 1080)))
     renderer.pygame_fonts = {
         "text": pygame.font.Font(None, 40),
         "ruby": pygame.font.Font(None, 18),
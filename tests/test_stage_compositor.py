@@ -0,0 +1,93 @@
+import pygame
+
+from dialogue import background_manager, character_manager
+from dialogue.character_manager import update_blink_animation
+from dialogue.scenario_manager import _ir_dispatch_action
+from dialogue.stage_compositor import StageCompositor, mark_stage_dirty
+
+
+def _state():
+    pygame.init()
+    return {
+        "screen": pygame.Surface((64, 48)),
+        "background_state": {"current_bg": "room", "zoom": 1.0, "pos": [0, 0], "anim": None},
+        "character_anim": {},
+        "character_part_fades": {},
+        "character_hide_pending": {},
+    }
+
+
+def _count_draws(monkeypatch, color=(30, 60, 90)):
+    draws = []
+
+    def draw_background(game_state):
+        draws.append("bg")
+        game_state["screen"].fill(color)
+
+    monkeypatch.setattr(background_manager, "draw_background", draw_background)
+    monkeypatch.setattr(character_manager, "draw_characters", lambda game_state: draws.append("chara"))
+    return draws
+
+
+def test_static_frames_reuse_the_stage(monkeypatch):
+    draws = _count_draws(monkeypatch)
+    state = _state()
+    screen = state["screen"]
+    compositor = StageCompositor()
+
+    assert compositor.render(state, screen)
+    for _ in range(10):
+        # テキストなど上のレイヤーで汚れても、次のフレームはステージから戻る
+        screen.fill((255, 255, 255), (0, 40, 64, 8))
+        assert not compositor.render(state, screen)
+
+    assert draws == ["bg", "chara"]
+    assert screen.get_at((5, 45))[:3] == (30, 60, 90)
+    assert state["screen"] is screen
+
+    mark_stage_dirty(state)
+    assert compositor.render(state, screen)
+    assert compositor.rebuilds == 2
+
+
+def test_animation_draws_every_frame_and_rebuilds_once_after(monkeypatch):
+    draws = _count_draws(monkeypatch)
+    state = _state()
+    compositor = StageCompositor()
+    compositor.render(state, state["screen"])
+
+    state["character_anim"]["A"] = {"start_zoom": 1.0, "target_zoom": 1.0}
+    for _ in range(3):
+        assert compositor.render(state, state["screen"])
+    state["character_anim"].clear()
+    assert compositor.render(state, state["screen"])
+    assert not compositor.render(state, state["screen"])
+
+    assert draws.count("bg") == 5
+
+
+def test_stage_actions_and_blink_frames_mark_the_stage_dirty(monkeypatch):
+    state = _state()
+    _ir_dispatch_action(state, {"action": "se_stop", "params": {}})
+    assert not state.get("stage_dirty")
+    _ir_dispatch_action(state, {"action": "bg_show", "params": {"storage": "hall", "zoom": "1.0"}})
+    assert state["stage_dirty"]
+
+    state["stage_dirty"] = False
+    state["character_expressions"] = {"A": {"eye": "A_F00_EYE00_00"}}
+    state["character_blink_state"] = {
+        "A": {
+            "current_state": "blinking",
+            "animation_start": 0,
+            "eye_base": "A_F00_EYE00",
+            "blink_sequence": ["00", "01", "02"],
+        }
+    }
+    update_blink_animation(state, "A", 10)
+    assert state["stage_dirty"]
+    # 同じコマのあいだは描き直さない
+    state["stage_dirty"] = False
+    update_blink_animation(state, "A", 30)
+    assert not state["stage_dirty"]
+    update_blink_animation(state, "A", 45)
+    assert state["stage_dirty"]
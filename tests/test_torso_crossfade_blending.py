@@ -48,3 +48,111 @@ def test_torso_crossfade_fades_changed_silhouette_pixels():
     assert pixel.r == 255
     assert abs(pixel.g - 128) <= 1
     assert abs(pixel.b - 128) <= 1
+
+
+def _legacy_crossfade(screen, from_image, from_pos, to_image, to_pos, progress):
+    """毎フレーム合成先と重み付きコピーを作っていた以前の実装"""
+    sources = []
+    for image, pos, weight in ((from_image, from_pos, 1.0 - progress), (to_image, to_pos, progress)):
+        bounds = image.get_bounding_rect(min_alpha=1)
+        if bounds.width and bounds.height:
+            sources.append((image.subsurface(bounds).copy().premul_alpha(), bounds.move(pos), weight))
+    blend_rect = sources[0][1].unionall([rect for _, rect, _ in sources[1:]]).clip(screen.get_clip())
+    blended = pygame.Surface(blend_rect.size, pygame.SRCALPHA)
+    for premultiplied, rect, weight in sources:
+        visible = rect.clip(blend_rect)
+        weighted = premultiplied.subsurface(visible.move(-rect.x, -rect.y)).copy()
+        channel_weight = round(255 * weight)
+        weighted.fill((channel_weight,) * 4, special_flags=pygame.BLEND_RGBA_MULT)
+        blended.blit(
+            weighted,
+            (visible.x - blend_rect.x, visible.y - blend_rect.y),
+            special_flags=pygame.BLEND_RGBA_ADD,
+        )
+    screen.blit(blended, blend_rect.topleft, special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+def _noise_torso(size, seed):
+    import random
+
+    rng = random.Random(seed)
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    for x in range(2, size[0] - 3):
+        for y in range(1, size[1] - 2):
+            surface.set_at((x, y), [rng.randrange(256) for _ in range(3)] + [rng.choice((0, 255, rng.randrange(256)))])
+    return surface
+
+
+def _background():
+    screen = pygame.Surface((40, 36), pygame.SRCALPHA)
+    for y in range(36):
+        pygame.draw.line(screen, (y * 7, 120, 255 - y * 7, 255), (0, y), (39, y))
+    return screen
+
+
+def _assert_matches_legacy(monkeypatch, numpy_available):
+    from dialogue import character_manager
+
+    monkeypatch.setattr(character_manager, "NUMPY_AVAILABLE", numpy_available)
+    monkeypatch.setattr(character_manager, "_crossfade_buffers", character_manager.OrderedDict())
+    old_torso = _noise_torso((24, 30), 1)
+    new_torso = _noise_torso((24, 30), 2)
+    for positions in (((4, 2), (4, 2)), ((3, 1), (9, 4)), ((-6, 20), (-2, 18))):
+        for progress in (0.1, 0.5, 0.73):
+            expected = _background()
+            actual = _background()
+            _legacy_crossfade(expected, old_torso, positions[0], new_torso, positions[1], progress)
+            _blit_crossfade(actual, old_torso, positions[0], new_torso, positions[1], progress)
+            assert pygame.image.tobytes(actual, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+
+
+def test_crossfade_engine_matches_the_per_frame_surface_blend(monkeypatch):
+    _assert_matches_legacy(monkeypatch, True)
+
+
+def test_crossfade_blit_fallback_matches_the_per_frame_surface_blend(monkeypatch):
+    _assert_matches_legacy(monkeypatch, False)
+
+
+def test_crossfade_buffers_are_reused_for_the_whole_fade(monkeypatch):
+    from dialogue import character_manager
+
+    monkeypatch.setattr(character_manager, "_crossfade_buffers", character_manager.OrderedDict())
+    old_torso = _noise_torso((24, 30), 3)
+    new_torso = _noise_torso((24, 30), 4)
+    screen = _background()
+
+    _blit_crossfade(screen, old_torso, (4, 2), new_torso, (4, 2), 0.2)
+    (buffers, _), = character_manager._crossfade_buffers.values()
+    blended = buffers.blended
+    for step in range(1, 10):
+        _blit_crossfade(screen, old_torso, (4, 2), new_torso, (4, 2), step / 10)
+
+    (reused, _), = character_manager._crossfade_buffers.values()
+    assert reused is buffers
+    assert reused.blended is blended
+
+
+def test_crossfade_buffers_are_released_when_the_torso_fade_ends(monkeypatch):
+    from dialogue import character_manager
+
+    monkeypatch.setattr(character_manager, "_crossfade_buffers", character_manager.OrderedDict())
+    _blit_crossfade(_background(), _noise_torso((24, 30), 5), (4, 2), _noise_torso((24, 30), 6), (4, 2), 0.5)
+    fade = {'from': "T00", 'to': "T01", 'start_time': pygame.time.get_ticks(), 'duration': 60_000}
+    game_state = {'character_part_fades': {"momoko": {'torso': fade, 'eye': dict(fade)}}}
+
+    # 胴体のフェード中は残す
+    character_manager.update_character_fades(game_state)
+    assert len(character_manager._crossfade_buffers) == 1
+
+    # 表示コマンドなどでフェードが打ち切られたら捨てる
+    game_state['character_part_fades']["momoko"].pop('torso')
+    character_manager.release_finished_crossfades(game_state)
+    assert not character_manager._crossfade_buffers
+
+    _blit_crossfade(_background(), _noise_torso((24, 30), 5), (4, 2), _noise_torso((24, 30), 6), (4, 2), 0.5)
+    fade['start_time'] -= fade['duration']
+    game_state['character_part_fades']["momoko"]['torso'] = fade
+    character_manager.update_character_fades(game_state)
+    assert list(game_state['character_part_fades']["momoko"]) == ['eye']
+    assert not character_manager._crossfade_buffers
@@ -0,0 +1,90 @@
+import pygame
+
+from core.config import VIRTUAL_HEIGHT
+from dialogue import character_manager, zoom_mipmap
+from dialogue.character_manager import draw_characters
+from dialogue.zoom_mipmap import clear_mipmap_cache, get_mipmap_level, quantize_zoom, scale_from_mipmap
+
+
+class _Images:
+    def __init__(self, images):
+        self.images = images
+
+    def get_image(self, image_type, image_id):
+        return self.images.get((image_type, image_id))
+
+
+def setup_function():
+    pygame.init()
+    clear_mipmap_cache()
+    character_manager._scaled_image_cache.clear()
+
+
+def _tween(start, end, frames=60):
+    return [start + (end - start) * frame / frames for frame in range(frames + 1)]
+
+
+def test_zoom_tween_collapses_to_a_few_buckets():
+    zooms = _tween(1.0, 1.5)
+    buckets = {quantize_zoom(zoom) for zoom in zooms}
+
+    assert len(buckets) <= 30
+    assert all(abs(quantize_zoom(zoom) / zoom - 1.0) < 0.01 for zoom in zooms)
+    assert quantize_zoom(1.0) == 1.0 and quantize_zoom(0.5) == 0.5
+
+
+def test_downscale_starts_from_the_smallest_level_that_is_large_enough():
+    image = pygame.Surface((400, 240), pygame.SRCALPHA)
+    image.fill((10, 200, 30, 255))
+
+    scaled = scale_from_mipmap(image, (90, 50))
+
+    assert scaled.get_size() == (90, 50)
+    assert list(zoom_mipmap._mipmap_cache) == [(image, 1), (image, 2)]
+    assert get_mipmap_level(image, 2).get_size() == (100, 60)
+    assert scale_from_mipmap(image, (90, 50)) is scaled
+
+
+def _character_state(zoom, anim):
+    torso = pygame.Surface((60, VIRTUAL_HEIGHT), pygame.SRCALPHA)
+    torso.fill((200, 120, 90, 255))
+    eye = pygame.Surface((60, VIRTUAL_HEIGHT), pygame.SRCALPHA)
+    eye.fill((20, 40, 200, 255), (20, 300, 20, 10))
+    return {
+        "dialogue_data": [],
+        "current_paragraph": 0,
+        "screen": pygame.Surface((200, VIRTUAL_HEIGHT * 2), pygame.SRCALPHA),
+        "image_manager": _Images({("torso", "T00"): torso, ("eye", "E01"): eye}),
+        "active_characters": ["momoko"],
+        "character_pos": {"momoko": [0, 0]},
+        "character_zoom": {"momoko": zoom},
+        "character_torso": {"momoko": "T00"},
+        "character_expressions": {"momoko": {"eye": "E01"}},
+        "character_blink_state": {},
+        "character_part_fades": {},
+        "character_anim": {"momoko": anim} if anim else {},
+        "show_face_parts": True,
+    }
+
+
+def test_character_zoom_tween_does_not_flush_the_scaled_cache():
+    anim = {"start_zoom": 1.0, "target_zoom": 1.5}
+    state = _character_state(1.0, anim)
+    for _ in range(2):
+        for zoom in _tween(1.0, 1.5):
+            state["character_zoom"]["momoko"] = zoom
+            draw_characters(state)
+
+    assert len(character_manager._scaled_image_cache) == 0
+    # 胴体と目それぞれ、等倍以外の段の数だけ作られる（2回目のトゥイーンは全てヒット）
+    buckets = {quantize_zoom(zoom) for zoom in _tween(1.0, 1.5)} - {1.0}
+    assert len(zoom_mipmap._mipmap_scaled_cache) == 2 * len(buckets)
+
+
+def test_character_move_without_zoom_change_keeps_the_exact_zoom():
+    state = _character_state(1.2, {"start_zoom": 1.2, "target_zoom": 1.2})
+    draw_characters(state)
+
+    assert len(zoom_mipmap._mipmap_scaled_cache) == 0
+    assert {key[1] for key in character_manager._scaled_image_cache} == {1.2}
+
@@ -0,0 +1,221 @@
+"""Bake outlined dialogue glyphs for the script corpus into atlas PNGs.
+
+Scans events/*.ks, data/seed_catalog.json and the menu strings for the
+characters in use and renders each one with the current FONT_EFFECTS
+outline, in the colors it can appear in. The result is written as page
+PNGs plus a JSON index that font_effects.load_baked_glyph_atlas reads
+at startup. Characters missing from the atlas (player names, free-text
+answers) are still rasterized on demand.
+"""
+
+import argparse
+import ast
+import glob
+import json
+import os
+import re
+import string
+import sys
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.config import (
+    CHOICE_HIGHLIGHT_COLOR,
+    CHOICE_NORMAL_COLOR,
+    FONT_NAME_SIZE,
+    FONT_TEXT_SIZE,
+    GLYPH_ATLAS_DIR,
+    SEED_TEXT_COLOR,
+    SEED_TEXT_HOVER_COLOR,
+    TEXT_COLOR,
+    TEXT_COLOR_FEMALE,
+)
+from core.path_utils import get_font_path
+from dialogue.font_effects import (
+    compose_outlined_glyphs,
+    font_effects_json,
+    get_baked_atlas_index_path,
+    get_outline_width,
+    render_effect_layers,
+)
+from dialogue.text_renderer import SERIF_FONT_FILENAME
+
+
+CHOICE_FONT_FILENAME = "MPLUS1p-Medium.ttf"
+BATCH_SIZE = 256
+
+_TAG_RE = re.compile(r"\[[^\]]*\]")
+_SEED_RE = re.compile(r"\[seed\b[^\]]*\](.*?)\[/seed\]")
+_CHOICE_OPTION_RE = re.compile(r'option\d+="([^"]*)"')
+
+
+def _printable(text):
+    return {ch for ch in text if ord(ch) >= 32 and ch not in "\r\n\t"}
+
+
+def _json_strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _json_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _json_strings(item)
+
+
+def collect_corpus_chars(project_root=PROJECT_ROOT):
+    """Return {"body", "seed", "choice"} -> set of characters used in the corpus."""
+    body = _printable(string.printable)
+    seed = set()
+    choice = set()
+
+    for path in sorted(glob.glob(os.path.join(project_root, "events", "*.ks"))):
+        with open(path, "r", encoding="utf-8-sig") as f:
+            for line in f:
+                if line.lstrip().startswith(";"):
+                    continue
+                body |= _printable(_TAG_RE.sub("", line))
+                for span in _SEED_RE.findall(line):
+                    seed |= _printable(_TAG_RE.sub("", span))
+                for option in _CHOICE_OPTION_RE.findall(line):
+                    choice |= _printable(option)
+
+    catalog_path = os.path.join(project_root, "data", "seed_catalog.json")
+    if os.path.exists(catalog_path):
+        with open(catalog_path, "r", encoding="utf-8") as f:
+            for text in _json_strings(json.load(f)):
+                body |= _printable(text)
+
+    for path in sorted(glob.glob(os.path.join(project_root, "menu", "*.py"))):
+        with open(path, "r", encoding="utf-8-sig") as f:
+            tree = ast.parse(f.read(), filename=path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                body |= _printable(node.value)
+
+    return {"body": body, "seed": seed, "choice": choice}
+
+
+def glyph_requests(corpus, targets):
+    """Return sorted (char, color) pairs for the color groups in targets."""
+    requests = set()
+    for group, colors in targets:
+        for color in colors:
+            requests.update((ch, tuple(color)) for ch in corpus.get(group, ()))
+    return sorted(requests)
+
+
+def _pack(glyphs, page_size):
+    """Shelf-pack (char, color, surface) into square pages; return placements and page count."""
+    placements = []
+    page_count = 0
+    x = y = shelf_h = 0
+    for char, color, surface in sorted(glyphs, key=lambda glyph: -glyph[2].get_height()):
+        w, h = surface.get_size()
+        if x + w > page_size:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        if page_count == 0 or y + h > page_size:
+            page_count += 1
+            x = y = shelf_h = 0
+        placements.append((char, color, surface, page_count - 1, x, y))
+        x += w
+        shelf_h = max(shelf_h, h)
+    return placements, page_count
+
+
+def bake_atlas(font_path, font_filename, size, requests, out_dir, page_size=1024):
+    """Render requests with font_path at size and write the atlas; return the index path."""
+    font = pygame.font.Font(font_path, size)
+    glyphs = []
+    for start in range(0, len(requests), BATCH_SIZE):
+        batch = requests[start:start + BATCH_SIZE]
+        surfaces = compose_outlined_glyphs(
+            [render_effect_layers(font, char, color) for char, color in batch]
+        )
+        glyphs.extend((char, color, surface) for (char, color), surface in zip(batch, surfaces))
+
+    placements, page_count = _pack(glyphs, page_size)
+    pages = [pygame.Surface((page_size, page_size), pygame.SRCALPHA) for _ in range(page_count)]
+    index_path = get_baked_atlas_index_path(font_filename, size, out_dir)
+    stem = os.path.splitext(os.path.basename(index_path))[0]
+    page_names = [f"{stem}_{number}.png" for number in range(page_count)]
+    entries = []
+    for char, color, surface, page, x, y in placements:
+        # 重ならない領域への MAX 合成なので、透明ページにそのままコピーされる
+        pages[page].blit(surface, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        entries.append([char, list(color), page, x, y, surface.get_width(), surface.get_height()])
+
+    os.makedirs(out_dir, exist_ok=True)
+    for page, name in zip(pages, page_names):
+        pygame.image.save(page, os.path.join(out_dir, name))
+    index = {
+        "version": 1,
+        "font": font_filename,
+        "size": size,
+        "effects": font_effects_json(),
+        "outline_width": get_outline_width(),
+        "pages": page_names,
+        "glyphs": entries,
+    }
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False)
+    return index_path
+
+
+def default_targets():
+    """(font filename, size, [(group, colors), ...]) for each runtime font configuration."""
+    dialogue_groups = [
+        ("body", [TEXT_COLOR, TEXT_COLOR_FEMALE]),
+        ("seed", [SEED_TEXT_COLOR, SEED_TEXT_HOVER_COLOR]),
+    ]
+    choice_groups = [("choice", [CHOICE_NORMAL_COLOR, CHOICE_HIGHLIGHT_COLOR])]
+    targets = {}
+    for filename, size, groups in (
+        (SERIF_FONT_FILENAME, FONT_TEXT_SIZE, dialogue_groups),
+        (SERIF_FONT_FILENAME, FONT_NAME_SIZE, dialogue_groups),
+        (CHOICE_FONT_FILENAME, FONT_TEXT_SIZE, choice_groups),
+    ):
+        merged = targets.setdefault((filename, size), [])
+        for group in groups:
+            if group not in merged:
+                merged.append(group)
+    return [(filename, size, groups) for (filename, size), groups in targets.items()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--out", default=os.path.join(PROJECT_ROOT, GLYPH_ATLAS_DIR), help="Output directory"
+    )
+    parser.add_argument("--page-size", type=int, default=1024, help="Atlas page edge in pixels")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    corpus = collect_corpus_chars()
+    print(
+        f"corpus: {len(corpus['body'])} body / {len(corpus['seed'])} seed / "
+        f"{len(corpus['choice'])} choice characters"
+    )
+    for filename, size, groups in default_targets():
+        font_path = get_font_path(filename)
+        if not os.path.exists(font_path):
+            print(f"skip {filename}: font not found")
+            continue
+        requests = glyph_requests(corpus, groups)
+        index_path = bake_atlas(font_path, filename, size, requests, args.out, args.page_size)
+        print(f"{filename} {size}px: {len(requests)} glyphs -> {index_path}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
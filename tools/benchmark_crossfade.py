@@ -0,0 +1,137 @@
+"""Benchmark the torso crossfade used by chara_shift torso changes.
+
+Replays a full fade between two torso images scaled the way draw_characters
+scales them, once with the previous per-frame surface blend and once with
+the crossfade engine in dialogue.character_manager (NumPy path and blit
+fallback). Reports per-frame time, per-frame allocations and whether every
+frame is pixel identical to the previous implementation.
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.config import SCALE, VIRTUAL_HEIGHT
+from dialogue import character_manager
+
+
+DEFAULT_FROM = os.path.join("images", "01MMK", "MMK_T00_ARM12_CLO00.webp")
+DEFAULT_TO = os.path.join("images", "01MMK", "MMK_T01_ARM09_CLO00.webp")
+
+
+class _Counter:
+    surfaces = 0
+
+
+def _legacy_crossfade(screen, from_image, from_pos, to_image, to_pos, progress):
+    """The previous _blit_crossfade body (premultiplied crops cached, blend buffers per frame)."""
+    sources = []
+    for image, pos, weight in ((from_image, from_pos, 1.0 - progress), (to_image, to_pos, progress)):
+        bounds = character_manager._get_opaque_bounds(image)
+        if bounds.width and bounds.height:
+            premultiplied = character_manager._get_premultiplied_crop(image, bounds)
+            sources.append((premultiplied, bounds.move(pos), weight))
+    blend_rect = sources[0][1].unionall([rect for _, rect, _ in sources[1:]]).clip(screen.get_clip())
+    blended = pygame.Surface(blend_rect.size, pygame.SRCALPHA)
+    _Counter.surfaces += 1
+    for premultiplied, rect, weight in sources:
+        visible = rect.clip(blend_rect)
+        weighted = premultiplied.subsurface(visible.move(-rect.x, -rect.y)).copy()
+        _Counter.surfaces += 1
+        channel_weight = round(255 * weight)
+        weighted.fill((channel_weight,) * 4, special_flags=pygame.BLEND_RGBA_MULT)
+        blended.blit(
+            weighted,
+            (visible.x - blend_rect.x, visible.y - blend_rect.y),
+            special_flags=pygame.BLEND_RGBA_ADD,
+        )
+    screen.blit(blended, blend_rect.topleft, special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+def _load_torso(path):
+    image = pygame.image.load(os.path.join(PROJECT_ROOT, path)).convert_alpha()
+    return character_manager.get_scaled_image(image, VIRTUAL_HEIGHT / image.get_height() * SCALE)
+
+
+def _run(blend, screen, background, from_image, to_image, frames):
+    """Return (ms/frame, traced bytes/frame, frames as bytes)."""
+    outputs = []
+    total = 0.0
+    tracemalloc.start()
+    traced = 0
+    for frame in range(1, frames):
+        progress = frame / frames
+        screen.blit(background, (0, 0))
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        blend(screen, from_image, (0, 0), to_image, (0, 0), progress)
+        total += time.perf_counter() - start
+        traced += tracemalloc.get_traced_memory()[1] - before
+        outputs.append(pygame.image.tobytes(screen, "RGBA"))
+    tracemalloc.stop()
+    count = frames - 1
+    return total / count * 1000.0, traced / count, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--from-image", default=DEFAULT_FROM, help="Torso before the change")
+    parser.add_argument("--to-image", default=DEFAULT_TO, help="Torso after the change")
+    parser.add_argument("--frames", type=int, default=30, help="Frames in the fade")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    from_image = _load_torso(args.from_image)
+    to_image = _load_torso(args.to_image)
+    size = (max(from_image.get_width(), to_image.get_width()), max(from_image.get_height(), to_image.get_height()))
+    background = pygame.Surface(size, pygame.SRCALPHA)
+    background.fill((90, 130, 170, 255))
+    screen = pygame.Surface(size, pygame.SRCALPHA)
+
+    legacy_ms, legacy_bytes, expected = _run(
+        _legacy_crossfade, screen, background, from_image, to_image, args.frames
+    )
+    legacy_surfaces = _Counter.surfaces / (args.frames - 1)
+    print(f"torso: {from_image.get_size()} -> {to_image.get_size()}  frames: {args.frames - 1}")
+    print(f"per-frame surfaces: {legacy_ms:8.3f} ms / frame  {legacy_surfaces:.1f} surfaces / frame")
+
+    identical = True
+    for label, numpy_enabled in (("numpy engine", True), ("blit fallback", False)):
+        if numpy_enabled and not character_manager.NUMPY_AVAILABLE:
+            continue
+        character_manager.NUMPY_AVAILABLE = numpy_enabled
+        character_manager._crossfade_buffers.clear()
+        # 1 フレーム目でフェード用バッファを作る。2 フレーム目以降の確保を数える
+        character_manager._blit_crossfade(screen, from_image, (0, 0), to_image, (0, 0), 0.5)
+        builds = len(character_manager._crossfade_buffers)
+        engine_ms, engine_bytes, actual = _run(
+            character_manager._blit_crossfade, screen, background, from_image, to_image, args.frames
+        )
+        rebuilt = len(character_manager._crossfade_buffers) - builds
+        same = actual == expected
+        identical = identical and same
+        print(
+            f"{label + ':':19s}{engine_ms:8.3f} ms / frame  (x{legacy_ms / engine_ms:.2f})  "
+            f"buffer builds after warm-up: {rebuilt}  traced: {engine_bytes:.0f} B / frame  "
+            f"pixel identical: {same}"
+        )
+    print(f"legacy traced: {legacy_bytes:.0f} B / frame (SDL surface memory is not traced)")
+    pygame.quit()
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
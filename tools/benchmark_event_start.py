@@ -0,0 +1,82 @@
+"""Benchmark dialogue event-start latency with fresh and shared runtime services.
+
+Builds a DialogueSubsystem for each event in turn, the way GameApplication
+does when the map launches an event: once with a brand-new set of managers
+per event (image caches cold, fonts reloaded) and once borrowing a single
+DialogueServices container across events. Each mode starts from its own
+empty decoded-image disk cache so neither benefits from the other's decodes.
+Reports the time each event took to construct and the image cache hit ratio.
+The backlog is kept in memory so the player's saved backlog is not touched.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from PyQt5.QtWidgets import QApplication
+
+from dialogue import runtime_services
+from dialogue.dialogue_subsystem import DialogueSubsystem
+from dialogue.runtime_services import DialogueServices
+
+
+DEFAULT_EVENTS = ["E001", "E002", "E003", "E004", "E005", "E001", "E002"]
+
+
+def _run(screens, event_files, share_services):
+    """Return (per-event ms, last game_state)."""
+    shared = DialogueServices(save_backlog=False)
+    timings = []
+    game_state = None
+    for event_file in event_files:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            services = shared if share_services else DialogueServices(save_backlog=False)
+            dialogue = DialogueSubsystem(*screens, event_file, services)
+        timings.append((time.perf_counter() - start) * 1000.0)
+        game_state = dialogue.game_state
+    return timings, game_state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("events", nargs="*", default=DEFAULT_EVENTS, help="Event ids in play order")
+    args = parser.parse_args()
+
+    os.chdir(PROJECT_ROOT)
+    qt_app = QApplication.instance() or QApplication([])  # noqa: F841 (QFont に必要)
+    pygame.init()
+    screens = (pygame.display.set_mode((1, 1)), pygame.Surface((1440, 1080)))
+    event_files = [os.path.join("events", f"{event_id}.ks") for event_id in args.events]
+
+    # 絶対パスなので get_user_cache_dir() との join はそのまま一時ディレクトリを指す
+    for label, share_services in (("fresh per event", False), ("shared services", True)):
+        with tempfile.TemporaryDirectory() as decode_cache_dir:
+            runtime_services.DECODED_IMAGE_CACHE_DIR = decode_cache_dir
+            timings, game_state = _run(screens, event_files, share_services)
+            game_state["image_manager"].cleanup()
+        stats = game_state["image_manager"].get_cache_stats()
+        print(
+            f"{label + ':':17s}" + " ".join(f"{ms:7.0f}" for ms in timings)
+            + f"   after the first: {sum(timings[1:]) / max(len(timings) - 1, 1):7.1f} ms / event"
+            + f"   cache hit ratio {stats['cache_hit_ratio']:.2f}"
+        )
+    print("events:          " + " ".join(f"{event_id:>7s}" for event_id in args.events))
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+"""Benchmark the dialogue outline paths on a full 20-char x 3-line box.
+
+Compares the legacy per-glyph blit outline with the batched alpha dilation
+used by font_effects, and checks that both produce identical pixels.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.config import FONT_TEXT_SIZE, TEXT_MAX_CHARS_PER_LINE
+from core.path_utils import get_font_path
+from dialogue.font_effects import (
+    _compose_outline_by_blits,
+    compose_outlined_glyphs,
+    get_outline_width,
+    render_effect_layers,
+)
+from dialogue.text_renderer import SERIF_FONT_FILENAME
+
+
+SAMPLE_TEXT = (
+    "放課後の教室には誰もいなくて、窓から差し込む夕日が机を赤く染めていた。"
+    "私は鞄を抱えたまま、彼が戻ってくるのをずっと待っていたんだ。"
+)
+
+
+def _box_layers(font, lines):
+    text = (SAMPLE_TEXT * 2)[: TEXT_MAX_CHARS_PER_LINE * lines]
+    return [render_effect_layers(font, ch, (255, 255, 255)) for ch in text]
+
+
+def _measure(render, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        render()
+    return (time.perf_counter() - start) / repeat * 1000.0
+
+
+def _same_pixels(left, right):
+    return (
+        left.get_size() == right.get_size()
+        and (pygame.surfarray.array3d(left) == pygame.surfarray.array3d(right)).all()
+        and (pygame.surfarray.array_alpha(left) == pygame.surfarray.array_alpha(right)).all()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=3, help="Dialogue box lines")
+    parser.add_argument("--repeat", type=int, default=50, help="Iterations per path")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    font = pygame.font.Font(get_font_path(SERIF_FONT_FILENAME), FONT_TEXT_SIZE)
+    layers = _box_layers(font, args.lines)
+    outline_width = get_outline_width()
+
+    blitted = [_compose_outline_by_blits(*pair, outline_width) for pair in layers]
+    dilated = compose_outlined_glyphs(layers)
+    identical = all(_same_pixels(a, b) for a, b in zip(blitted, dilated))
+
+    blit_ms = _measure(
+        lambda: [_compose_outline_by_blits(*pair, outline_width) for pair in layers],
+        args.repeat,
+    )
+    dilate_ms = _measure(lambda: compose_outlined_glyphs(layers), args.repeat)
+
+    print(f"glyphs: {len(layers)}  outline width: {outline_width}")
+    print(f"blit outline:    {blit_ms:8.3f} ms / box")
+    print(f"dilated outline: {dilate_ms:8.3f} ms / box  (x{blit_ms / dilate_ms:.2f})")
+    print(f"pixel identical: {identical}")
+    pygame.quit()
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
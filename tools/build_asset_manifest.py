@@ -0,0 +1,54 @@
+"""Build the image asset manifest that ImageManager.scan_image_paths reads.
+
+Walks images/ once, classifies every file the way ImageManager does and
+records its category, key, relative path, header dimensions and mtime,
+plus the mtime of every directory. At startup only those directories are
+stat'ed; a directory whose mtime changed is rescanned and the manifest
+rewritten. Rerun this after overwriting images in place, which does not
+touch the directory mtime.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from core.config import ASSET_MANIFEST_PATH
+from core.services.asset_manifest import build_asset_manifest, load_asset_manifest, save_asset_manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", default=os.path.join(PROJECT_ROOT, "images"), help="Image root")
+    parser.add_argument(
+        "--out", default=os.path.join(PROJECT_ROOT, ASSET_MANIFEST_PATH), help="Manifest path"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest = build_asset_manifest(args.images)
+    build_ms = (time.perf_counter() - start) * 1000.0
+    save_asset_manifest(manifest, args.out)
+
+    start = time.perf_counter()
+    load_asset_manifest(args.images, args.out)
+    load_ms = (time.perf_counter() - start) * 1000.0
+
+    categories = Counter(entry[0] for entry in manifest["assets"])
+    unsized = [entry[2] for entry in manifest["assets"] if not entry[3] or not entry[4]]
+    print(f"{len(manifest['assets'])} assets in {len(manifest['dirs'])} directories -> {args.out}")
+    print("  " + "  ".join(f"{name}: {count}" for name, count in sorted(categories.items())))
+    print(f"full scan: {build_ms:.1f} ms  startup load: {load_ms:.1f} ms")
+    for path in unsized:
+        print(f"  no size in header: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
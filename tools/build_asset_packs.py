@@ -0,0 +1,77 @@
+"""Build the single-file asset packs that ImageManager, SEManager and BGMManager read.
+
+Writes one .mkpak per entry of ASSET_PACKS (backgrounds, characters, UI,
+sound effects, BGM) into ASSET_PACK_DIR. Each pack is a header, a JSON
+index of project-relative path -> (offset, length, format, width, height,
+mtime) and the files' bytes, which the game maps once and slices without
+opening the loose files. A pack is ignored when a source directory has
+changed since it was built, and files missing from the packs are still read
+loose, so development with event_editor.py works without rebuilding. Rerun
+this after overwriting assets in place, which does not touch the directory
+mtime. Pass --clean to delete the packs and go back to loose files only.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from core.config import ASSET_PACK_DIR, ASSET_PACKS
+from core.services.asset_pack import PACK_EXTENSION, AssetPacks, build_asset_pack
+
+
+def _read_all(packs, names):
+    """Return ms to read every file through packs (or loose files when packs is None)."""
+    start = time.perf_counter()
+    for name in names:
+        path = os.path.join(PROJECT_ROOT, name)
+        if packs is None:
+            with open(path, "rb") as f:
+                f.read()
+        else:
+            bytes(packs.read(path))
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--out", default=os.path.join(PROJECT_ROOT, ASSET_PACK_DIR), help="Pack directory"
+    )
+    parser.add_argument("--clean", action="store_true", help="Delete the packs instead of building them")
+    args = parser.parse_args()
+
+    if args.clean:
+        for name in sorted(os.listdir(args.out)) if os.path.isdir(args.out) else []:
+            if name.endswith(PACK_EXTENSION):
+                os.remove(os.path.join(args.out, name))
+                print(f"removed {name}")
+        return 0
+
+    for pack_name, source_dirs in ASSET_PACKS.items():
+        pack_path = os.path.join(args.out, pack_name + PACK_EXTENSION)
+        start = time.perf_counter()
+        count = build_asset_pack(pack_path, PROJECT_ROOT, source_dirs)
+        build_ms = (time.perf_counter() - start) * 1000.0
+        size_mib = os.path.getsize(pack_path) / (1024 * 1024)
+        print(f"{pack_name:12s} {count:5d} files {size_mib:8.1f} MiB  {build_ms:7.0f} ms -> {pack_path}")
+
+    start = time.perf_counter()
+    packs = AssetPacks(args.out, PROJECT_ROOT)
+    mount_ms = (time.perf_counter() - start) * 1000.0
+    names = [name for pack in packs.packs for name in pack.entries]
+    loose_ms = _read_all(None, names)
+    packed_ms = _read_all(packs, names)
+    print(f"mount: {mount_ms:.1f} ms for {len(packs.packs)} packs")
+    print(f"read all {len(names)} files: loose {loose_ms:.1f} ms  packed {packed_ms:.1f} ms (warm OS cache)")
+    packs.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -40,6 +40,13 @@ from core.services.se_manager import SEManager
 from core.services.image_manager import ImageManager
 from core.path_utils import get_font_path
 
+# Step previews jump back and forth between steps, so keep twice the in-game
+# budget per category (the old entry-count cache held 200 images here vs 50).
+PREVIEW_IMAGE_CACHE_BUDGETS = {
+    category: budget * 2 for category, budget in IMAGE_CACHE_BUDGETS.items()
+}
+
+
 def create_step_preview_runtime():
     """Create the expensive, reusable part of step preview rendering."""
     os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
@@ -59,7 +66,7 @@ def create_step_preview_runtime():
     cfg.SCALE = 1.0
 
     virtual_screen = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
-    image_manager = ImageManager(DEBUG, cache_size=200)
+    image_manager = ImageManager(DEBUG, cache_budgets=PREVIEW_IMAGE_CACHE_BUDGETS)
     image_manager.scan_image_paths(VIRTUAL_WIDTH, VIRTUAL_HEIGHT)
     images = image_manager.load_essential_images(VIRTUAL_WIDTH, VIRTUAL_HEIGHT)
     return {